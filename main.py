@@ -1,7 +1,8 @@
 import sys
-from src.game import Game
+from src.startup import startup_trace
+
+with startup_trace.stage("import game modules"):
+    from src.cli import main
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
-    sys.exit()
+    sys.exit(main())
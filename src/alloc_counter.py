@@ -0,0 +1,126 @@
+import sys
+import threading
+import pygame
+from src.log import log
+
+# Surface methods and functions that return a new surface
+SURFACE_METHODS = {(pygame.Surface, 'copy'), (pygame.Surface, 'convert'), (pygame.Surface, 'convert_alpha'),
+                   (pygame.Surface, 'subsurface'), (pygame.font.Font, 'render')}
+SURFACE_FUNCTIONS = [pygame.transform.scale, pygame.transform.smoothscale, pygame.transform.scale_by,
+                     pygame.transform.smoothscale_by, pygame.transform.rotate, pygame.transform.rotozoom,
+                     pygame.transform.flip, pygame.transform.chop, pygame.transform.laplacian,
+                     pygame.transform.grayscale, pygame.image.load, pygame.image.frombuffer,
+                     pygame.image.fromstring, pygame.image.frombytes]
+
+class CountedSurfaceType(type):
+    """Stands in for pygame.Surface while counting: builds real surfaces, counting each construction.
+
+    Instance and subclass checks and attribute lookups go to the real class, so
+    isinstance(surface, pygame.Surface) keeps working.
+    """
+    def __call__(cls, *args, **kwargs):
+        alloc_counter.count(sys._getframe(1))
+        return cls.surface_class(*args, **kwargs)
+
+    def __instancecheck__(cls, instance):
+        return isinstance(instance, cls.surface_class)
+
+    def __subclasscheck__(cls, subclass):
+        return issubclass(subclass, cls.surface_class)
+
+    def __getattr__(cls, name):
+        return getattr(cls.surface_class, name)
+
+class AllocationCounter:
+    """Debug counter of surfaces created per frame.
+
+    Every surface creation is counted as it happens, so surfaces that are
+    created and dropped within a frame (temporary copies, overlays) count too:
+    pygame.Surface(...) is swapped for a counting stand-in and a profile hook
+    (on the main thread and threads started afterwards, such as the simulation
+    thread) counts calls to the methods and functions that return new surfaces
+    (copy, convert, Font.render, pygame.transform, pygame.image). Each creation
+    is attributed to the source line that asked for it. Profiling every call is
+    slow, so this is for debugging only; the game starts it for each game's
+    gameplay frames and stops it when the game ends.
+
+    This counts calls rather than diffing tracemalloc snapshots: a snapshot only
+    holds the blocks still alive, so a surface created and dropped within a
+    frame leaves no trace in it, and the pixels are allocated by SDL outside the
+    Python allocator, so traced blocks can't be told apart as surfaces anyway.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.frame_surfaces = 0  # Surfaces created since begin_frame()
+        self.frames = 0
+        self.frames_with_new_surfaces = 0
+        self.new_surfaces = 0
+        self.most_in_a_frame = 0
+        self.sites = {}  # "file:line" -> surfaces created there
+        self.function_ids = {id(function) for function in SURFACE_FUNCTIONS}
+        self.surface_class = pygame.Surface
+
+    def start(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        pygame.Surface = CountedSurfaceType('Surface', (), {'surface_class': self.surface_class})
+        sys.setprofile(self.profile)
+        threading.setprofile(self.profile)
+
+    def stop(self):
+        if self.enabled:
+            self.enabled = False
+            sys.setprofile(None)
+            threading.setprofile(None)
+            pygame.Surface = self.surface_class
+
+    def profile(self, frame, event, function):
+        if event != 'c_call':
+            return
+        if id(function) in self.function_ids:
+            self.count(frame)
+        else:
+            owner = getattr(function, '__self__', None)
+            if (type(owner), function.__name__) in SURFACE_METHODS:
+                self.count(frame)
+
+    def count(self, frame):
+        """Count one surface created by the code running in frame"""
+        site = f"{frame.f_code.co_filename}:{frame.f_lineno}"
+        with self.lock:
+            self.frame_surfaces += 1
+            self.sites[site] = self.sites.get(site, 0) + 1
+
+    def begin_frame(self):
+        if self.enabled:
+            with self.lock:
+                self.frame_surfaces = 0
+
+    def end_frame(self):
+        """Return the number of surfaces created since begin_frame() and add it to the totals"""
+        if not self.enabled:
+            return 0
+        with self.lock:
+            new_this_frame = self.frame_surfaces
+
+        self.frames += 1
+        if new_this_frame:
+            self.frames_with_new_surfaces += 1
+            self.new_surfaces += new_this_frame
+            self.most_in_a_frame = max(self.most_in_a_frame, new_this_frame)
+            log.debug("Surfaces allocated this frame", interval=1.0, count=new_this_frame)
+        return new_this_frame
+
+    def report(self):
+        if self.frames == 0:
+            return
+        log.info("Surface allocations", frames=self.frames, frames_with_new_surfaces=self.frames_with_new_surfaces,
+                 new_surfaces=self.new_surfaces, per_frame=f"{self.new_surfaces / self.frames:.2f}",
+                 most_in_a_frame=self.most_in_a_frame)
+        for site, count in sorted(self.sites.items(), key=lambda item: -item[1])[:10]:
+            log.info("Surface allocation site", site=site, surfaces=count)
+
+# Shared counter (started by the game when DEBUG_ALLOCATIONS is set)
+alloc_counter = AllocationCounter()
@@ -0,0 +1,144 @@
+import os
+import json
+import zlib
+import pygame
+from src.constants import *
+from src.log import log
+from src.sprite_cache import sprite_cache
+from src.trace import tracer
+
+# Blit path chosen for every image loaded through load_image: (path, size) -> kind
+loaded_images = {}
+
+# Sprite sheet index (image name -> sheet and rect), read on first use
+atlas_index = None
+atlas_sheets = {}
+source_digests = {}  # Source path -> CRC32 of its bytes, read once per run
+
+def load_image(path, size=None):
+    """Load an image, scale it and convert it to the display format.
+    
+    Images packed into the sprite atlas are cut out of their sheet; anything else is
+    decoded from its own file (or the sprite cache). Raises pygame.error /
+    FileNotFoundError like pygame.image.load, so callers keep their own fallbacks.
+    Requires the display mode to be set.
+    """
+    with tracer.span('load_image', 'assets', {'path': path}):
+        image = atlas_image(image_name(path), size) if USE_ATLAS else None
+        if image is None:
+            image = decode_image(path, size)
+        image, kind = optimize_surface(image)
+    loaded_images[(path, tuple(size) if size else None)] = kind
+    return image
+
+def decode_image(path, size=None):
+    """Decoded pixels of an image file scaled to size, from the sprite cache when unchanged"""
+    image = sprite_cache.get(path, size) if SPRITE_CACHE else None
+    if image is None:
+        image = pygame.image.load(path)
+        if size is not None and image.get_size() != tuple(size):
+            image = pygame.transform.scale(image, size)
+        if SPRITE_CACHE:
+            sprite_cache.put(path, size, image)
+    return image
+
+def image_name(path):
+    """Atlas name of an image file: its path under ATLAS_IMAGE_ROOT without extension"""
+    return os.path.splitext(os.path.relpath(path, ATLAS_IMAGE_ROOT))[0].replace(os.sep, '/')
+
+def load_atlas_index():
+    """Read the sprite atlas index (a missing or broken index means no atlas)"""
+    global atlas_index
+    try:
+        with open(ATLAS_INDEX_PATH) as index_file:
+            atlas_index = json.load(index_file)['images']
+    except FileNotFoundError:
+        atlas_index = {}
+    except Exception as e:
+        log.warning("Ignoring unreadable sprite atlas", path=ATLAS_INDEX_PATH, error=e)
+        atlas_index = {}
+
+def source_digest(path):
+    """CRC32 of an image file's bytes (cached), so the atlas can tell edited art from a fresh checkout"""
+    digest = source_digests.get(path)
+    if digest is None:
+        with open(path, 'rb') as source:
+            digest = source_digests[path] = zlib.crc32(source.read())
+    return digest
+
+def atlas_image(name, size=None):
+    """Return a named image as a subsurface of its sprite sheet, or None if it isn't packed at size.
+    
+    Subsurfaces can't be RLE-accelerated, so load_image converts the result into
+    its own surface; the atlas saves the per-file decodes. An entry whose source
+    file's contents differ from the ones packed (edited art not repacked yet) is
+    stale: None, so the image is decoded from its file instead. Contents rather
+    than mtimes, which git does not keep.
+    """
+    if atlas_index is None:
+        load_atlas_index()
+    entry = atlas_index.get(name)
+    if entry is None or (size is not None and tuple(size) != tuple(entry['rect'][2:])):
+        return None
+    try:
+        fresh = entry.get('crc32') == source_digest(entry['source'])
+    except OSError:
+        fresh = False
+    if not fresh:
+        log.debug("Stale sprite atlas entry, decoding the source", name=name, source=entry['source'])
+        return None
+    sheet = atlas_sheets.get(entry['sheet'])
+    if sheet is None:
+        try:
+            sheet = decode_image(os.path.join(os.path.dirname(ATLAS_INDEX_PATH), entry['sheet']))
+        except Exception as e:
+            log.warning("Sprite sheet unavailable", sheet=entry['sheet'], error=e)
+            return None
+        atlas_sheets[entry['sheet']] = sheet
+    return sheet.subsurface(entry['rect'])
+
+def classify_alpha(surface):
+    """Return 'opaque', 'colorkey' (alpha only 0 or 255) or 'alpha' for a surface"""
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return 'opaque'
+    width, height = surface.get_size()
+    visible = pygame.mask.from_surface(surface, 0).count()  # alpha > 0
+    solid = pygame.mask.from_surface(surface, 254).count()  # alpha == 255
+    if solid == width * height:
+        return 'opaque'
+    if visible == solid:
+        return 'colorkey'
+    return 'alpha'
+
+def optimize_surface(surface):
+    """Convert a surface to the fastest display-format blit path; returns (surface, kind).
+    
+    Opaque images become plain display-format surfaces. Images whose alpha is only
+    ever 0 or 255 become colorkeyed RLE surfaces (cheaper to blit than per-pixel
+    alpha), unless a visible pixel happens to use the key color. Everything else
+    becomes per-pixel alpha, RLE-accelerated when enough of it is transparent.
+    """
+    kind = classify_alpha(surface)
+    width, height = surface.get_size()
+    
+    if kind == 'opaque':
+        return surface.convert(), kind
+    
+    if kind == 'colorkey':
+        keyed = pygame.Surface((width, height)).convert()
+        keyed.fill(COLORKEY)
+        keyed.blit(surface, (0, 0))
+        # The key must only match the transparent pixels
+        key_pixels = pygame.mask.from_threshold(keyed, COLORKEY, (1, 1, 1, 255)).count()
+        transparent = width * height - pygame.mask.from_surface(surface, 0).count()
+        if key_pixels == transparent:
+            keyed.set_colorkey(COLORKEY, pygame.RLEACCEL)
+            return keyed, kind
+        kind = 'alpha'
+    
+    converted = surface.convert_alpha()
+    transparent = width * height - pygame.mask.from_surface(surface, 0).count()
+    if transparent >= width * height * RLE_MIN_TRANSPARENT:
+        converted.set_alpha(255, pygame.RLEACCEL)
+        kind = 'alpha+rle'
+    return converted, kind
@@ -0,0 +1,212 @@
+import time
+import pygame
+from src.constants import *
+from src.log import log
+from src.sprites import LambdaEnemy, BossLaser
+from src.diagnostics import entity_counts, resident_bytes
+
+class PilotKeys:
+    """Keyboard state pressed by the pilot (indexed like pygame.key.get_pressed())"""
+    __slots__ = ('pressed',)
+
+    def __init__(self, pressed):
+        self.pressed = pressed
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+def percentile(samples, percent):
+    """percent-th percentile of a sorted list"""
+    return samples[min(len(samples) - 1, int(len(samples) * percent / 100))]
+
+def sweep_column(x, half_width, velocity, ticks):
+    """(left, right) covered by a beam at x moving velocity pixels per tick for ticks (bouncing off the edges)"""
+    end = x + velocity * ticks
+    if end < 0:
+        low, high = 0, max(x, -end)
+    elif end > SCREEN_WIDTH:
+        low, high = min(x, 2 * SCREEN_WIDTH - end), SCREEN_WIDTH
+    else:
+        low, high = min(x, end), max(x, end)
+    return low - half_width, high + half_width
+
+class Autopilot:
+    """Scripted pilot for unattended soak tests (python -m tools.soak).
+
+    Every frame the pilot looks at the game state and picks where the ship
+    should be: of the positions within AUTOPILOT_RANGE pixels, the one least
+    in the path of falling lasers and asteroids and out of the columns of active
+    or charging Lambda and boss beams, then the one closest to a falling power-up
+    or under the nearest enemy. Space is always held. Wait screens and the menu
+    are answered with a posted ENTER key press, so a game over starts the next
+    game, until the soak time is up.
+
+    Whenever a level ends the pilot logs the level's frame time percentiles,
+    resident memory and its growth since the first time that level ended, and
+    the entity objects alive in the registry and detached (see src/diagnostics.py).
+    """
+    def __init__(self, seconds=None):
+        self.stop_time = None if seconds is None else time.perf_counter() + seconds
+        self.frame_times = []  # Milliseconds, current level
+        self.baselines = {}  # Level -> resident bytes the first time it ended
+        self.levels = {}  # Level -> [times ended, worst p99 ms]
+        self.games = 0
+
+    def expired(self):
+        return self.stop_time is not None and time.perf_counter() >= self.stop_time
+
+    def press(self, key):
+        """Post a key press for a screen that waits for input (QUIT instead once the soak time is up)"""
+        if self.expired():
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        else:
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode='', scancode=0))
+
+    def keys(self, game):
+        """The keys to hold this frame"""
+        if self.expired():
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        player = game.player.rect
+        step = self.step(game)
+        current = player.centerx
+        low = max(player.width // 2, current - AUTOPILOT_RANGE)
+        high = min(SCREEN_WIDTH - player.width // 2, current + AUTOPILOT_RANGE)
+
+        target = self.target_x(game, player)
+        columns = self.beam_columns(game)
+        paths = self.projectile_paths(game, player)
+        best_x, best_score = current, None
+        for x in sorted(set(range(low, high + 1, AUTOPILOT_RESOLUTION)) | {current}):
+            score = self.danger(player, step, x, columns, paths) * SCREEN_WIDTH + abs(x - target)
+            if best_score is None or score < best_score or (score == best_score and abs(x - current) < abs(best_x - current)):
+                best_x, best_score = x, score
+
+        pressed = {pygame.K_SPACE}
+        if best_x < current - step // 2:
+            pressed.add(pygame.K_LEFT)
+        elif best_x > current + step // 2:
+            pressed.add(pygame.K_RIGHT)
+        return PilotKeys(pressed)
+
+    def step(self, game):
+        """Pixels the ship moves per tick (half speed while invincible after a hit)"""
+        return game.player.speed // 2 if game.player.invincible else game.player.speed
+
+    def target_x(self, game, player):
+        """Where the pilot wants to be: under a falling power-up, else under the nearest enemy"""
+        power_ups = [power_up.rect for power_up in game.power_ups.entities if power_up.rect.bottom < player.top]
+        if power_ups:
+            return min(power_ups, key=lambda rect: abs(rect.centerx - player.centerx)).centerx
+        enemies = game.entities.enemies()
+        if enemies:
+            return max(enemies, key=lambda enemy: (enemy.rect.bottom, -abs(enemy.rect.centerx - player.centerx))).rect.centerx
+        return SCREEN_WIDTH // 2
+
+    def beam_columns(self, game):
+        """(left, right) x-intervals that beams cover now or will before they end.
+
+        Beams follow the Lambda or boss that fired them, so each column covers the
+        path of its shooter (at its current speed, bouncing off the screen edges)
+        until the beam ends. A boss laser is created when its warning starts and
+        strikes there for one tick before it follows the boss.
+        """
+        columns = []
+        for beam in game.laser_beams.entities:
+            shooter = beam.lambda_enemy
+            velocity = 0 if shooter is None else shooter.speed_x * LambdaEnemy.group_direction
+            columns.append(sweep_column(beam.rect.centerx, beam.width / 2, velocity, beam.duration - beam.timer))
+        for beam in game.boss_lasers.entities:
+            velocity = 0 if beam.boss is None else beam.boss.speed_x * beam.boss.boss_direction
+            columns.append(sweep_column(beam.rect.centerx, beam.width / 2, velocity, beam.duration - beam.timer))
+        for lambda_enemy in game.entities['lambda'].entities:
+            if lambda_enemy.charging:
+                ticks = lambda_enemy.charge_duration - lambda_enemy.charge_timer + AUTOPILOT_BEAM_TICKS
+                columns.append(sweep_column(lambda_enemy.rect.centerx, AUTOPILOT_BEAM_MARGIN,
+                                            lambda_enemy.speed_x * LambdaEnemy.group_direction, ticks))
+        boss = game.boss
+        beam = None if boss is None else boss.next_ability  # Read once: the boss clears it when the laser fires
+        if isinstance(beam, BossLaser) and boss.alive() and boss.ability_warning:
+            ticks = 60 - boss.ability_warning_timer + BOSS_LASER_DURATION
+            left, right = sweep_column(boss.rect.centerx, beam.width / 2, boss.speed_x * boss.boss_direction, ticks)
+            columns.append((min(left, beam.rect.left), max(right, beam.rect.right)))
+        return columns
+
+    def projectile_paths(self, game, player):
+        """(enter, leave, x, drift, half width) of the falling lasers and asteroids about to reach the ship's rows.
+
+        A projectile overlaps the ship's rows from tick enter until tick leave,
+        at x + drift * ticks.
+        """
+        paths = []
+        for projectiles in (game.enemy_lasers, game.asteroids):
+            for projectile in projectiles.entities:
+                rect = projectile.rect
+                speed = projectile.speed
+                if speed <= 0 or rect.top > player.bottom:
+                    continue
+                enter = max(0.0, (player.top - rect.bottom) / speed)
+                if enter > AUTOPILOT_HORIZON:
+                    continue
+                if projectiles is game.enemy_lasers:
+                    drift = projectile.speed_x
+                else:
+                    drift = round(projectile.drift)  # The rect rounds its x every tick, so a drift under 0.5 never moves it
+                paths.append((enter, (player.bottom - rect.top) / speed, rect.centerx, drift, rect.width / 2))
+        return paths
+
+    def danger(self, player, step, x, columns, paths):
+        """How much is headed for the ship if it moves to x (beams count most, nearer projectiles more)"""
+        half_width = player.width // 2 + AUTOPILOT_MARGIN
+        left, right = x - half_width, x + half_width
+        sweep_left = min(x, player.centerx) - half_width
+        sweep_right = max(x, player.centerx) + half_width
+        danger = 0.0
+        for column_left, column_right in columns:
+            if right > column_left and left < column_right:
+                danger += 10.0  # Ends up under the beam
+            elif sweep_right > column_left and sweep_left < column_right:
+                danger += 5.0  # Crosses it on the way
+
+        # Where the ship (moving at full speed toward x, then staying) and each projectile
+        # are when the projectile enters, crosses and leaves the ship's rows
+        distance = x - player.centerx
+        for enter, leave, projectile_x, drift, projectile_half_width in paths:
+            for ticks in (enter, (enter + leave) / 2, leave):
+                reach = step * ticks
+                ship_x = player.centerx + max(-reach, min(reach, distance))
+                if abs(projectile_x + drift * ticks - ship_x) < half_width + projectile_half_width:
+                    danger += 2.0 - enter / AUTOPILOT_HORIZON
+                    break
+        return danger
+
+    def record_frame(self, milliseconds):
+        self.frame_times.append(milliseconds)
+
+    def level_done(self, game, outcome):
+        """Log the frame times and memory of the level that just ended"""
+        level = game.current_level
+        frame_times = sorted(self.frame_times)
+        self.frame_times = []
+        resident = resident_bytes()
+        counts = entity_counts(game.entities, game.previous_positions).values()
+        baseline = self.baselines.setdefault(level, resident)
+        stats = self.levels.setdefault(level, [0, 0.0])
+        stats[0] += 1
+        if not frame_times:
+            return
+        p99 = percentile(frame_times, 99)
+        stats[1] = max(stats[1], p99)
+        log.info("Soak level", level=level, outcome=outcome, frames=len(frame_times),
+                 p50_ms=f"{percentile(frame_times, 50):.2f}", p95_ms=f"{percentile(frame_times, 95):.2f}",
+                 p99_ms=f"{p99:.2f}", max_ms=f"{frame_times[-1]:.2f}",
+                 rss_mb=f"{resident / 2 ** 20:.1f}", rss_growth_mb=f"{(resident - baseline) / 2 ** 20:+.1f}",
+                 entities=sum(live for live, detached in counts), detached=sum(detached for live, detached in counts))
+
+    def game_done(self, game):
+        self.level_done(game, "win" if game.win else game.game_over_reason)
+        self.games += 1
+
+    def report(self):
+        log.info("Soak", games=self.games, rss_mb=f"{resident_bytes() / 2 ** 20:.1f}")
+        for level, (times, worst_p99) in sorted(self.levels.items()):
+            log.info("Soak level summary", level=level, times_ended=times, worst_p99_ms=f"{worst_p99:.2f}")
@@ -0,0 +1,114 @@
+import os
+import time
+import asyncio
+import argparse
+from src.constants import *
+from src.game import Game
+from src.log import log
+from src.trace import tracer
+from src.startup import startup_trace
+from src.telemetry import telemetry
+from src.diagnostics import diagnostics
+from src.state_hash import state_hasher
+from src.autopilot import Autopilot
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Cloud Invaders",
+        epilog="Example CI benchmark: python main.py --headless --level 3 --seed 1 --autopilot --lockstep --fps 0 --ticks 3600")
+    run = parser.add_argument_group("run")
+    run.add_argument('--headless', action='store_true',
+                     help="no window and no sound device (dummy SDL video and audio drivers), e.g. on CI machines")
+    run.add_argument('--mute', action='store_true', help="no sound device (dummy SDL audio driver)")
+    run.add_argument('--level', type=int, choices=range(1, MAX_LEVELS + 1), metavar='LEVEL',
+                     help="start the first game at LEVEL, skipping the menu")
+    run.add_argument('--endless', action='store_true',
+                     help="start the first game in endless mode (escalating waves), skipping the menu")
+    run.add_argument('--seed', type=int, help="seed the random module at the start of every game (reproducible runs)")
+    run.add_argument('--fps', type=int, metavar='FPS', default=MAX_RENDER_FPS,
+                     help=f"render rate cap, 0 for uncapped (default {MAX_RENDER_FPS})")
+    run.add_argument('--lockstep', action='store_true',
+                     help="advance one simulation tick per rendered frame instead of in real time "
+                          "(with --fps 0 the game runs as fast as the machine allows)")
+    run.add_argument('--ticks', type=int, metavar='N',
+                     help="exit after N simulation ticks; wait screens and the menu are answered with ENTER")
+    run.add_argument('--autopilot', action='store_true', help="let the soak-test pilot play (src/autopilot.py)")
+    run.add_argument('--threaded', action='store_true', help="run the simulation on its own thread (SIM_THREAD)")
+    run.add_argument('--async', dest='async_loop', action='store_true', default=ASYNC_LOOP,
+                     help="drive the frame loops from an asyncio event loop (ASYNC_LOOP)")
+
+    outputs = parser.add_argument_group("measurements")
+    outputs.add_argument('--profile', type=float, metavar='SECONDS',
+                         help="capture a cProfile of update/draw for SECONDS once gameplay starts (F9 in game)")
+    outputs.add_argument('--profile-level', type=int, metavar='LEVEL',
+                         help="start the --profile capture when LEVEL begins instead of the first level played")
+    outputs.add_argument('--trace', action='store_true',
+                         help="record a frame timeline from startup, written to traces/ at exit (F10 toggles in game)")
+    outputs.add_argument('--telemetry', nargs='?', const=TELEMETRY_ADDRESS, metavar='ADDRESS',
+                         help=f"export metrics to a statsd sink (default {TELEMETRY_ADDRESS})")
+    outputs.add_argument('--diagnostics', action='store_true',
+                         help="sample entity counts and surface memory every second (F11 in game)")
+    outputs.add_argument('--state-hash', action='store_true',
+                         help="hash the simulation state every tick; log the running hash at each level end and at exit")
+    return parser
+
+def main(argv=None):
+    """Parse the command line, run the game and return the exit status"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.lockstep and args.threaded:
+        parser.error("--lockstep needs the simulation on the main thread (drop --threaded)")
+    if args.endless and args.level:
+        parser.error("--endless has waves instead of levels (drop --level)")
+    if args.fps < 0:
+        parser.error("--fps must be 0 (uncapped) or more")
+
+    # SDL reads its drivers when the display and mixer start, in Game()
+    if args.headless:
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    if args.headless or args.mute:
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+    if args.trace:
+        tracer.start()
+    if args.telemetry:
+        telemetry.enabled = True
+        telemetry.address = args.telemetry
+    if args.diagnostics:
+        diagnostics.enabled = True
+    if args.state_hash:
+        state_hasher.enabled = True
+
+    with startup_trace.stage("Game.__init__"):
+        game = Game()
+    if args.profile:
+        game.profile_request = (args.profile, args.profile_level)
+    if args.autopilot:
+        game.autopilot = Autopilot()
+    game.start_level = ENDLESS_LEVEL if args.endless else args.level
+    game.seed = args.seed
+    game.tick_limit = args.ticks
+    game.lockstep = args.lockstep
+    game.render_fps = args.fps
+    if args.threaded:
+        game.threaded_simulation = True
+
+    start = time.perf_counter()
+    if args.async_loop:
+        asyncio.run(game.run_async())
+    else:
+        game.run()
+    seconds = time.perf_counter() - start
+
+    # One line for scripts: how far the run got and how fast
+    summary = {'ticks': game.total_ticks, 'frames': game.total_frames, 'seconds': f"{seconds:.2f}",
+               'ticks_per_second': f"{game.total_ticks / seconds:.1f}" if seconds else None,
+               'level': game.current_level}
+    if game.endless is not None:
+        summary['wave'] = game.endless.wave
+        summary['peak_entities'] = game.endless.peaks['entities']
+    if state_hasher.enabled:
+        summary['state_hash'] = f"{state_hasher.running:08x}"
+    log.info("Run finished", **summary)
+    log.flush()
+    return 0
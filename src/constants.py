@@ -26,6 +26,11 @@ HIT_PENALTY = 50000  # Credits lost when hit by enemy laser
 LIVES_NAME = "AWS Credits"
 PLAYER_NAME = "Starship Cirrus"
 
+# Entity kinds (one EntityRegistry list each; enemy kinds are the ones the player must destroy)
+ENTITY_KINDS = ['player', 'boss', 'ec2', 'dynamodb', 'lambda', 'asteroid', 'enemy_laser', 'player_laser',
+                'side_ship', 'power_up', 'laser_beam', 'boss_laser']
+ENEMY_KINDS = ['boss', 'ec2', 'dynamodb', 'lambda']
+
 # Sprite dimensions
 PLAYER_SPRITE_SIZE = (64, 64)
 ENEMY_SPRITE_SIZE = (96, 96)  # Reverted from 192x192 back to 96x96 (normal size)
@@ -36,6 +41,74 @@ MENU_MUSIC_VOLUME = 1.0  # Volume for menu music (100%)
 ENEMY_SPEED = 2
 ENEMY_SHOOT_CHANCE = 0.2  # Further reduced percentage chance per frame
 
+# Startup settings
+LAZY_INIT = True  # Defer level construction and sound effects until PLAY is pressed
+STARTUP_TRACE = True  # Print a per-stage startup trace when the menu first appears
+STARTUP_TARGET_MS = 500  # Target time from launch to first menu frame
+
+# Frame pacing settings
+SIMULATION_HZ = 60  # Fixed simulation rate; durations given "in frames" are simulation ticks at this rate
+MAX_RENDER_FPS = 144  # Render rate cap, independent of the simulation rate (0 = uncapped)
+MAX_CATCHUP_TICKS = 5  # Most simulation ticks run per rendered frame before the backlog is dropped
+SIM_THREAD = False  # Run the simulation on its own thread; the main thread only handles input and renders
+SIM_SWITCH_INTERVAL = 0.001  # Seconds between GIL hand-offs while the simulation thread runs
+JITTER_SAMPLES = 36000  # Simulation tick intervals kept for the jitter report (10 minutes at 60Hz)
+ASYNC_LOOP = False  # Drive the menu and game loops from an asyncio event loop that hosts background tasks
+TASK_BUDGET_MS = 2.0  # Default time per frame a background task may run before it is held over to the next frame
+ASYNC_SLEEP_SLACK = 0.002  # Seconds at the end of a frame's idle time kept free of background tasks and timer wakeups
+ASYNC_SPIN_TIME = 0.0002  # Seconds spun (not slept) before a frame's idle time ends, to hit the millisecond exactly
+ASYNC_EVENT_POLL_FPS = 60  # Event polling rate of the asyncio loop while a screen waits for input and tasks are pending
+GC_POLICY = True  # Freeze long-lived objects and tune GC thresholds during play; collect on static screens
+GC_GAMEPLAY_THRESHOLDS = (10000, 50, 1000)  # gc.set_threshold() during play (fewer, still short young collections)
+GC_PENDING_PAUSES = 1000  # GC pauses queued for telemetry between frames (oldest dropped when full)
+GC_SLOW_PAUSE_MS = 2.0  # GC pauses logged at INFO from this long (at most once per second); shorter ones at DEBUG
+MENU_ANIMATION_FPS = 30  # Menu star animation rate (the menu only redraws on animation ticks and input)
+UNFOCUSED_FPS = 10  # Frame rate while the window does not have focus (gameplay is paused)
+RENDER_LAYERS = ['player', 'enemies', 'projectiles', 'side_ships', 'power_ups', 'laser_beams', 'boss_lasers', 'explosions']  # Back to front, one batched blit each
+
+# Image loading settings
+COLORKEY = (255, 0, 255)  # Transparent color for images with only fully transparent/opaque pixels
+RLE_MIN_TRANSPARENT = 0.1  # Use RLE for alpha images at least this transparent (measured faster down to ~20%)
+SPRITE_CACHE = True  # Keep decoded, pre-scaled images in a memory-mapped file between runs
+SPRITE_CACHE_PATH = '.cache/sprites.bin'  # Rebuilt automatically when source art changes
+USE_ATLAS = True  # Cut sprites out of the packed sheets (rebuild with python -m tools.pack_atlas)
+ATLAS_IMAGE_ROOT = 'assets/images'  # Atlas image names are paths relative to this directory
+ATLAS_INDEX_PATH = 'assets/images/atlas/atlas.json'
+ATLAS_SHEET_SIZE = 1024  # Maximum sprite sheet width and height
+ATLAS_PADDING = 2  # Transparent pixels between packed images
+
+# Debug settings
+DEBUG_ALLOCATIONS = False  # Count surfaces created per frame with a profile hook (slow, debug only)
+TEXT_CACHE_SIZE = 256  # Rendered HUD text surfaces kept before the cache is reset
+PROFILE_SECONDS = 10.0  # Length of a cProfile capture started with F9 (F9 again stops it early)
+PROFILE_DIR = 'profiles'  # Where captures are written (.pstats, .folded collapsed stacks, .json tags)
+PROFILE_MAX_STACK_DEPTH = 64  # Deepest stack written to the collapsed-stack file
+TRACE_BUFFER_SIZE = 200000  # Trace events kept while recording a timeline with F10 (oldest dropped when full)
+TRACE_DIR = 'traces'  # Where timelines are written, as Chrome trace-event JSON
+DIAGNOSTICS = False  # Sample entity counts and surface memory by owner from the start (F11 toggles)
+DIAGNOSTICS_INTERVAL = 1.0  # Seconds between diagnostics samples
+STATE_HASH = False  # Hash the simulation state every tick and log the game's running hash at each level end
+AUTOPILOT_RANGE = 240  # Pixels either side of the ship the soak-test pilot considers moving to
+AUTOPILOT_RESOLUTION = 8  # Pixels between the positions the pilot compares
+AUTOPILOT_HORIZON = 90  # Ticks ahead the pilot looks for falling lasers and asteroids
+AUTOPILOT_MARGIN = 6  # Extra pixels the pilot keeps between the ship and a projectile's path
+AUTOPILOT_BEAM_MARGIN = 6  # Half width of the column the pilot avoids under a charging Lambda (doubled for the boss)
+AUTOPILOT_BEAM_TICKS = 60  # How long the pilot expects a Lambda beam to last once fired (LaserBeam.duration)
+
+# Logging settings
+LOG_LEVEL = "INFO"  # DEBUG, INFO, WARNING or ERROR
+LOG_BUFFER_SIZE = 2000  # Ring buffer size (oldest records dropped when full)
+LOG_FLUSH_INTERVAL = 0.5  # Seconds between background flushes to the terminal
+
+# Telemetry settings
+TELEMETRY = False  # Export per-session metrics to a statsd-compatible sink (python -m tools.statsd_sink)
+TELEMETRY_ADDRESS = "udp://127.0.0.1:8125"  # udp://host:port or unix:///path/to/socket
+TELEMETRY_PREFIX = "cloud_invaders"  # Prepended to every metric name
+TELEMETRY_FLUSH_INTERVAL = 10.0  # Seconds between batched flushes from the telemetry thread
+TELEMETRY_MAX_PACKET = 1432  # Largest datagram sent (fits a 1500 byte MTU)
+TELEMETRY_HISTOGRAM_SIZE = 4096  # Samples kept per histogram per flush interval (reservoir sampled beyond)
+TELEMETRY_PERCENTILES = (50, 90, 95, 99)  # Percentiles sent for each histogram
+
 # Power-up durations (in frames at 60fps)
 S3_DURATION = 600  # 10 seconds
 LOAD_BALANCER_DURATION = 900  # 15 seconds
@@ -71,8 +144,8 @@ LEVEL_CONFIGS = {
         'enemy_type': 'Lambda',
         'enemy_sprite': 'assets/images/enemies/lambda.png',
         'background': 'assets/images/bg/level_three_bg.png',  # Updated to bg directory
-        'enemy_speed': 1.5,
-        'enemy_shoot_interval': 180,  # 3 seconds at 60fps
+        'enemy_speed': 3,  # Same pace as the two 1.5 steps Lambdas used to take per frame
+        'enemy_shoot_interval': 90,  # 1.5 seconds at 60fps
         'enemy_shoot_chance': 0.3,    # 30% chance when timer triggers (reduced from 70%)
         'enemy_health': 2,  # Medium toughness
         'credit_burn_rate': 15  # Moderate cost
@@ -89,6 +162,21 @@ LEVEL_CONFIGS = {
     }
 }
 
+# Solid color level backgrounds used when the image cannot be loaded
+LEVEL_FALLBACK_COLORS = {
+    1: (20, 20, 40),  # Dark blue for EC2
+    2: (40, 20, 40),  # Dark purple for DynamoDB
+    3: (40, 40, 20),  # Dark yellow for Lambda
+    4: (20, 20, 20)   # Dark gray for boss
+}
+
+# Transition and end screens: candidate backgrounds (first found wins) and overlay alpha
+SCREEN_BACKGROUNDS = {
+    'victory': (['assets/images/bg/winner_bg.jpg', 'assets/images/bg/winner_bg.png'], 120),
+    'next_level': (['assets/images/bg/next_level_bg.png', 'assets/images/bg/next_level_bg.jpg'], 120),  # Lighter overlay than game over screen
+    'game_over': (['assets/images/bg/game_over_bg.jpg'], 150)
+}
+
 # Asteroid settings for DynamoDB
 ASTEROID_SPRITES = [
     'assets/images/enemies/asteriods/asteriod_1.png',
@@ -103,6 +191,7 @@ DYNAMODB_CHARGE_TIME_MAX = 360  # 6 seconds at 60fps
 # Boss level settings
 BOSS_INTRO_DURATION = 420  # 7 seconds at 60fps (changed from 600)
 BOSS_FADE_IN_DURATION = 420  # 7 seconds fade in (changed from 300)
+BOSS_FADE_STEPS = 32  # Pre-rendered alpha levels in the boss fade-in ramp
 BOSS_LASER_DURATION = 180  # 3 seconds laser beam (changed from 300)
 BOSS_SIZE = (200, 150)  # Large boss sprite size
 BOSS_MAX_HEALTH = 300  # Boss health for health bar (changed from 500)
@@ -110,6 +199,24 @@ BOSS_EXPLOSION_DURATION = 360  # 6 seconds explosion (changed from 600)
 BOSS_HEALTH_BAR_WIDTH = 400
 BOSS_HEALTH_BAR_HEIGHT = 20
 
+# Endless mode (procedurally generated waves until the credits run out)
+ENDLESS_LEVEL = 0  # current_level in endless mode (no level config: base credit burn rate, wave backgrounds)
+ENDLESS_FIRST_WAVE_ENEMIES = 8  # Enemies in wave 1
+ENDLESS_ENEMIES_PER_WAVE = 6  # Enemies added by each further wave
+ENDLESS_WAVE_TICKS = 1800  # Ticks until the next wave arrives even if the current one is not cleared (30 seconds)
+ENDLESS_WAVE_PAUSE = 120  # Ticks between clearing a wave and the next one arriving
+ENDLESS_MAX_ENEMIES = 400  # Most enemies alive at once: later waves wait and are trimmed to fit (keeps frames under 16.7 ms)
+ENDLESS_FIRE_RATE_GROWTH = 0.1  # Enemy fire rate added per wave, as a multiple of the level settings (x2 in wave 11)
+ENDLESS_MAX_FIRE_RATE = 4.0  # Highest fire rate multiple
+ENDLESS_MIX = {'ec2': 5, 'dynamodb': 2, 'lambda': 2}  # Relative share of each enemy kind in a wave
+ENDLESS_FIRST_WAVES = {'ec2': 1, 'dynamodb': 2, 'lambda': 3}  # First wave each enemy kind appears in
+ENDLESS_BOSS_EVERY = 5  # Every nth wave brings CloudFormation spawners (one more each time)
+ENDLESS_MAX_BOSSES = 3  # Most CloudFormation spawners alive at once
+ENDLESS_SPAWN_TOP = 60  # Band (y of the sprite's top) regular enemies spawn in
+ENDLESS_SPAWN_BOTTOM = 420
+ENDLESS_LAMBDA_COLUMNS = 5  # Lambdas move as one group, so each wave's Lambdas join the group's columns
+ENDLESS_LAMBDA_SPACING = 150  # Pixels between Lambda columns (as in level 3)
+
 # AWS Theme
 ENEMY_NAMES = ["EC2", "DynamoDB"]  # Updated for multiple levels
 LASER_NAME = "CloudShell Command"
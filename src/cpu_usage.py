@@ -0,0 +1,39 @@
+import time
+from src.log import log
+
+class CpuUsageMeter:
+    """Accumulates process CPU time and wall time per screen state (menu, gameplay, wait screens)"""
+    def __init__(self):
+        self.totals = {}  # state -> [cpu seconds, wall seconds]
+        self.state = None
+        self.state_cpu_start = 0.0
+        self.state_wall_start = 0.0
+        
+    def enter(self, state):
+        """Switch to a new screen state, closing the measurement of the previous one"""
+        if state == self.state:
+            return
+        now_cpu = time.process_time()
+        now_wall = time.perf_counter()
+        if self.state is not None:
+            totals = self.totals.setdefault(self.state, [0.0, 0.0])
+            totals[0] += now_cpu - self.state_cpu_start
+            totals[1] += now_wall - self.state_wall_start
+        self.state = state
+        self.state_cpu_start = now_cpu
+        self.state_wall_start = now_wall
+        
+    def usage(self):
+        """Return {state: (cpu percent of one core, wall seconds)}"""
+        result = {}
+        for state, (cpu, wall) in self.totals.items():
+            result[state] = (100.0 * cpu / wall if wall > 0 else 0.0, wall)
+        return result
+    
+    def report(self):
+        self.enter(None)  # Close the current state
+        for state, (percent, wall) in sorted(self.usage().items()):
+            log.info("CPU usage", state=state, cpu_percent=f"{percent:.1f}", seconds=f"{wall:.1f}")
+
+# Shared meter for the whole process
+cpu_meter = CpuUsageMeter()
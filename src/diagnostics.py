@@ -0,0 +1,181 @@
+import gc
+import os
+import sys
+import time
+from src.constants import *
+from src.log import log
+from src.entities import Entity
+from src.telemetry import telemetry
+from src import assets, sprites
+
+# shared_surfaces keys reported under a common owner (other keys are reported by name)
+SURFACE_OWNERS = {
+    'boss': 'boss sprites',
+    'boss_fade': 'boss sprites',
+    'explosion': 'explosion frames',
+    'beam': 'beam surfaces',
+    'enemy': 'enemy sprites',
+    'enemy_damage': 'enemy sprites',
+    'lambda': 'enemy sprites',
+    'ship_normal': 'player ship',
+    'ship_shadow': 'player ship',
+    'ship_s3': 'player ship',
+}
+
+def surface_bytes(surface):
+    """Pixel memory of a surface (subsurfaces share their parent's pixels)"""
+    if surface.get_parent() is not None:
+        return 0
+    return surface.get_pitch() * surface.get_height()
+
+def resident_bytes():
+    """Resident memory of the process (peak resident memory where /proc is not available)"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024  # Bytes on macOS, KiB elsewhere
+    except ImportError:
+        return 0  # Windows
+
+def surfaces_in(value):
+    """The surfaces in a cache value (a surface, or a tuple/list of them)"""
+    if isinstance(value, (tuple, list)):
+        for item in value:
+            yield from surfaces_in(item)
+    elif value is not None:
+        yield value
+
+def entity_counts(registry, transient=()):
+    """Live instances of every Entity class: {class name: [in a registry list, detached]}.
+
+    The entities in the registry's lists are counted from the lists. Detached
+    entities were killed (or never added) but are still referenced from
+    somewhere, e.g. a beam holding on to the enemy that fired it; they are found
+    with gc.get_objects(), so this is only for diagnostics and once-per-level
+    reports. Entities in transient (the interpolation positions of the last tick)
+    are expected to outlive their kill by a tick and are not counted as detached.
+    gc.get_objects() does not list the objects frozen at level start (see
+    src/gc_policy.py), and they are left frozen, so an entity that existed when
+    the level started and is detached since is not counted.
+    """
+    counts = {}
+    for entities in registry.kinds.values():
+        for entity in entities.entities:
+            entry = counts.get(type(entity).__name__)
+            if entry is None:
+                entry = counts[type(entity).__name__] = [0, 0]
+            entry[0] += 1
+    for obj in gc.get_objects():
+        if isinstance(obj, Entity) and not obj.alive() and obj not in transient:
+            entry = counts.get(type(obj).__name__)
+            if entry is None:
+                entry = counts[type(obj).__name__] = [0, 0]
+            entry[1] += 1
+    return counts
+
+class Diagnostics:
+    """Live object and surface memory accounting, sampled once per DIAGNOSTICS_INTERVAL.
+
+    Each sample counts the live instances of every entity class (in a registry
+    list or detached), the size of every registry list and the pixel bytes of
+    every surface the game holds, by owner. Entity images that are not shared
+    surfaces are reported per class as "instance <Class>". Samples are logged,
+    sent to telemetry as gauges and shown as an overlay while enabled (F11).
+
+    With the simulation on its own thread the samples are taken there between
+    ticks (src/simulation.py), so the entity lists and the sprite caches hold
+    still; the caches the main thread fills are copied before they are read.
+    """
+    def __init__(self, enabled=DIAGNOSTICS, interval=DIAGNOSTICS_INTERVAL):
+        self.enabled = enabled
+        self.interval = interval
+        self.next_sample = 0.0
+        self.lines = []  # Latest sample as overlay text
+        self.peaks = {}  # Registry kind -> largest size seen
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.next_sample = 0.0
+        self.lines = []
+        log.info("Diagnostics", enabled=self.enabled)
+
+    def update(self, game):
+        """Take a sample if one is due (called once per frame, or per batch of ticks on the simulation thread)"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if now < self.next_sample:
+            return
+        self.next_sample = now + self.interval
+        self.sample(game)
+
+    def surface_usage(self, game):
+        """Pixel bytes of every surface the game holds: {owner: [surfaces, bytes]}"""
+        usage = {}
+        seen = set()
+        def add(owner, surface):
+            if id(surface) in seen:
+                return
+            seen.add(id(surface))
+            entry = usage.get(owner)
+            if entry is None:
+                entry = usage[owner] = [0, 0]
+            entry[0] += 1
+            entry[1] += surface_bytes(surface)
+
+        # dict.copy() does not let another thread add keys mid-iteration
+        for key, value in sprites.shared_surfaces.copy().items():
+            name = key[0] if isinstance(key, tuple) else key
+            for surface in surfaces_in(value):
+                add(SURFACE_OWNERS.get(name, name), surface)
+        for (name, variant), surface in game.compositor.cache.copy().items():
+            if surface is not None:
+                add('backgrounds' if name == 'level' else 'screens', surface)
+        for surface in assets.atlas_sheets.copy().values():
+            add('atlas sheets', surface)
+        for surface in game.text_cache.copy().values():
+            add('hud text', surface)
+        menu_background = game.menu.background
+        if menu_background is not None:
+            add('menu', menu_background)
+        for entities in game.entities.kinds.values():
+            for entity in entities.entities:
+                add(f"instance {type(entity).__name__}", entity.image)
+        return usage
+
+    def sample(self, game):
+        counts = entity_counts(game.entities, game.previous_positions)
+        sizes = {kind: len(entities) for kind, entities in game.entities.kinds.items()}
+        usage = self.surface_usage(game)
+        for kind, size in sizes.items():
+            self.peaks[kind] = max(self.peaks.get(kind, 0), size)
+            telemetry.gauge(f"entities.{kind}", size)
+        for owner, (surfaces, size) in usage.items():
+            telemetry.gauge(f"surface_bytes.{owner.replace(' ', '_')}", size)
+
+        detached = {name: entry[1] for name, entry in counts.items() if entry[1]}
+        total_bytes = sum(size for surfaces, size in usage.values())
+        log.info("Diagnostics sample", level=game.current_level, entities=sum(sizes.values()),
+                 detached=detached or None, surface_mb=f"{total_bytes / 2 ** 20:.1f}",
+                 rss_mb=f"{resident_bytes() / 2 ** 20:.1f}")
+
+        lines = [f"{name}: {live} live, {dead} detached" if dead else f"{name}: {live}"
+                 for name, (live, dead) in sorted(counts.items())]
+        lines.append("lists: " + " ".join(f"{kind}={size}" for kind, size in sizes.items() if size))
+        for owner, (surfaces, size) in sorted(usage.items(), key=lambda item: -item[1][1]):
+            lines.append(f"{owner}: {surfaces} surf {size / 1024:.0f} KiB")
+        lines.append(f"surfaces total: {total_bytes / 2 ** 20:.1f} MiB")
+        self.lines = lines
+        return counts, sizes, usage
+
+    def report(self):
+        if self.peaks:
+            log.info("Entity list peaks", **{kind: size for kind, size in self.peaks.items() if size})
+
+# Shared diagnostics for the whole game
+diagnostics = Diagnostics()
@@ -0,0 +1,138 @@
+import random
+from src.constants import *
+from src.log import log
+from src.trace import tracer
+from src.telemetry import telemetry
+from src.sprites import Enemy, DynamoDBEnemy, LambdaEnemy, CloudFormationBoss
+
+PROJECTILE_KINDS = ('player_laser', 'enemy_laser', 'asteroid')
+
+class EndlessMode:
+    """Endless mode: procedurally generated waves that keep growing until the credits run out.
+
+    Wave n brings ENDLESS_FIRST_WAVE_ENEMIES + (n - 1) * ENDLESS_ENEMIES_PER_WAVE
+    enemies, a random mix (ENDLESS_MIX) of the kinds that have appeared by then
+    (ENDLESS_FIRST_WAVES), with their fire rates raised by ENDLESS_FIRE_RATE_GROWTH
+    per wave up to ENDLESS_MAX_FIRE_RATE. Every ENDLESS_BOSS_EVERY waves
+    CloudFormation bosses join as spawners of more enemies. The next wave arrives
+    ENDLESS_WAVE_PAUSE ticks after a wave is cleared, or after ENDLESS_WAVE_TICKS
+    whether or not it was, so enemies pile up when the player falls behind, up to
+    ENDLESS_MAX_ENEMIES: past that the next wave waits, and a wave only brings as
+    many enemies as still fit, which keeps the frame time within budget (measured
+    with python -m tools.endless_benchmark).
+
+    The enemies are the regular sprite classes with their own behaviours; only
+    their placement, direction and fire rate are set here. The high-water marks
+    of entities, enemies and projectiles alive at once are kept for the HUD and
+    logged when the game ends.
+    """
+    def __init__(self, first_wave=1):
+        self.wave = first_wave - 1
+        self.wave_ticks = 0
+        self.cleared_ticks = 0
+        self.ticks = 0
+        self.peaks = {'entities': 0, 'enemies': 0, 'projectiles': 0}
+        self.peak_waves = {'entities': 0, 'enemies': 0, 'projectiles': 0}  # Wave each peak was reached in
+
+    def fire_rate(self):
+        """Multiple of the level settings' fire rates in the current wave"""
+        return min(ENDLESS_MAX_FIRE_RATE, 1.0 + ENDLESS_FIRE_RATE_GROWTH * (self.wave - 1))
+
+    def start(self, game):
+        """Bring the first wave (called when a game starts)"""
+        self.next_wave(game)
+
+    def update(self, game):
+        """Track the high-water marks and bring the next wave when it is due (called once per tick)"""
+        self.ticks += 1
+        self.wave_ticks += 1
+        entities = game.entities
+        enemies = entities.enemy_count()
+        if enemies == 0:
+            self.cleared_ticks += 1
+
+        counts = {
+            'entities': sum(len(kind) for kind in entities.kinds.values()),
+            'enemies': enemies,
+            'projectiles': sum(len(entities[kind]) for kind in PROJECTILE_KINDS)
+        }
+        for name, count in counts.items():
+            if count > self.peaks[name]:
+                self.peaks[name] = count
+                self.peak_waves[name] = self.wave
+
+        if self.cleared_ticks >= ENDLESS_WAVE_PAUSE or (self.wave_ticks >= ENDLESS_WAVE_TICKS
+                                                        and enemies < ENDLESS_MAX_ENEMIES):
+            self.next_wave(game)
+
+    def next_wave(self, game):
+        self.wave += 1
+        self.wave_ticks = 0
+        self.cleared_ticks = 0
+
+        # Backgrounds cycle through the levels'
+        game.background = game.compositor.level_background((self.wave - 1) % MAX_LEVELS + 1)
+
+        enemies = self.wave_enemies(game)
+        for enemy in enemies:
+            game.entities.add(enemy)
+        log.info("Endless wave", wave=self.wave, enemies=len(enemies), fire_rate=f"{self.fire_rate():.1f}",
+                 alive=game.entities.enemy_count())
+        tracer.instant('endless_wave', 'level', {'wave': self.wave, 'enemies': len(enemies)})
+        telemetry.gauge('endless.wave', self.wave)
+
+    def wave_enemies(self, game):
+        """The new enemies of the current wave"""
+        rate = self.fire_rate()
+        kinds = [kind for kind, first_wave in ENDLESS_FIRST_WAVES.items() if self.wave >= first_wave]
+        count = min(ENDLESS_FIRST_WAVE_ENEMIES + (self.wave - 1) * ENDLESS_ENEMIES_PER_WAVE,
+                    ENDLESS_MAX_ENEMIES - game.entities.enemy_count())
+        columns = self.lambda_columns(game)
+        enemies = []
+        for kind in random.choices(kinds, [ENDLESS_MIX[kind] for kind in kinds], k=count):
+            x = random.randint(0, SCREEN_WIDTH - ENEMY_SPRITE_SIZE[0])
+            y = random.randint(ENDLESS_SPAWN_TOP, ENDLESS_SPAWN_BOTTOM)
+            if kind == 'ec2':
+                enemy = Enemy(x, y, level=1)
+                enemy.direction = random.choice((-1, 1))
+                enemy.shoot_interval = max(1, int(enemy.shoot_interval / rate))
+                enemy.shoot_timer = random.randint(0, enemy.shoot_interval)
+            elif kind == 'dynamodb':
+                enemy = DynamoDBEnemy(x, y)
+                enemy.direction = random.choice((-1, 1))
+                enemy.charge_rate = rate
+            else:
+                enemy = LambdaEnemy(random.choice(columns), y)
+                enemy.shoot_interval = max(1, int(enemy.shoot_interval / rate))
+            enemies.append(enemy)
+
+        if self.wave % ENDLESS_BOSS_EVERY == 0:
+            bosses = min(self.wave // ENDLESS_BOSS_EVERY, ENDLESS_MAX_BOSSES - len(game.entities['boss']))
+            for i in range(bosses):
+                boss = CloudFormationBoss(random.randint(5, SCREEN_WIDTH - BOSS_SIZE[0] - 5), 100)
+                boss.boss_direction = random.choice((-1, 1))
+                boss.ability_interval = max(1, int(boss.ability_interval / rate))
+                enemies.append(boss)
+        return enemies
+
+    def lambda_columns(self, game):
+        """x positions for new Lambdas: the columns of the Lambdas already moving as a group.
+
+        Lambdas all turn when any of them reaches an edge, so a group spread wider
+        than the screen would turn every tick. New Lambdas line up with the
+        leftmost one (or where level 3 starts them) in ENDLESS_LAMBDA_COLUMNS
+        columns that fit on screen.
+        """
+        lambdas = game.entities['lambda'].entities
+        left = min(enemy.rect.x for enemy in lambdas) if lambdas else 120
+        width = (ENDLESS_LAMBDA_COLUMNS - 1) * ENDLESS_LAMBDA_SPACING + ENEMY_SPRITE_SIZE[0]
+        while left + width > SCREEN_WIDTH - 5 and left - ENDLESS_LAMBDA_SPACING >= 5:
+            left -= ENDLESS_LAMBDA_SPACING
+        return [left + column * ENDLESS_LAMBDA_SPACING for column in range(ENDLESS_LAMBDA_COLUMNS)]
+
+    def report(self):
+        """Log how far the game got and the most entities alive at once"""
+        log.info("Endless game", waves=self.wave, ticks=self.ticks,
+                 **{f"peak_{name}": f"{count} (wave {self.peak_waves[name]})" for name, count in self.peaks.items()})
+        for name, count in self.peaks.items():
+            telemetry.gauge(f"endless.peak_{name}", count)
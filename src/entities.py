@@ -0,0 +1,158 @@
+from src.constants import *
+
+class Entity:
+    """Slotted replacement for pygame.sprite.Sprite (which gives every instance a __dict__).
+
+    Subclasses declare all of their attributes in __slots__. An entity belongs to
+    at most one EntityList, so the group set of a pygame sprite becomes a single
+    slot; kill(), alive() and the group protocol behave like pygame's.
+    """
+    __slots__ = ('image', 'rect', 'entity_list', 'entity_index')
+
+    def __init__(self):
+        self.entity_list = None
+        self.entity_index = -1
+
+    def add_internal(self, entity_list):
+        if self.entity_list is not None and self.entity_list is not entity_list:
+            self.entity_list.remove_internal(self)  # One list per entity
+        self.entity_list = entity_list
+
+    def remove_internal(self, entity_list):
+        self.entity_list = None
+
+    def kill(self):
+        """Remove the entity from its list"""
+        if self.entity_list is not None:
+            self.entity_list.remove_internal(self)
+            self.entity_list = None
+
+    def alive(self):
+        return self.entity_list is not None
+
+    def groups(self):
+        return [self.entity_list] if self.entity_list is not None else []
+
+    def update(self, *args):
+        pass
+
+    def __repr__(self):
+        return f"<{type(self).__name__} Entity({'alive' if self.alive() else 'dead'})>"
+
+class EntityList:
+    """Dense list of one kind of entity with O(1) swap-remove.
+
+    Implements the pygame group protocol (add_internal/remove_internal/sprites),
+    so Entity.kill(), alive(), spritecollide and groupcollide work unchanged.
+    Each entity remembers its slot in entity_index; removing it moves the last
+    entity into that slot, so the order of a kind is not stable.
+    """
+    def __init__(self, kind):
+        self.kind = kind
+        self.entities = []
+
+    def add(self, *entities):
+        for entity in entities:
+            if not self.has_internal(entity):
+                entity.add_internal(self)
+                self.add_internal(entity)
+
+    def remove(self, entity):
+        if self.has_internal(entity):
+            self.remove_internal(entity)
+            entity.remove_internal(self)
+
+    def add_internal(self, entity):
+        entity.entity_index = len(self.entities)
+        self.entities.append(entity)
+
+    def remove_internal(self, entity):
+        entities = self.entities
+        index = entity.entity_index
+        last = entities.pop()
+        if last is not entity:
+            entities[index] = last
+            last.entity_index = index
+
+    def has_internal(self, entity):
+        return entity.entity_list is self
+
+    def sprites(self):
+        """Copy of the entities (safe to kill while iterating, as pygame's collide helpers do)"""
+        return list(self.entities)
+
+    def __iter__(self):
+        """Iterate back to front, so the current entity may kill itself without skipping any other"""
+        entities = self.entities
+        index = len(entities) - 1
+        while index >= 0:
+            if index < len(entities):
+                yield entities[index]
+            index -= 1
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __bool__(self):
+        return bool(self.entities)
+
+    def __contains__(self, entity):
+        return self.has_internal(entity)
+
+    def empty(self):
+        """Kill every entity of this kind"""
+        while self.entities:
+            self.entities[-1].kill()
+
+class EntityRegistry:
+    """One EntityList per entity kind (ENTITY_KINDS); every entity lives in exactly one list"""
+    def __init__(self):
+        self.kinds = {kind: EntityList(kind) for kind in ENTITY_KINDS}
+        self.enemy_lists = [self.kinds[kind] for kind in ENEMY_KINDS]
+
+    def __getitem__(self, kind):
+        return self.kinds[kind]
+
+    def add(self, entity):
+        """Add an entity to the list of its class's kind"""
+        self.kinds[entity.kind].add(entity)
+
+    def enemy_count(self):
+        return sum(len(enemies) for enemies in self.enemy_lists)
+
+    def enemies(self):
+        """Every enemy of every kind (a new list)"""
+        return [enemy for enemies in self.enemy_lists for enemy in enemies.entities]
+
+def collide_shots(targets, shots, kill_targets=False):
+    """pygame.sprite.groupcollide(targets, shots, kill_targets, True) for two EntityLists, in one pass over the shots.
+
+    groupcollide calls spritecollide (which copies the shots' list) once per
+    target, so it costs targets x shots; here each shot finds its target with one
+    Rect.collidelist over the targets' rects. Shots are few and targets many, so
+    this stays cheap with hundreds of enemies or asteroids.
+
+    The result and the kills are the same, in the same order, so the lists stay
+    in the same order: groupcollide visits the targets back to front (front to
+    back when it kills them), each taking the shots still alive that overlap it.
+    """
+    if not targets.entities or not shots.entities:
+        return {}
+    ordered = list(targets.entities) if kill_targets else targets.entities[::-1]
+    rects = [target.rect for target in ordered]
+    hits = {}  # Position in ordered -> shots overlapping that target first
+    for shot in shots.entities:
+        index = shot.rect.collidelist(rects)
+        if index >= 0:
+            hits.setdefault(index, []).append(shot)
+
+    crashed = {}
+    for index in sorted(hits):
+        target = ordered[index]
+        target_shots = sorted(hits[index], key=lambda shot: shot.entity_index)  # Shots list order at this point
+        for shot in target_shots:
+            shot.kill()
+        crashed[target] = target_shots
+        if kill_targets:
+            target.kill()
+    return crashed
@@ -2,50 +2,119 @@ import pygame
 import sys
 import os
 import random
+import time
 from src.constants import *
 from src.sprites import Player, Enemy, DynamoDBEnemy, Laser, Asteroid, PowerUp, SideShip, LambdaEnemy, LaserBeam, CloudFormationBoss, BossLaser
 from src.menu import Menu
+from src.music import play_music, stop_music
+from src.screens import ScreenCompositor
+from src.renderer import LayeredRenderer
+from src.entities import EntityRegistry, collide_shots
+from src.snapshot import HudState, RenderSnapshot, SnapshotBuffer
+from src.simulation import SimulationThread, tick_jitter
+from src.scheduler import FrameScheduler, run_frames, WAIT_FOR_EVENT
+from src.startup import startup_trace
+from src.log import log
+from src.cpu_usage import cpu_meter
+from src.alloc_counter import alloc_counter
+from src.telemetry import telemetry, metric_name
+from src.profiler import profile_capture
+from src.trace import tracer
+from src.gc_policy import gc_policy
+from src.diagnostics import diagnostics
+from src.state_hash import state_hasher
+from src.endless import EndlessMode
 
 class Game:
     def __init__(self):
         # Initialize pygame
-        pygame.init()
+        if LAZY_INIT:
+            # Only bring up the subsystems the menu needs
+            with startup_trace.stage("pygame display/font init"):
+                pygame.display.init()
+                pygame.font.init()
+        else:
+            with startup_trace.stage("pygame.init"):
+                pygame.init()
         
         # Initialize audio mixer
+        self.sounds = {}
+        self.last_sound_time = {}  # Sound name -> last play time (ms), for rate limiting
+        self.last_audio_cleanup = 0
+        self.boss_music_started = False
+        self.game_asset_steps = self.game_asset_loader()  # Resumable: load_game_assets() and stream_game_assets() share it
         if ENABLE_AUDIO:
-            # Conservative audio initialization to prevent overflow
-            pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=1024)
-            pygame.mixer.init()
-            # Limit mixer channels to prevent overflow
-            pygame.mixer.set_num_channels(8)  # Reduced from 16 to 8
-            pygame.mixer.set_reserved(1)      # Reserve 1 channel for music
-            self.load_audio()
+            with startup_trace.stage("mixer init"):
+                # Conservative audio initialization to prevent overflow
+                pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=1024)
+                pygame.mixer.init()
+                # Limit mixer channels to prevent overflow
+                pygame.mixer.set_num_channels(8)  # Reduced from 16 to 8
+                pygame.mixer.set_reserved(1)      # Reserve 1 channel for music
         
         # Set up the display
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Cloud Invaders")
+        with startup_trace.stage("display.set_mode"):
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("Cloud Invaders")
+        
+        # Cached full-screen backgrounds and transition screens
+        self.compositor = ScreenCompositor()
+        self.renderer = LayeredRenderer()
+        
+        # Simulation on a worker thread (SIM_THREAD) hands frames to the renderer through this
+        self.threaded_simulation = SIM_THREAD
+        self.snapshots = SnapshotBuffer()
+        
+        # Host of background coroutines, set by run_async() (None in the blocking loop)
+        self.scheduler = None
+        
+        # Keyboard state the simulation reads, captured once per frame on the main thread
+        self.input_keys = pygame.key.get_pressed()
+        
+        # When the last frame was presented (for the frame time metric; None after pauses)
+        self.last_frame_time = None
+        
+        # Profile capture requested on the command line: (seconds, level or None for the first level played)
+        self.profile_request = None
+        
+        # Scripted pilot that replaces keyboard input in soak tests (see src/autopilot.py)
+        self.autopilot = None
+        
+        # Run settings from the command line (see src/cli.py)
+        self.start_level = None  # Level the first game starts at, skipping the menu
+        self.seed = None  # Seed of the random module at the start of every game (None = unseeded)
+        self.tick_limit = None  # Simulation ticks after which the session ends (None = no limit)
+        self.lockstep = False  # One simulation tick per rendered frame instead of ticks in real time
+        self.render_fps = MAX_RENDER_FPS  # Render rate cap (0 = uncapped)
+        self.total_ticks = 0  # Simulation ticks and rendered gameplay frames of the whole session
+        self.total_frames = 0
         
         # Create menu
-        self.menu = Menu(self.screen)
+        with startup_trace.stage("Menu.__init__"):
+            self.menu = Menu(self.screen)
         
         # Game state
         self.clock = pygame.time.Clock()
         self.game_over = False
         self.win = False
         self.game_over_reason = ""  # Track why the game ended
+        self.window_focused = True  # Gameplay pauses and rendering is throttled without focus
+        self.previous_positions = {}  # Sprite positions before the last simulation tick
+        self.text_cache = {}  # (font, text, color) -> rendered HUD text surface
         
         # Load Press Start 2P font for all text
-        try:
-            self.font_large = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 24)
-            self.font_medium = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 18)
-            self.font_small = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 14)
-            self.font_tiny = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 12)
-        except:
-            # Fallback to system fonts
-            self.font_large = pygame.font.SysFont(None, 36)
-            self.font_medium = pygame.font.SysFont(None, 28)
-            self.font_small = pygame.font.SysFont(None, 24)
-            self.font_tiny = pygame.font.SysFont(None, 20)
+        with startup_trace.stage("game fonts"):
+            try:
+                self.font_large = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 24)
+                self.font_medium = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 18)
+                self.font_small = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 14)
+                self.font_tiny = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 12)
+            except:
+                # Fallback to system fonts
+                self.font_large = pygame.font.SysFont(None, 36)
+                self.font_medium = pygame.font.SysFont(None, 28)
+                self.font_small = pygame.font.SysFont(None, 24)
+                self.font_tiny = pygame.font.SysFont(None, 20)
             
         self.credit_timer = 0  # Timer for credit burning
         
@@ -61,12 +130,38 @@ class Game:
         self.boss = None
         self.boss_exploding = False
         self.boss_explosion_timer = 0
+        self.endless = None  # EndlessMode while an endless game is played
+        
+        # Initialize game objects (lazy mode builds the level when PLAY is pressed)
+        if not LAZY_INIT:
+            with startup_trace.stage("load_game_assets"):
+                self.load_game_assets()
+            with startup_trace.stage("initialize_game"):
+                self.initialize_game()
+    
+    def load_game_assets(self):
+        """Load assets that are only needed once gameplay starts (sound effects, transition screens).
         
-        # Initialize game objects
-        self.initialize_game()
+        Loads whatever stream_game_assets() has not loaded yet; a no-op once everything is.
+        """
+        for step in self.game_asset_steps:
+            pass
+    
+    def game_asset_loader(self):
+        """Generator behind load_game_assets(): loads one sound or transition screen per step"""
+        phase = tracer.now()
+        if ENABLE_AUDIO:
+            yield from self.load_audio()
+        yield from self.prebuild_screens()
+        tracer.complete('load_game_assets', 'assets', phase)
+    
+    async def stream_game_assets(self, budget):
+        """Background task of run_async(): loads the gameplay assets in the menu's idle time, so PLAY doesn't wait for them"""
+        for step in self.game_asset_steps:
+            await budget.checkpoint()
     
     def load_audio(self):
-        """Load all audio files"""
+        """Load all audio files (a generator: one step per file)"""
         self.sounds = {}
         
         # Load sound effects with 100% volume (except player hit at 40%)
@@ -90,13 +185,14 @@ class Game:
                     sound = pygame.mixer.Sound(file_path)
                     sound.set_volume(volume)  # Set individual volume
                     self.sounds[sound_name] = sound
-                    print(f"Loaded audio: {sound_name} at {int(volume*100)}% volume")
+                    log.debug("Loaded audio", sound=sound_name, volume=f"{int(volume*100)}%")
                 except pygame.error as e:
-                    print(f"Could not load {file_path}: {e}")
+                    log.warning("Could not load audio", path=file_path, error=e)
                     self.sounds[sound_name] = None
             else:
-                print(f"Audio file not found: {file_path}")
+                log.warning("Audio file not found", path=file_path)
                 self.sounds[sound_name] = None
+            yield
     
     def play_sound(self, sound_name):
         """Play sound with rate limiting to prevent overlap and audio bugs"""
@@ -105,10 +201,6 @@ class Game:
         
         current_time = pygame.time.get_ticks()
         
-        # Initialize sound timing tracker
-        if not hasattr(self, 'last_sound_time'):
-            self.last_sound_time = {}
-        
         # Rate limiting per sound type (prevents audio overlap)
         rate_limits = {
             'shoot': 100,      # Max once per 100ms (10 shots/sec max)
@@ -132,7 +224,8 @@ class Game:
         
         # Play sound and record timestamp
         try:
-            self.sounds[sound_name].play()
+            with tracer.span('play_sound', 'audio', {'sound': sound_name}):
+                self.sounds[sound_name].play()
             self.last_sound_time[sound_name] = current_time
         except pygame.error:
             # Handle audio system errors gracefully
@@ -142,11 +235,10 @@ class Game:
         """Clean up audio resources to prevent memory leaks and audio bugs"""
         try:
             # Clear sound timing tracker
-            if hasattr(self, 'last_sound_time'):
-                self.last_sound_time.clear()
+            self.last_sound_time.clear()
             
             # Stop background music
-            pygame.mixer.music.stop()
+            stop_music()
             
             # Force stop all mixer channels
             pygame.mixer.stop()
@@ -160,23 +252,19 @@ class Game:
     
     def periodic_audio_cleanup(self):
         """Perform periodic audio cleanup to prevent overflow"""
-        if not hasattr(self, 'last_audio_cleanup'):
-            self.last_audio_cleanup = 0
-        
         current_time = pygame.time.get_ticks()
         
         # Clean up every 30 seconds
         if current_time - self.last_audio_cleanup > 30000:
             try:
                 # Clean up old sound timing entries (older than 5 seconds)
-                if hasattr(self, 'last_sound_time'):
-                    old_entries = []
-                    for sound_name, timestamp in self.last_sound_time.items():
-                        if current_time - timestamp > 5000:  # 5 seconds old
-                            old_entries.append(sound_name)
-                    
-                    for sound_name in old_entries:
-                        del self.last_sound_time[sound_name]
+                old_entries = []
+                for sound_name, timestamp in self.last_sound_time.items():
+                    if current_time - timestamp > 5000:  # 5 seconds old
+                        old_entries.append(sound_name)
+                
+                for sound_name in old_entries:
+                    del self.last_sound_time[sound_name]
                 
                 # Limit total active channels
                 active_channels = pygame.mixer.get_busy()
@@ -195,21 +283,24 @@ class Game:
         # Reset level to 1 when starting a new game
         if self.game_over or self.win:
             self.current_level = 1
-            print(f"Game reset. Starting at level {self.current_level}")  # Debug
+            log.info("Game reset", level=self.current_level)
+        
+        # Lambdas move as a group; a new game starts them moving right again
+        LambdaEnemy.group_direction = 1
+        LambdaEnemy.edge_hit = False
+        
+        # Create the entity lists (every entity lives in exactly one, by kind)
+        self.entities = EntityRegistry()
+        self.player_lasers = self.entities['player_laser']
+        self.enemy_lasers = self.entities['enemy_laser']
+        self.asteroids = self.entities['asteroid']  # For DynamoDB asteroids
+        self.power_ups = self.entities['power_up']  # For power-ups
+        self.side_ships = self.entities['side_ship']  # For Auto Scaling duplicates
+        self.laser_beams = self.entities['laser_beam']  # For Lambda laser beams
+        self.boss_lasers = self.entities['boss_laser']  # For boss laser beams
         
-        # Create sprite groups
         self.player = Player()
-        self.all_sprites = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
-        self.player_lasers = pygame.sprite.Group()
-        self.enemy_lasers = pygame.sprite.Group()
-        self.asteroids = pygame.sprite.Group()  # For DynamoDB asteroids
-        self.power_ups = pygame.sprite.Group()  # For power-ups
-        self.side_ships = pygame.sprite.Group()  # For Auto Scaling duplicates
-        self.laser_beams = pygame.sprite.Group()  # For Lambda laser beams
-        self.boss_lasers = pygame.sprite.Group()  # For boss laser beams
-        
-        self.all_sprites.add(self.player)
+        self.entities.add(self.player)
         
         # Reset boss-related variables
         self.boss = None
@@ -223,7 +314,10 @@ class Game:
         self.load_level_background()
         
         # Create initial enemies or start boss intro
-        if self.current_level == 4:
+        if self.endless is not None:
+            self.current_level = ENDLESS_LEVEL
+            self.endless.start(self)
+        elif self.current_level == 4:
             self.start_boss_intro()
         else:
             self.create_enemies()
@@ -234,45 +328,27 @@ class Game:
         self.level_complete = False
         self.credit_timer = 0
         self.game_over_reason = ""
+        self.level_ticks = 0  # Simulation ticks spent in the current level
+        state_hasher.reset()
         
     def load_level_background(self):
-        """Load the background image for the current level"""
-        if self.current_level in LEVEL_CONFIGS:
-            bg_path = LEVEL_CONFIGS[self.current_level]['background']
-            try:
-                self.background = pygame.image.load(bg_path)
-                self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-            except:
-                # Fallback to solid color background
-                self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                if self.current_level == 1:
-                    self.background.fill((20, 20, 40))  # Dark blue for EC2
-                elif self.current_level == 2:
-                    self.background.fill((40, 20, 40))  # Dark purple for DynamoDB
-                elif self.current_level == 3:
-                    self.background.fill((40, 40, 20))  # Dark yellow for Lambda
-                elif self.current_level == 4:
-                    self.background.fill((20, 20, 20))  # Dark gray for boss
-                else:
-                    self.background.fill(BLACK)
-        else:
-            self.background = None
+        """Use the cached background for the current level"""
+        self.background = self.compositor.level_background(self.current_level)
 
     def start_boss_intro(self):
         """Start the boss introduction sequence"""
-        print("Starting boss intro...")  # Debug
+        log.debug("Starting boss intro")
         self.boss_intro_active = True
         self.boss_intro_timer = 0
+        self.boss_music_started = False  # Battle music starts once per boss fight
         self.player_can_shoot = False
         self.boss_exploding = False  # Ensure boss isn't exploding
         
         # Stop current music and play heartbeat (looped)
-        pygame.mixer.music.stop()
+        stop_music()
         if ENABLE_AUDIO:
             try:
-                pygame.mixer.music.load('assets/audio/heartbeat.wav')
-                pygame.mixer.music.set_volume(1.0)  # 100% volume
-                pygame.mixer.music.play(-1)  # Loop indefinitely
+                play_music('assets/audio/heartbeat.wav')
             except:
                 pass  # Continue without music if file not found
         
@@ -280,9 +356,8 @@ class Game:
         x = SCREEN_WIDTH // 2 - BOSS_SIZE[0] // 2
         y = 100  # Moved down from 50 to 100 for better positioning
         self.boss = CloudFormationBoss(x, y)
-        self.enemies.add(self.boss)
-        self.all_sprites.add(self.boss)
-        print(f"Boss created and added to groups. Enemy count: {len(self.enemies)}, Boss intro active: {self.boss_intro_active}")  # Debug
+        self.entities.add(self.boss)
+        log.debug("Boss created", enemies=self.entities.enemy_count(), intro_active=self.boss_intro_active)
     
     def update_boss_intro(self):
         """Handle boss introduction sequence"""
@@ -294,41 +369,16 @@ class Game:
             self.player_can_shoot = True
             
             # Stop heartbeat and start boss battle music (only once)
-            if not hasattr(self, 'boss_music_started'):
-                pygame.mixer.music.stop()
+            if not self.boss_music_started:
+                stop_music()
                 if ENABLE_AUDIO:
                     try:
-                        pygame.mixer.music.load('assets/audio/boss_battle.wav')
-                        pygame.mixer.music.set_volume(0.6)  # 60% volume
-                        pygame.mixer.music.play(-1)  # Loop indefinitely
+                        play_music('assets/audio/boss_battle.wav', 0.6)
                         self.boss_music_started = True  # Flag to prevent restarting
-                        print("Boss battle music started")
+                        log.debug("Boss battle music started")
                     except:
                         pass  # Continue without music if file not found
 
-    def load_level_background(self):
-        """Load the background image for the current level"""
-        if self.current_level in LEVEL_CONFIGS:
-            bg_path = LEVEL_CONFIGS[self.current_level]['background']
-            try:
-                self.background = pygame.image.load(bg_path)
-                self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-            except:
-                # Fallback to solid color background
-                self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                if self.current_level == 1:
-                    self.background.fill((20, 20, 40))  # Dark blue for EC2
-                elif self.current_level == 2:
-                    self.background.fill((40, 20, 40))  # Dark purple for DynamoDB
-                elif self.current_level == 3:
-                    self.background.fill((40, 40, 20))  # Dark yellow for Lambda
-                elif self.current_level == 4:
-                    self.background.fill((20, 20, 20))  # Dark gray for boss
-                else:
-                    self.background.fill(BLACK)
-        else:
-            self.background = None
-    
     def create_enemies(self):
         """Create enemies based on current level"""
         if self.current_level == 1:
@@ -338,8 +388,7 @@ class Game:
                     x = 100 + col * 140  # Normal spacing for 96x96 sprites
                     y = 80 + row * 120   # Increased gap between rows from 90 to 120
                     enemy = Enemy(x, y, level=1)
-                    self.enemies.add(enemy)
-                    self.all_sprites.add(enemy)
+                    self.entities.add(enemy)
                     
         elif self.current_level == 2:
             # Level 2: 3 rows of 4 DynamoDB instances (12 total DynamoDB enemies)
@@ -348,8 +397,7 @@ class Game:
                     x = 150 + col * 160  # Normal spacing for 96x96 sprites
                     y = 80 + row * 130   # Increased gap between rows from 100 to 130
                     enemy = DynamoDBEnemy(x, y)
-                    self.enemies.add(enemy)
-                    self.all_sprites.add(enemy)
+                    self.entities.add(enemy)
                     
         elif self.current_level == 3:
             # Level 3: 3 rows of 5 Lambda functions (15 total Lambda enemies)
@@ -362,8 +410,7 @@ class Game:
                     x = 120 + col * 150  # Spacing for Lambda functions
                     y = 80 + row * 120   # Vertical spacing
                     enemy = LambdaEnemy(x, y)
-                    self.enemies.add(enemy)
-                    self.all_sprites.add(enemy)
+                    self.entities.add(enemy)
                     
         elif self.current_level == 4:
             # Level 4: Boss level - CloudFormation
@@ -371,6 +418,13 @@ class Game:
             pass
     
     def handle_events(self):
+        # Start a requested profile capture once its level is reached; end captures whose time is up
+        if self.profile_request and self.profile_request[1] in (None, self.current_level):
+            self.start_profile(self.profile_request[0])
+            self.profile_request = None
+        if profile_capture.expired():
+            self.stop_profile()
+        
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.game_over = True
@@ -380,18 +434,37 @@ class Game:
                     self.cleanup_audio()  # Clean up audio before exit
                     self.game_over = True
                     return False
+                elif event.key == pygame.K_F10:
+                    # Start/stop recording a frame timeline (written when stopped)
+                    tracer.toggle()
+                elif event.key == pygame.K_F11:
+                    # Show/hide the entity and surface memory overlay
+                    diagnostics.toggle()
+                elif event.key == pygame.K_F9:
+                    # Start/stop a cProfile capture of update and draw
+                    if profile_capture.active:
+                        self.stop_profile()
+                    else:
+                        self.start_profile(PROFILE_SECONDS)
+            elif event.type == pygame.WINDOWFOCUSLOST and self.autopilot is None:
+                self.window_focused = False
+                cpu_meter.enter("gameplay (unfocused)")
+            elif event.type == pygame.WINDOWFOCUSGAINED:
+                self.window_focused = True
+                cpu_meter.enter("gameplay")
         
-        # Handle continuous shooting (moved outside event loop)
+        return True
+    
+    def handle_shooting(self):
+        """Handle continuous shooting (polled once per simulation tick)"""
         # Only process shooting if player is allowed to shoot
         if self.player_can_shoot:
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_SPACE]:
+            if self.input_keys[pygame.K_SPACE]:
                 # Player shooting (continuous when space held)
                 lasers = self.player.shoot()
                 if lasers:  # Now returns a list
                     for laser in lasers:
                         self.player_lasers.add(laser)
-                        self.all_sprites.add(laser)
                     self.play_sound('shoot')  # Play shoot sound
                     
                     # Side ships also shoot (synchronized with player)
@@ -399,16 +472,36 @@ class Game:
                         side_laser = side_ship.shoot()
                         if side_laser:
                             self.player_lasers.add(side_laser)
-                            self.all_sprites.add(side_laser)
-        
-        return True
+    
+    def simulation_tick(self):
+        """Advance the simulation one fixed tick (on the main thread or the simulation thread)"""
+        tick_jitter.tick()
+        self.level_ticks += 1
+        self.total_ticks += 1
+        with tracer.span('simulation_tick', 'update'):
+            self.snapshot_positions()
+            self.handle_shooting()
+            profile_capture.call(self.update)
+            if state_hasher.enabled:
+                state_hasher.tick(self)
+    
+    def tick_limit_reached(self):
+        return self.tick_limit is not None and self.total_ticks >= self.tick_limit
+    
+    def snapshot_positions(self):
+        """Remember where every drawn sprite is before a simulation tick (for interpolation)"""
+        positions = self.previous_positions
+        positions.clear()
+        for entities in self.entities.kinds.values():
+            for entity in entities.entities:
+                positions[entity] = entity.rect.topleft
     
     def update(self):
         # Handle boss intro sequence
         if self.boss_intro_active:
             self.update_boss_intro()
             # Allow player movement during intro
-            self.player.update()
+            self.player.update(self.input_keys)
             # Update boss for fade-in effect
             if self.boss:
                 self.boss.update()
@@ -419,7 +512,7 @@ class Game:
             self.boss_explosion_timer += 1
             
             # Allow player movement during explosion
-            self.player.update()
+            self.player.update(self.input_keys)
             
             # Update boss explosion effects
             if self.boss:
@@ -431,20 +524,16 @@ class Game:
                 self.game_over = True
                 self.game_over_reason = "CloudFormation Boss Defeated!"
                 # Stop explosion sound
-                pygame.mixer.music.stop()
+                stop_music()
             return  # Don't update other game elements during explosion
         
-        # Update all sprites (except boss - boss updates in enemy loop)
-        for sprite in self.all_sprites:
-            if not isinstance(sprite, CloudFormationBoss):
-                sprite.update()
+        phase = tracer.now()
         
-        # Update Lambda group movement (needed for proper Lambda movement)
-        from src.sprites import LambdaEnemy
-        LambdaEnemy.update_group_movement()
-        self.power_ups.update()
-        self.laser_beams.update()
-        self.boss_lasers.update()
+        # Move the player and everything that only moves (each entity is updated once per tick)
+        self.player.update(self.input_keys)
+        for entities in (self.player_lasers, self.enemy_lasers, self.asteroids, self.power_ups, self.laser_beams, self.boss_lasers):
+            for entity in entities:
+                entity.update()
         
         # Periodic audio cleanup to prevent overflow
         self.periodic_audio_cleanup()
@@ -453,10 +542,12 @@ class Game:
         for side_ship in self.side_ships:
             side_ship.update(self.player.rect)
         
+        phase = tracer.complete('update.move', 'update', phase)
+        
         # Burn credits based on number of enemies (AWS services running)
         self.credit_timer += 1
-        if self.credit_timer >= 60:  # Every second (60 FPS)
-            enemy_count = len(self.enemies)
+        if self.credit_timer >= SIMULATION_HZ:  # Every second
+            enemy_count = self.entities.enemy_count()
             if self.current_level in LEVEL_CONFIGS:
                 credits_to_burn = enemy_count * LEVEL_CONFIGS[self.current_level]['credit_burn_rate']
             else:
@@ -472,102 +563,98 @@ class Game:
                 self.game_over_reason = "You ran out of AWS Credits!"
                 return
         
-        # Check if enemies need to change direction or move down (not for Lambda)
-        if self.current_level != 3:  # Only for EC2 and DynamoDB levels
-            move_down = False
-            for enemy in self.enemies:
-                if enemy.rect.right >= SCREEN_WIDTH or enemy.rect.left <= 0:
-                    move_down = True
-                    break
+        phase = tracer.complete('update.credits', 'update', phase)
         
-        # Enemy shooting and special abilities
-        for enemy in self.enemies:
-            # CloudFormation boss abilities (handle boss update here only)
-            if isinstance(enemy, CloudFormationBoss):
-                ability_result = enemy.update()  # Boss updates only here
-                if ability_result:
-                    if isinstance(ability_result, BossLaser):
-                        self.boss_lasers.add(ability_result)
-                        self.play_sound('laser')
-                    elif isinstance(ability_result, (Enemy, DynamoDBEnemy, LambdaEnemy)):
-                        # Boss spawned a minion - set boss level mode for horizontal-only movement
-                        ability_result.set_boss_level_mode(True)
-                        self.enemies.add(ability_result)
-                        self.all_sprites.add(ability_result)
-            # Lambda enemies have special laser beam shooting
-            elif isinstance(enemy, LambdaEnemy):
-                laser_beam = enemy.update()
-                if laser_beam:
-                    self.laser_beams.add(laser_beam)
-                    self.play_sound('laser')  # Play laser sound
-            else:
-                # Regular laser shooting for EC2 and DynamoDB
-                laser = enemy.shoot()
-                if laser:
-                    self.enemy_lasers.add(laser)
-                    self.all_sprites.add(laser)
-            
-            # DynamoDB asteroid shooting
-            if isinstance(enemy, DynamoDBEnemy):
-                asteroids = enemy.shoot_asteroids()
-                for asteroid in asteroids:
-                    self.asteroids.add(asteroid)
-                    self.all_sprites.add(asteroid)
+        # Enemy movement, shooting and special abilities (one list per enemy kind)
+        # EC2 enemies shoot regular lasers
+        for enemy in self.entities['ec2']:
+            enemy.update()
+            laser = enemy.shoot()
+            if laser:
+                self.enemy_lasers.add(laser)
+        
+        phase = tracer.complete('update.ec2', 'update', phase)
         
-        # Update Lambda group movement coordination (only for Level 3)
-        if self.current_level == 3:
-            LambdaEnemy.update_group_movement()
+        # DynamoDB enemies shoot asteroids when charged
+        for enemy in self.entities['dynamodb']:
+            enemy.update()
+            for asteroid in enemy.shoot_asteroids():
+                self.asteroids.add(asteroid)
+        
+        phase = tracer.complete('update.dynamodb', 'update', phase)
+        
+        # Lambda enemies have special laser beam shooting and move as a group
+        for enemy in self.entities['lambda']:
+            laser_beam = enemy.update()
+            if laser_beam:
+                self.laser_beams.add(laser_beam)
+                self.play_sound('laser')  # Play laser sound
+        LambdaEnemy.update_group_movement()
+        
+        phase = tracer.complete('update.lambda', 'update', phase)
+        
+        # CloudFormation boss abilities
+        for boss in self.entities['boss']:
+            ability_result = boss.update()
+            if ability_result:
+                telemetry.incr(f"boss.ability.{ability_result.kind}")
+                tracer.instant('boss_ability', 'boss', {'kind': ability_result.kind})
+                if ability_result.kind == 'boss_laser':
+                    self.play_sound('laser')
+                else:
+                    # Boss spawned a minion - set boss level mode for horizontal-only movement
+                    ability_result.set_boss_level_mode(True)
+                    if self.endless is not None and self.entities.enemy_count() >= ENDLESS_MAX_ENEMIES:
+                        continue  # Endless mode is at its enemy limit: the spawn fizzles
+                self.entities.add(ability_result)
+        
+        phase = tracer.complete('update.boss', 'update', phase)
         
         # Check for collisions
         # Player lasers hitting enemies
-        hits = pygame.sprite.groupcollide(self.enemies, self.player_lasers, False, True)
-        for enemy, laser_list in hits.items():
-            if enemy.take_damage():  # Enemy destroyed
-                # Special handling for boss
-                if isinstance(enemy, CloudFormationBoss):
-                    # Start boss explosion sequence
-                    self.boss_exploding = True
-                    self.boss_explosion_timer = 0
-                    self.boss.start_explosion()
+        for enemies in self.entities.enemy_lists:
+            hits = collide_shots(enemies, self.player_lasers)
+            for enemy in hits:
+                if enemy.take_damage():  # Enemy destroyed
+                    # Special handling for boss (endless mode bosses go down like the other enemies)
+                    if enemy.kind == 'boss' and self.endless is None:
+                        # Start boss explosion sequence
+                        self.boss_exploding = True
+                        self.boss_explosion_timer = 0
+                        self.boss.start_explosion()
                     
-                    # Loop boss explosion sound for 6 seconds
-                    pygame.mixer.music.stop()
-                    if ENABLE_AUDIO:
-                        try:
-                            pygame.mixer.music.load('assets/audio/boss_explode.wav')
-                            pygame.mixer.music.set_volume(1.0)  # 100% volume
-                            pygame.mixer.music.play(-1)  # Loop indefinitely (will be stopped after 6 seconds)
-                        except:
-                            pass  # Continue without explosion sound if file not found
-                else:
-                    # Regular enemy destruction
-                    # Power-up drop chance: 5% normal, +20% during boss level (25% total)
-                    base_chance = 0.05  # 5% base chance
-                    boss_bonus = 0.20 if self.current_level == 4 else 0.0  # +20% during boss level
-                    power_up_chance = base_chance + boss_bonus
+                        # Loop boss explosion sound for 6 seconds
+                        stop_music()
+                        if ENABLE_AUDIO:
+                            try:
+                                play_music('assets/audio/boss_explode.wav')  # Stopped after 6 seconds
+                            except:
+                                pass  # Continue without explosion sound if file not found
+                    else:
+                        # Regular enemy destruction
+                        # Power-up drop chance: 5% normal, +20% during boss level (25% total)
+                        base_chance = 0.05  # 5% base chance
+                        boss_bonus = 0.20 if self.current_level == 4 else 0.0  # +20% during boss level
+                        power_up_chance = base_chance + boss_bonus
                     
-                    if random.random() < power_up_chance:
-                        power_types = ['s3', 'load_balancer', 'auto_scaling']
-                        power_type = random.choice(power_types)
-                        power_up = PowerUp(enemy.rect.centerx, enemy.rect.centery, power_type)
-                        self.power_ups.add(power_up)
+                        if random.random() < power_up_chance:
+                            power_types = ['s3', 'load_balancer', 'auto_scaling']
+                            power_type = random.choice(power_types)
+                            power_up = PowerUp(enemy.rect.centerx, enemy.rect.centery, power_type)
+                            self.power_ups.add(power_up)
                     
-                    enemy.kill()
-                    self.play_sound('enemy_hit')
+                        enemy.kill()
+                        self.play_sound('enemy_hit')
+        
+        phase = tracer.complete('collide.player_lasers_enemies', 'collision', phase)
         
         # Player collecting power-ups
         power_up_hits = pygame.sprite.spritecollide(self.player, self.power_ups, True)
         for power_up in power_up_hits:
             self.play_sound('power_up')  # Play power-up collection sound
-            if power_up.power_type == 'auto_scaling':
-                # Create side ships if not already present
-                if len(self.side_ships) == 0:
-                    left_ship = SideShip(self.player.rect.x - 80, self.player.rect.y, 'left')
-                    right_ship = SideShip(self.player.rect.x + 80, self.player.rect.y, 'right')
-                    self.side_ships.add(left_ship, right_ship)
-                    # Don't add to all_sprites to avoid update() argument issues
-            else:
-                self.player.activate_power_up(power_up.power_type)
+            self.collect_power_up(power_up.power_type)
+        
+        phase = tracer.complete('collide.power_ups', 'collision', phase)
         
         # Side ships taking damage
         for side_ship in self.side_ships:
@@ -578,6 +665,8 @@ class Game:
             if pygame.sprite.spritecollide(side_ship, self.asteroids, True):
                 side_ship.kill()
         
+        phase = tracer.complete('collide.side_ships', 'collision', phase)
+        
         # Enemy lasers hitting player - costs credits!
         hits = pygame.sprite.spritecollide(self.player, self.enemy_lasers, True)
         if hits:
@@ -591,6 +680,8 @@ class Game:
                     self.game_over_reason = "Enemy attacks drained your AWS Credits!"
                     return
         
+        phase = tracer.complete('collide.enemy_lasers_player', 'collision', phase)
+        
         # Asteroids hitting player - costs more credits!
         hits = pygame.sprite.spritecollide(self.player, self.asteroids, True)
         if hits:
@@ -604,12 +695,15 @@ class Game:
                     self.game_over_reason = "Asteroid impact drained your AWS Credits!"
                     return
         
+        phase = tracer.complete('collide.asteroids_player', 'collision', phase)
+        
         # Player lasers hitting asteroids (can destroy them)
-        pygame.sprite.groupcollide(self.asteroids, self.player_lasers, True, True)
+        collide_shots(self.asteroids, self.player_lasers, kill_targets=True)
+        
+        phase = tracer.complete('collide.player_lasers_asteroids', 'collision', phase)
         
         # Player hit by laser beams (Lambda attacks)
-        laser_beam_hits = pygame.sprite.spritecollide(self.player, self.laser_beams, False)
-        if laser_beam_hits:
+        if self.beam_hits(self.player.rect, self.laser_beams):
             if self.player.take_hit():  # Only process hit if not invincible
                 self.player.credits -= HIT_PENALTY
                 self.play_sound('player_hit')
@@ -620,18 +714,20 @@ class Game:
                     self.game_over_reason = "Lambda laser beam drained your AWS Credits!"
                     return
         
+        phase = tracer.complete('collide.laser_beams_player', 'collision', phase)
+        
         # Side ships hit by laser beams (Lambda attacks)
         for side_ship in self.side_ships:
-            side_ship_beam_hits = pygame.sprite.spritecollide(side_ship, self.laser_beams, False)
-            if side_ship_beam_hits:
+            if self.beam_hits(side_ship.rect, self.laser_beams):
                 # Side ship destroyed by Lambda laser beam
                 side_ship.kill()
                 self.play_sound('player_hit')  # Same sound as main player hit
                 # No credit penalty for losing side ships (global rule)
         
+        phase = tracer.complete('collide.laser_beams_side_ships', 'collision', phase)
+        
         # Player hit by boss laser beams
-        boss_laser_hits = pygame.sprite.spritecollide(self.player, self.boss_lasers, False)
-        if boss_laser_hits:
+        if self.beam_hits(self.player.rect, self.boss_lasers):
             if self.player.take_hit():  # Only process hit if not invincible
                 self.player.credits -= HIT_PENALTY * 2  # Boss lasers do double damage
                 self.play_sound('player_hit')
@@ -642,62 +738,84 @@ class Game:
                     self.game_over_reason = "CloudFormation laser obliterated your AWS Credits!"
                     return
         
+        phase = tracer.complete('collide.boss_lasers_player', 'collision', phase)
+        
         # Side ships hit by boss laser beams (Auto Scaling duplicates)
         for side_ship in self.side_ships:
-            side_ship_laser_hits = pygame.sprite.spritecollide(side_ship, self.boss_lasers, False)
-            if side_ship_laser_hits:
+            if self.beam_hits(side_ship.rect, self.boss_lasers):
                 # Side ship takes damage and is destroyed by boss laser
                 side_ship.kill()
                 self.play_sound('player_hit')  # Same sound as main player hit
                 # No credit penalty for losing side ships (global rule)
         
+        tracer.complete('collide.boss_lasers_side_ships', 'collision', phase)
+        
+        # Endless mode has no win condition, only the next wave
+        if self.endless is not None:
+            self.endless.update(self)
         # Check win condition - robust boss level handling
-        if len(self.enemies) == 0:
+        elif self.entities.enemy_count() == 0:
             if self.current_level == 4:
                 # Level 4 (boss level) - only win if we're not in intro phase
                 if not self.boss_intro_active:
-                    if hasattr(self, 'boss') and self.boss is not None:
+                    if self.boss is not None:
                         # Boss exists but enemies is 0 - this shouldn't happen during normal gameplay
-                        print("Boss defeated! Player wins!")  # Debug
+                        log.info("Boss defeated, player wins")
                         self.game_over = True
                         self.win = True
                     else:
                         # No boss exists and no enemies - something went wrong, restart boss
-                        print("Boss level error - restarting boss intro")  # Debug
+                        log.warning("Boss level error - restarting boss intro")
                         self.start_boss_intro()
                 else:
                     # Boss intro is active, this is normal - don't trigger win
-                    print(f"Boss intro active, enemies: {len(self.enemies)}")  # Debug
+                    log.debug("Boss intro active", interval=1.0, enemies=self.entities.enemy_count())
             elif self.current_level < MAX_LEVELS:
-                print(f"Level {self.current_level} complete! Advancing to level {self.current_level + 1}")  # Debug
+                log.info("Level complete", level=self.current_level, next_level=self.current_level + 1)
+                tracer.instant('level_complete', 'level', {'level': self.current_level})
                 self.level_complete = True
             else:
-                print("All levels complete! Player wins!")  # Debug
+                log.info("All levels complete, player wins")
                 self.game_over = True
                 self.win = True
                 
+    def collect_power_up(self, power_type):
+        """Give the player a power-up ('s3', 'load_balancer' or 'auto_scaling')"""
+        if power_type == 'auto_scaling':
+            # Create side ships if not already present
+            if len(self.side_ships) == 0:
+                left_ship = SideShip(self.player.rect.x - 80, self.player.rect.y, 'left')
+                right_ship = SideShip(self.player.rect.x + 80, self.player.rect.y, 'right')
+                self.side_ships.add(left_ship, right_ship)
+        else:
+            self.player.activate_power_up(power_type)
+    
+    def beam_hits(self, rect, beams):
+        """Return True if rect is inside any beam's x-interval (beams reach the bottom of the screen)"""
+        for beam in beams:
+            if beam.hits(rect):
+                return True
+        return False
+                
     def next_level(self):
         """Advance to the next level"""
         if self.current_level < MAX_LEVELS:
             self.current_level += 1
             self.level_complete = False
-            print(f"Advancing to level {self.current_level}")  # Debug
+            self.level_ticks = 0
+            log.info("Advancing to level", level=self.current_level)
+            tracer.instant('level_start', 'level', {'level': self.current_level})
             
             # Clear all projectiles
-            for laser in self.enemy_lasers:
-                laser.kill()
-            for laser in self.player_lasers:
-                laser.kill()
-            for asteroid in self.asteroids:
-                asteroid.kill()
-            for beam in self.laser_beams:
-                beam.kill()
-            for boss_laser in self.boss_lasers:
-                boss_laser.kill()
+            self.enemy_lasers.empty()
+            self.player_lasers.empty()
+            self.asteroids.empty()
+            self.laser_beams.empty()
+            self.boss_lasers.empty()
             
             # Clear all enemies before creating new ones
-            for enemy in self.enemies:
-                enemy.kill()
+            for enemies in self.entities.enemy_lists:
+                enemies.empty()
             
             # Reset boss state for new level
             self.boss = None
@@ -709,7 +827,7 @@ class Game:
             
             # Create enemies or start boss intro based on level
             if self.current_level == 4:
-                print("Starting boss level...")  # Debug
+                log.debug("Starting boss level")
                 self.start_boss_intro()
             else:
                 self.create_enemies()
@@ -717,9 +835,9 @@ class Game:
             return True
         return False
     
-    def draw_boss_health_bar(self):
+    def draw_boss_health_bar(self, hud):
         """Draw the boss health bar"""
-        if self.boss and self.current_level == 4 and not self.boss_exploding:
+        if hud.boss_health is not None and hud.level == 4 and not hud.boss_exploding:
             # Health bar position (top center of screen)
             bar_x = (SCREEN_WIDTH - BOSS_HEALTH_BAR_WIDTH) // 2
             bar_y = 10
@@ -729,7 +847,7 @@ class Game:
             pygame.draw.rect(self.screen, RED, background_rect)
             
             # Health bar (green to red gradient based on health)
-            health_percent = self.boss.health / self.boss.max_health
+            health_percent = hud.boss_health / hud.boss_max_health
             health_width = int(BOSS_HEALTH_BAR_WIDTH * health_percent)
             
             if health_width > 0:
@@ -748,188 +866,92 @@ class Game:
             pygame.draw.rect(self.screen, WHITE, background_rect, 2)
             
             # Boss name only (no health numbers)
-            boss_text = self.font_small.render("CloudFormation Boss", False, WHITE)
+            boss_text = self.render_text(self.font_small, "CloudFormation Boss", WHITE)
             text_rect = boss_text.get_rect(center=(SCREEN_WIDTH // 2, bar_y - 15))
             self.screen.blit(boss_text, text_rect)
 
-    def draw(self):
-        
-        # Draw AWS-themed metrics
-        credits_text = self.font_medium.render(f"{LIVES_NAME}: ${self.player.credits:,}", False, AWS_ORANGE)
-        level_text = self.font_medium.render(f"Level: {self.current_level}", False, AWS_BLUE)
-        
-        if self.current_level == 1:
-            enemies_text = self.font_small.render(f"EC2 Instances: {len(self.enemies)}", False, WHITE)
-        elif self.current_level == 2:
-            enemies_text = self.font_small.render(f"DynamoDB Tables: {len(self.enemies)}", False, WHITE)
+    def victory_screen_layers(self, all_levels_complete):
+        """Static text of the victory screen (two variants)"""
+        if all_levels_complete:
+            title, subtitle = "Congratulations!", "All Levels Complete!"
         else:
-            enemies_text = self.font_small.render(f"Services: {len(self.enemies)}", False, WHITE)
-            
-        if self.current_level in LEVEL_CONFIGS:
-            burn_rate = len(self.enemies) * LEVEL_CONFIGS[self.current_level]['credit_burn_rate']
-        else:
-            burn_rate = len(self.enemies) * CREDIT_BURN_RATE
-        burn_text = self.font_small.render(f"Burn Rate: ${burn_rate}/sec", False, RED if burn_rate > 0 else WHITE)
-        
-        self.screen.blit(credits_text, (20, 20))
-        self.screen.blit(level_text, (20, 50))
-        self.screen.blit(enemies_text, (20, 80))
-        self.screen.blit(burn_text, (20, 110))
-        
-        # Draw power-up status
-        power_up_y = 520
-        if self.player.s3_power:
-            s3_text = self.font_tiny.render(f"S3 Shield: {self.player.s3_timer//60 + 1}s", False, GREEN)
-            self.screen.blit(s3_text, (20, power_up_y))
-            power_up_y += 20
-            
-        if self.player.load_balancer_power:
-            lb_text = self.font_tiny.render(f"Load Balancer: {self.player.load_balancer_timer//60 + 1}s", False, BLUE)
-            self.screen.blit(lb_text, (20, power_up_y))
-            power_up_y += 20
-            
-        if len(self.side_ships) > 0:
-            as_text = self.font_tiny.render(f"Auto Scaling: {len(self.side_ships)} ships", False, YELLOW)
-            self.screen.blit(as_text, (20, power_up_y))
-        
-        pygame.display.flip()
+            title, subtitle = "You Win!", "Victory Achieved!"
+        return [
+            (self.font_large, title, GREEN, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100)),
+            (self.font_medium, subtitle, WHITE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50)),
+            (self.font_tiny, "Press ENTER to play again or ESC to quit", WHITE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100))
+        ]
+    
+    def next_level_screen_layers(self):
+        """Static text of the level complete screen"""
+        return [
+            (self.font_small, "Press ENTER to continue", WHITE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80))
+        ]
+    
+    def game_over_screen_layers(self):
+        """Static text of the game over screen"""
+        return [
+            (self.font_large, "GAME OVER", RED, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100)),
+            (self.font_tiny, "Press ENTER to return to menu", WHITE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 120))
+        ]
+    
+    def prebuild_screens(self):
+        """Composite every transition/end screen up front so showing one never touches the disk (a generator: one step per screen)"""
+        self.compositor.screen('victory', self.victory_screen_layers(True), variant=True)
+        yield
+        self.compositor.screen('victory', self.victory_screen_layers(False), variant=False)
+        yield
+        self.compositor.screen('next_level', self.next_level_screen_layers())
+        yield
+        self.compositor.screen('game_over', self.game_over_screen_layers())
+        yield
+    
+    def blit_centered_text(self, font, text, color, center):
+        text_surface = font.render(text, False, color)
+        self.screen.blit(text_surface, text_surface.get_rect(center=center))
     
     def show_victory_screen(self):
         """Show victory screen with background"""
-        # Load victory background
-        try:
-            victory_bg = pygame.image.load('assets/images/bg/winner_bg.jpg')
-            victory_bg = pygame.transform.scale(victory_bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.screen.blit(victory_bg, (0, 0))
-        except:
-            # Try PNG format if JPG fails
-            try:
-                victory_bg = pygame.image.load('assets/images/bg/winner_bg.png')
-                victory_bg = pygame.transform.scale(victory_bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                self.screen.blit(victory_bg, (0, 0))
-            except:
-                # Fallback to black background
-                self.screen.fill(BLACK)
-        
-        # Create semi-transparent overlay for better text readability
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(120)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Victory title
-        if self.current_level >= MAX_LEVELS:
-            title_text = self.font_large.render("Congratulations!", False, GREEN)
-            subtitle_text = self.font_medium.render("All Levels Complete!", False, WHITE)
-        else:
-            title_text = self.font_large.render("You Win!", False, GREEN)
-            subtitle_text = self.font_medium.render("Victory Achieved!", False, WHITE)
-        
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
-        subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-        self.screen.blit(title_text, title_rect)
-        self.screen.blit(subtitle_text, subtitle_rect)
+        all_levels_complete = self.current_level >= MAX_LEVELS
+        background = self.compositor.screen('victory', self.victory_screen_layers(all_levels_complete), variant=all_levels_complete)
+        self.screen.blit(background, (0, 0))
         
         # Final stats
-        final_credits = self.font_small.render(f"Final AWS Credits: ${self.player.credits:,}", False, AWS_ORANGE)
-        credits_rect = final_credits.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10))
-        self.screen.blit(final_credits, credits_rect)
-        
-        level_text = self.font_small.render(f"Reached Level: {self.current_level}", False, AWS_BLUE)
-        level_rect = level_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40))
-        self.screen.blit(level_text, level_rect)
-        
-        # Instructions
-        instruction_text = self.font_tiny.render("Press ENTER to play again or ESC to quit", False, WHITE)
-        instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100))
-        self.screen.blit(instruction_text, instruction_rect)
+        self.blit_centered_text(self.font_small, f"Final AWS Credits: ${self.player.credits:,}", AWS_ORANGE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10))
+        self.blit_centered_text(self.font_small, f"Reached Level: {self.current_level}", AWS_BLUE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40))
         
         pygame.display.flip()
 
     def show_next_level_screen(self):
         """Show next level screen with background and remaining credits"""
-        # Load next level background - try multiple formats
-        try:
-            next_level_bg = pygame.image.load('assets/images/bg/next_level_bg.png')
-            next_level_bg = pygame.transform.scale(next_level_bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.screen.blit(next_level_bg, (0, 0))
-        except:
-            try:
-                next_level_bg = pygame.image.load('assets/images/bg/next_level_bg.jpg')
-                next_level_bg = pygame.transform.scale(next_level_bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                self.screen.blit(next_level_bg, (0, 0))
-            except:
-                # Fallback to black background
-                self.screen.fill(BLACK)
-        
-        # Create semi-transparent overlay for better text readability
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(120)  # Lighter overlay than game over screen
-        self.screen.blit(overlay, (0, 0))
+        background = self.compositor.screen('next_level', self.next_level_screen_layers())
+        self.screen.blit(background, (0, 0))
         
         # Level Complete title
-        title_text = self.font_large.render(f"Level {self.current_level} Complete!", False, GREEN)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
-        self.screen.blit(title_text, title_rect)
+        self.blit_centered_text(self.font_large, f"Level {self.current_level} Complete!", GREEN, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
         
         # Remaining credits display
-        credits_text = self.font_medium.render(f"Remaining AWS Credits: ${self.player.credits:,}", False, AWS_ORANGE)
-        credits_rect = credits_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40))
-        self.screen.blit(credits_text, credits_rect)
+        self.blit_centered_text(self.font_medium, f"Remaining AWS Credits: ${self.player.credits:,}", AWS_ORANGE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40))
         
         # Next level info
-        next_level_text = self.font_medium.render(f"Preparing Level {self.current_level + 1}...", False, AWS_BLUE)
-        next_level_rect = next_level_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-        self.screen.blit(next_level_text, next_level_rect)
-        
-        # Instructions
-        instruction_text = self.font_small.render("Press ENTER to continue", False, WHITE)
-        instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80))
-        self.screen.blit(instruction_text, instruction_rect)
+        self.blit_centered_text(self.font_medium, f"Preparing Level {self.current_level + 1}...", AWS_BLUE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
         
         pygame.display.flip()
 
     def show_game_over_screen(self):
         """Show game over screen with background and reason"""
-        # Load game over background
-        try:
-            game_over_bg = pygame.image.load('assets/images/bg/game_over_bg.jpg')
-            game_over_bg = pygame.transform.scale(game_over_bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.screen.blit(game_over_bg, (0, 0))
-        except:
-            # Fallback to black background
-            self.screen.fill(BLACK)
-        
-        # Create semi-transparent overlay for better text readability
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(150)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Game Over title
-        title_text = self.font_large.render("GAME OVER", False, RED)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
-        self.screen.blit(title_text, title_rect)
+        background = self.compositor.screen('game_over', self.game_over_screen_layers())
+        self.screen.blit(background, (0, 0))
         
         # Game over reason
-        reason_text = self.font_medium.render(self.game_over_reason, False, WHITE)
-        reason_rect = reason_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40))
-        self.screen.blit(reason_text, reason_rect)
+        self.blit_centered_text(self.font_medium, self.game_over_reason, WHITE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40))
         
         # Final stats
-        final_credits = self.font_small.render(f"Final Credits: ${self.player.credits:,}", False, AWS_ORANGE)
-        credits_rect = final_credits.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-        self.screen.blit(final_credits, credits_rect)
-        
-        level_text = self.font_small.render(f"Reached Level: {self.current_level}", False, AWS_BLUE)
-        level_rect = level_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-        self.screen.blit(level_text, level_rect)
-        
-        # Instructions
-        instruction_text = self.font_tiny.render("Press ENTER to return to menu", False, WHITE)
-        instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 120))
-        self.screen.blit(instruction_text, instruction_rect)
+        self.blit_centered_text(self.font_small, f"Final Credits: ${self.player.credits:,}", AWS_ORANGE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
+        if self.endless is not None:
+            self.blit_centered_text(self.font_small, f"Reached Wave: {self.endless.wave}", AWS_BLUE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
+        else:
+            self.blit_centered_text(self.font_small, f"Reached Level: {self.current_level}", AWS_BLUE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
         
         pygame.display.flip()
 
@@ -944,111 +966,206 @@ class Game:
                                    SCREEN_HEIGHT // 2 + 50))
         pygame.display.flip()
     
-    def draw(self):
-        """Draw all game elements"""
+    def draw(self, alpha=1.0):
+        """Draw all game elements, interpolating sprites alpha of the way into the current tick"""
+        self.render_snapshot(self.build_snapshot(), alpha)
+    
+    def build_snapshot(self):
+        """Capture what the renderer needs from the current tick as an immutable RenderSnapshot"""
+        entities = self.entities
+        entries = self.snapshot_entries
+        enemies = []
+        for kind in ENEMY_KINDS:
+            enemies.extend(entries(entities[kind]))
+        projectiles = []
+        for kind in ('asteroid', 'enemy_laser', 'player_laser'):
+            projectiles.extend(entries(entities[kind]))
+        explosions = []
+        if self.boss and self.boss.exploding:
+            for image, rect in self.boss.explosion_blits():
+                explosions.append((image, rect.x, rect.y, rect.x, rect.y))
+        
+        # Same order as RENDER_LAYERS
+        layers = (
+            ('player', tuple(entries(entities['player']))),
+            ('enemies', tuple(enemies)),
+            ('projectiles', tuple(projectiles)),
+            ('side_ships', tuple(entries(self.side_ships))),
+            ('power_ups', tuple(entries(self.power_ups))),
+            ('laser_beams', tuple(entries(self.laser_beams))),
+            ('boss_lasers', tuple(entries(self.boss_lasers))),
+            ('explosions', tuple(explosions))
+        )
+        
+        boss = self.boss
+        hud = HudState(
+            level=self.current_level,
+            credits=self.player.credits,
+            enemy_count=entities.enemy_count(),
+            boss_health=boss.health if boss else None,
+            boss_max_health=boss.max_health if boss else None,
+            boss_exploding=self.boss_exploding,
+            s3_timer=self.player.s3_timer,
+            load_balancer_timer=self.player.load_balancer_timer,
+            side_ships=len(self.side_ships),
+            wave=self.endless.wave if self.endless else None,
+            peak_entities=self.endless.peaks['entities'] if self.endless else None
+        )
+        return RenderSnapshot(time.perf_counter(), self.background, layers, hud)
+    
+    def snapshot_entries(self, entities):
+        """Return (image, x, y, previous_x, previous_y) for each entity of a list"""
+        previous_positions = self.previous_positions
+        entries = []
+        for entity in entities.entities:
+            x, y = entity.rect.topleft
+            previous_x, previous_y = previous_positions.get(entity, (x, y))
+            entries.append((entity.image, x, y, previous_x, previous_y))
+        return entries
+    
+    def render_snapshot(self, snapshot, alpha=1.0):
+        """Draw a snapshot, interpolating sprites alpha of the way from their previous positions"""
+        phase = tracer.now()
+        
         # Draw background
-        if self.background:
-            self.screen.blit(self.background, (0, 0))
+        if snapshot.background:
+            self.screen.blit(snapshot.background, (0, 0))
         else:
             self.screen.fill(BLACK)
         
-        # Draw all sprites
-        self.all_sprites.draw(self.screen)
-        self.side_ships.draw(self.screen)  # Draw side ships separately
-        self.power_ups.draw(self.screen)  # Draw power-ups on top
-        self.laser_beams.draw(self.screen)  # Draw laser beams on top
-        self.boss_lasers.draw(self.screen)  # Draw boss lasers on top
-        
-        # Draw boss explosions if boss is exploding
-        if self.boss and self.boss.exploding:
-            self.boss.draw_explosions(self.screen)
+        # Queue sprites per layer (RENDER_LAYERS sets the back-to-front order)
+        renderer = self.renderer
+        for layer, entries in snapshot.layers:
+            if alpha >= 1.0:
+                renderer.extend(layer, [(image, (x, y)) for image, x, y, previous_x, previous_y in entries])
+            else:
+                renderer.extend(layer, [(image, (round(previous_x + (x - previous_x) * alpha),
+                                                 round(previous_y + (y - previous_y) * alpha)))
+                                        for image, x, y, previous_x, previous_y in entries])
+        phase = tracer.complete('draw.queue', 'draw', phase)
+        renderer.flush(self.screen)
+        phase = tracer.now()
         
         # Draw boss health bar
-        self.draw_boss_health_bar()
+        self.draw_boss_health_bar(snapshot.hud)
         
         # Enhanced UI (no background panel)
-        self.draw_enhanced_ui()
+        self.draw_enhanced_ui(snapshot.hud)
         
         # Power-ups UI (left edge)
-        self.draw_power_ups_ui()
+        self.draw_power_ups_ui(snapshot.hud)
         
-        pygame.display.flip()
+        # Diagnostics overlay (right edge, F11)
+        if diagnostics.enabled:
+            self.draw_diagnostics()
+        tracer.complete('draw.hud', 'draw', phase)
+        
+        with tracer.span('display.flip', 'draw'):
+            pygame.display.flip()
+    
+    def render_text(self, font, text, color):
+        """Render HUD text through a cache so unchanged text is not re-rendered every frame"""
+        key = (font, text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= TEXT_CACHE_SIZE:
+                self.text_cache.clear()
+            surface = font.render(text, False, color)
+            self.text_cache[key] = surface
+        return surface
     
-    def draw_enhanced_ui(self):
+    def draw_diagnostics(self):
+        """Draw the latest diagnostics sample below the level name"""
+        y_offset = 80
+        for line in diagnostics.lines:
+            text = self.render_text(self.font_tiny, line, WHITE)
+            self.screen.blit(text, (SCREEN_WIDTH - text.get_width() - 20, y_offset))
+            y_offset += text.get_height() + 2
+    
+    def draw_enhanced_ui(self, hud):
         """Draw enhanced UI with detailed information - no background panel"""
         # AWS Credits (top-left)
-        credits_text = self.font_medium.render(f"AWS Credits: ${self.player.credits:,}", False, AWS_ORANGE)
+        credits_text = self.render_text(self.font_medium, f"AWS Credits: ${hud.credits:,}", AWS_ORANGE)
         self.screen.blit(credits_text, (20, 15))
         
         # Enemy count with specific names
-        enemy_count = len(self.enemies)
-        if self.current_level == 1:
-            enemies_text = self.font_small.render(f"EC2 Instances: {enemy_count}", False, WHITE)
-        elif self.current_level == 2:
-            enemies_text = self.font_small.render(f"DynamoDB Tables: {enemy_count}", False, WHITE)
-        elif self.current_level == 3:
-            enemies_text = self.font_small.render(f"Lambda Functions: {enemy_count}", False, WHITE)
-        elif self.current_level == 4:
-            if self.boss and not self.boss_exploding:
-                enemies_text = self.font_small.render(f"CloudFormation Boss: {enemy_count}", False, WHITE)
+        enemy_count = hud.enemy_count
+        if hud.level == 1:
+            enemies_text = self.render_text(self.font_small, f"EC2 Instances: {enemy_count}", WHITE)
+        elif hud.level == 2:
+            enemies_text = self.render_text(self.font_small, f"DynamoDB Tables: {enemy_count}", WHITE)
+        elif hud.level == 3:
+            enemies_text = self.render_text(self.font_small, f"Lambda Functions: {enemy_count}", WHITE)
+        elif hud.level == 4:
+            if hud.boss_health is not None and not hud.boss_exploding:
+                enemies_text = self.render_text(self.font_small, f"CloudFormation Boss: {enemy_count}", WHITE)
             else:
-                enemies_text = self.font_small.render(f"Boss Defeated!", False, GREEN)
+                enemies_text = self.render_text(self.font_small, f"Boss Defeated!", GREEN)
         else:
-            enemies_text = self.font_small.render(f"Services: {enemy_count}", False, WHITE)
+            enemies_text = self.render_text(self.font_small, f"Services: {enemy_count}", WHITE)
         
         self.screen.blit(enemies_text, (20, 45))
         
         # On-demand rate (total burn rate)
         total_burn_rate = enemy_count * CREDIT_BURN_RATE
-        if self.current_level == 4 and self.boss:
+        if hud.level == 4 and hud.boss_health is not None:
             total_burn_rate = LEVEL_CONFIGS[4]['credit_burn_rate']  # Boss has special burn rate
         
-        burn_rate_text = self.font_small.render(f"On-Demand Rate: ${total_burn_rate}/sec", False, RED)
+        burn_rate_text = self.render_text(self.font_small, f"On-Demand Rate: ${total_burn_rate}/sec", RED)
         self.screen.blit(burn_rate_text, (20, 70))
         
-        # Level indicator (top-right)
-        level_text = self.font_medium.render(f"Level {self.current_level}", False, AWS_BLUE)
+        # Level indicator (top-right; the wave in endless mode)
+        if hud.wave is not None:
+            level_text = self.render_text(self.font_medium, f"Wave {hud.wave}", AWS_BLUE)
+        else:
+            level_text = self.render_text(self.font_medium, f"Level {hud.level}", AWS_BLUE)
         level_rect = level_text.get_rect()
         self.screen.blit(level_text, (SCREEN_WIDTH - level_rect.width - 20, 15))
         
         # Current level name (top-right)
         level_names = {
+            ENDLESS_LEVEL: "Endless Mode",
             1: "EC2 Invasion",
             2: "DynamoDB Assault", 
             3: "Lambda Swarm",
             4: "CloudFormation Boss"
         }
-        level_name = level_names.get(self.current_level, "Unknown")
-        level_name_text = self.font_tiny.render(level_name, False, GRAY)
+        level_name = level_names.get(hud.level, "Unknown")
+        level_name_text = self.render_text(self.font_tiny, level_name, GRAY)
         level_name_rect = level_name_text.get_rect()
         self.screen.blit(level_name_text, (SCREEN_WIDTH - level_name_rect.width - 20, 45))
+        
+        # Most entities alive at once this endless game (top-right)
+        if hud.peak_entities is not None:
+            peak_text = self.render_text(self.font_tiny, f"Peak Entities: {hud.peak_entities}", GRAY)
+            self.screen.blit(peak_text, (SCREEN_WIDTH - peak_text.get_width() - 20, 65))
     
-    def draw_power_ups_ui(self):
+    def draw_power_ups_ui(self, hud):
         """Draw power-ups duration UI on the left edge - no background panel"""
         # Check if any power-ups are active
-        has_active_powerups = (self.player.s3_timer > 0 or 
-                              self.player.load_balancer_timer > 0 or 
-                              len(self.side_ships) > 0)
+        has_active_powerups = (hud.s3_timer > 0 or 
+                              hud.load_balancer_timer > 0 or 
+                              hud.side_ships > 0)
         
         if not has_active_powerups:
             return  # Don't draw anything if no power-ups are active
         
         # Power-ups title (no background panel)
-        title_text = self.font_small.render("Active Power-Ups", False, AWS_BLUE)
+        title_text = self.render_text(self.font_small, "Active Power-Ups", AWS_BLUE)
         self.screen.blit(title_text, (20, 120))  # Below main UI text
         
         y_offset = 150
         
         # S3 Power-up
-        if self.player.s3_timer > 0:
-            s3_time_left = self.player.s3_timer // 60  # Convert frames to seconds
-            s3_text = self.font_tiny.render(f"S3 Shield: {s3_time_left}s", False, GREEN)
+        if hud.s3_timer > 0:
+            s3_time_left = hud.s3_timer // SIMULATION_HZ  # Convert ticks to seconds
+            s3_text = self.render_text(self.font_tiny, f"S3 Shield: {s3_time_left}s", GREEN)
             self.screen.blit(s3_text, (20, y_offset))
             
             # Progress bar for S3
             bar_width = 150
             bar_height = 8
-            progress = self.player.s3_timer / S3_DURATION
+            progress = hud.s3_timer / S3_DURATION
             filled_width = int(bar_width * progress)
             
             # Background bar
@@ -1059,15 +1176,15 @@ class Game:
             y_offset += 35
         
         # Load Balancer Power-up
-        if self.player.load_balancer_timer > 0:
-            lb_time_left = self.player.load_balancer_timer // 60
-            lb_text = self.font_tiny.render(f"Load Balancer: {lb_time_left}s", False, BLUE)
+        if hud.load_balancer_timer > 0:
+            lb_time_left = hud.load_balancer_timer // SIMULATION_HZ
+            lb_text = self.render_text(self.font_tiny, f"Load Balancer: {lb_time_left}s", BLUE)
             self.screen.blit(lb_text, (20, y_offset))
             
             # Progress bar for Load Balancer
             bar_width = 150
             bar_height = 8
-            progress = self.player.load_balancer_timer / LOAD_BALANCER_DURATION
+            progress = hud.load_balancer_timer / LOAD_BALANCER_DURATION
             filled_width = int(bar_width * progress)
             
             pygame.draw.rect(self.screen, GRAY, (20, y_offset + 15, bar_width, bar_height))
@@ -1076,114 +1193,394 @@ class Game:
             y_offset += 35
         
         # Auto Scaling Power-up
-        if len(self.side_ships) > 0:
-            auto_scaling_text = self.font_tiny.render("Auto Scaling: Active", False, YELLOW)
+        if hud.side_ships > 0:
+            auto_scaling_text = self.render_text(self.font_tiny, "Auto Scaling: Active", YELLOW)
             self.screen.blit(auto_scaling_text, (20, y_offset))
             
             # Show side ship count
-            ship_count_text = self.font_tiny.render(f"Side Ships: {len(self.side_ships)}", False, YELLOW)
+            ship_count_text = self.render_text(self.font_tiny, f"Side Ships: {hud.side_ships}", YELLOW)
             self.screen.blit(ship_count_text, (20, y_offset + 15))
             
             y_offset += 35
     
     def game_loop(self):
-        """Main game loop"""
+        """Main game loop; returns True to go back to the menu, False to quit"""
+        return run_frames(self.game_loop_frames(), self.clock)
+    
+    async def game_loop_async(self):
+        """Main game loop driven by the asyncio loop (see FrameScheduler); same result as game_loop()"""
+        return await self.scheduler.run(self.game_loop_frames(), self.clock)
+    
+    def game_loop_frames(self):
+        """Frame generator of the game loop (see src/scheduler.py)"""
         # Start background music (skip for boss level)
         if ENABLE_AUDIO and self.current_level != 4:  # Don't play game_bgm for boss level
             try:
-                pygame.mixer.music.load('assets/audio/game_bgm.wav')
-                pygame.mixer.music.set_volume(1.0)
-                pygame.mixer.music.play(-1)  # Loop indefinitely
-                print("Started game background music")
+                play_music('assets/audio/game_bgm.wav')
+                log.debug("Started game background music")
             except:
-                print("Could not load or play game_bgm.wav")
+                log.warning("Could not load or play game music", path="assets/audio/game_bgm.wav")
         
-        while not self.game_over:
-            # Handle events
-            if not self.handle_events():
-                return False
-            
-            # Check for level completion
-            if self.level_complete:
-                # Play next level sound
-                self.play_sound('next_level')
-                
-                # Show next level screen with background and credits
-                self.show_next_level_screen()
-                
-                # Wait for enter key
-                waiting = True
-                while waiting:
-                    for event in pygame.event.get():
-                        if event.type == pygame.QUIT:
-                            return False
-                        elif event.type == pygame.KEYDOWN:
-                            if event.key == pygame.K_RETURN:
-                                waiting = False
-                            elif event.key == pygame.K_ESCAPE:
-                                return False
-                
-                # Advance to next level
-                if not self.next_level():
-                    # No more levels, player wins
-                    self.game_over = True
-                    self.win = True
-                    break
-            
-            # Update game state
-            self.update()
-            
-            # Draw everything
-            self.draw()
-            
-            # Control game speed
-            self.clock.tick(60)
+        if DEBUG_ALLOCATIONS:
+            alloc_counter.start()
+        
+        tick_jitter.reset()
+        self.last_frame_time = None
+        try:
+            if self.threaded_simulation:
+                playing = yield from self.threaded_loop()
+            else:
+                playing = yield from self.serial_loop()
+        finally:
+            alloc_counter.stop()  # Only gameplay frames are counted
+        if profile_capture.active:
+            self.stop_profile()
+        if not playing:
+            return False
+        
+        tracer.instant('game_over', 'level', {'level': self.current_level, 'win': self.win, 'reason': self.game_over_reason})
+        
+        # Session metrics: how long the last level took and what ended the game
+        self.record_level_time()
+        if self.endless is not None:
+            self.endless.report()
+        if self.autopilot is not None:
+            self.autopilot.game_done(self)
+        if not self.win:
+            telemetry.incr(f"deaths.{metric_name(self.game_over_reason)}")
         
         # Game over screen
         # Stop background music
         if ENABLE_AUDIO:
-            pygame.mixer.music.stop()
+            stop_music()
             
         if self.win:
+            cpu_meter.enter("victory")
             self.play_sound('victory')  # Play victory sound
             self.show_victory_screen()  # Use new victory screen with background
+            gc_policy.enter_idle("victory")
         else:
+            cpu_meter.enter("game over")
             self.play_sound('game_over')  # Play game over sound
             self.show_game_over_screen()  # Use new game over screen with background and reason
+            gc_policy.enter_idle("game over")
         
         # Wait for ENTER key to restart or ESC to exit
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.cleanup_audio()  # Clean up audio before exit
+        key = yield from self.wait_for_key((pygame.K_RETURN, pygame.K_ESCAPE))
+        self.cleanup_audio()  # Clean up audio before restart or exit
+        return key == pygame.K_RETURN
+    
+    def serial_loop(self):
+        """Frame generator running a level on the main thread until the game is over; returns False if the player quits.
+        
+        Fixed-timestep loop: the simulation always advances in 1/SIMULATION_HZ ticks
+        (all frame-based timers count these ticks) while rendering runs as fast as
+        render_fps allows and interpolates between the last two ticks. In lockstep
+        every frame advances exactly one tick, however long it took.
+        """
+        tick_length = 1.0 / SIMULATION_HZ
+        accumulator = 0.0
+        previous_time = time.perf_counter()
+        
+        while not self.game_over:
+            alloc_counter.begin_frame()
+            
+            frame_start = tracer.now()
+            
+            # Handle events
+            with tracer.span('handle_events', 'frame'):
+                if not self.handle_events():
                     return False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.cleanup_audio()  # Clean up audio before exit
+            self.poll_input()
+            
+            # Check for level completion
+            if self.level_complete:
+                if not (yield from self.complete_level()):
+                    return False
+                if self.game_over:
+                    break
+                
+                # Time spent on the level complete screen is not simulated
+                accumulator = 0.0
+                previous_time = time.perf_counter()
+                tick_jitter.reset()
+                self.last_frame_time = None
+            
+            if not self.window_focused:
+                # Paused in the background - keep the last frame and poll slowly
+                yield UNFOCUSED_FPS
+                accumulator = 0.0
+                previous_time = time.perf_counter()
+                tick_jitter.reset()
+                self.last_frame_time = None
+                continue
+            
+            now = time.perf_counter()
+            accumulator += now - previous_time
+            previous_time = now
+            if self.lockstep:
+                accumulator = tick_length  # Exactly one tick, however long the frame took
+            
+            # Update game state in fixed ticks
+            ticks = 0
+            while accumulator >= tick_length and ticks < MAX_CATCHUP_TICKS:
+                self.simulation_tick()
+                accumulator -= tick_length
+                ticks += 1
+                if self.game_over or self.level_complete or self.tick_limit_reached():
+                    break
+            
+            # Too far behind: drop the backlog so a slow machine runs slower
+            # instead of spending ever longer catching up (spiral of death)
+            if ticks == MAX_CATCHUP_TICKS and accumulator >= tick_length:
+                accumulator = 0.0
+            
+            # Draw everything, interpolating by the time left over; lockstep never has
+            # any (every tick is drawn right after it is simulated), so it draws the tick as is
+            profile_capture.call(self.draw, 1.0 if self.lockstep else min(1.0, accumulator / tick_length))
+            self.record_frame(now)
+            alloc_counter.end_frame()
+            
+            # Cap the render rate
+            tracer.complete('frame', 'frame', frame_start)
+            if self.tick_limit_reached():
+                return False
+            yield self.render_fps
+        
+        return True
+    
+    def threaded_loop(self):
+        """Frame generator running a level with the simulation on a worker thread; returns False if the player quits.
+        
+        SDL wants events and the display on the thread that created the window, so
+        the main thread keeps input and rendering and draws the latest snapshot the
+        simulation published, interpolating by the time since that tick. A slow
+        frame (a stalled flip, a long blit) then delays only the picture, not the
+        simulation ticks.
+        """
+        tick_length = 1.0 / SIMULATION_HZ
+        simulation = SimulationThread(self)
+        self.snapshots.clear()
+        
+        try:
+            while not self.game_over:
+                alloc_counter.begin_frame()
+                
+                frame_start = tracer.now()
+                
+                # Handle events
+                with tracer.span('handle_events', 'frame'):
+                    if not self.handle_events():
+                        return False
+                self.poll_input()
+                
+                if simulation.error is not None:
+                    raise simulation.error
+                if self.tick_limit_reached():
+                    return False
+                
+                # Check for level completion (the simulation thread has stopped by itself)
+                if self.level_complete:
+                    simulation.stop()
+                    if not (yield from self.complete_level()):
                         return False
-                    elif event.key == pygame.K_RETURN:  # Only respond to Enter key
-                        self.cleanup_audio()  # Clean up audio before restart
-                        waiting = False
-                        return True
+                    if self.game_over:
+                        break
+                    self.snapshots.clear()
+                
+                if not self.window_focused:
+                    # Paused in the background - stop simulating, keep the last frame and poll slowly
+                    simulation.stop()
+                    yield UNFOCUSED_FPS
+                    continue
+                
+                if not simulation.running() and not (self.game_over or self.level_complete):
+                    tick_jitter.reset()  # Time paused or on the level complete screen is not jitter
+                    self.last_frame_time = None
+                    simulation.start()
+                
+                # Draw the latest published tick
+                snapshot = self.snapshots.latest()
+                if snapshot is not None:
+                    profile_capture.call(self.render_snapshot, snapshot,
+                                         min(1.0, (time.perf_counter() - snapshot.tick_time) / tick_length))
+                    self.record_frame(time.perf_counter())
+                    alloc_counter.end_frame()
+                
+                # Cap the render rate
+                tracer.complete('frame', 'frame', frame_start)
+                yield self.render_fps
+        finally:
+            simulation.stop()
+        
+        if simulation.error is not None:
+            raise simulation.error
+        return True
+    
+    def profile_tags(self):
+        """What was on screen during a profile capture"""
+        return {
+            'level': self.current_level,
+            'threaded_simulation': self.threaded_simulation,
+            'boss_exploding': self.boss_exploding,
+            'entities': {kind: len(entities) for kind, entities in self.entities.kinds.items()}
+        }
+    
+    def start_profile(self, seconds):
+        profile_capture.start(seconds, self.profile_tags())
+    
+    def stop_profile(self):
+        profile_capture.stop({'entities_at_end': self.profile_tags()['entities']})
+    
+    def record_frame(self, frame_time):
+        """Send per-frame metrics (frame time since the previous call, credits) to telemetry"""
+        if self.last_frame_time is not None:
+            telemetry.timing('frame_time', (frame_time - self.last_frame_time) * 1000)
+            if self.autopilot is not None:
+                self.autopilot.record_frame((frame_time - self.last_frame_time) * 1000)
+        self.last_frame_time = frame_time
+        self.total_frames += 1
+        telemetry.gauge('credits', self.player.credits)
+        gc_policy.record()
+        if not self.threaded_simulation:
+            diagnostics.update(self)  # The simulation thread samples while it runs
+    
+    def record_level_time(self):
+        telemetry.timing(f"level.{self.current_level}.time", self.level_ticks * 1000 / SIMULATION_HZ)
+        if state_hasher.enabled:
+            state_hasher.level_done(self.current_level)
+    
+    def poll_input(self):
+        """Capture the keyboard state the simulation reads until the next frame"""
+        if self.autopilot is not None:
+            if not self.threaded_simulation:
+                self.input_keys = self.autopilot.keys(self)  # Else the simulation thread asks it before each tick
+        else:
+            self.input_keys = pygame.key.get_pressed()
+    
+    def complete_level(self):
+        """Frame generator showing the level complete screen and advancing to the next level; returns False if the player quits.
+        
+        Sets game_over (and win) when the last level is done.
+        """
+        # Play next level sound
+        self.play_sound('next_level')
+        
+        # Show next level screen with background and credits
+        cpu_meter.enter("level complete")
+        self.record_level_time()
+        if self.autopilot is not None:
+            self.autopilot.level_done(self, "complete")
+        self.show_next_level_screen()
+        gc_policy.enter_idle("level complete")  # Collect while the screen is static
+        
+        # Wait for enter key
+        if (yield from self.wait_for_key((pygame.K_RETURN, pygame.K_ESCAPE))) != pygame.K_RETURN:
+            return False
+        cpu_meter.enter("gameplay")
+        
+        # Advance to next level
+        if not self.next_level():
+            # No more levels, player wins
+            self.game_over = True
+            self.win = True
+            return True
+        gc_policy.enter_gameplay()  # Freeze the new level's entities
         
+        self.previous_positions.clear()
         return True
     
+    def wait_for_key(self, keys):
+        """Frame generator waiting until one of keys is pressed; returns it (None if the window is closed).
+        
+        Wait screens are static, so this waits for events (pygame.event.wait() in the
+        blocking loop) rather than spinning on pygame.event.get(); the screen is only
+        re-flipped when exposed.
+        """
+        self.answer_unattended(keys[0])
+        while True:
+            event = yield WAIT_FOR_EVENT
+            if event.type == pygame.QUIT:
+                return None
+            elif event.type == pygame.KEYDOWN and event.key in keys:
+                return event.key
+            elif event.type == pygame.WINDOWEXPOSED:
+                pygame.display.flip()
+    
+    def answer_unattended(self, key):
+        """Press key for a screen waiting for input when nobody is playing (autopilot or tick limit)"""
+        if self.autopilot is not None:
+            self.autopilot.press(key)
+        elif self.tick_limit is not None:
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode='', scancode=0))
+    
     def run(self):
         """Run the entire game with menu and game loop"""
+        run_frames(self.session_frames(), self.clock)
+        self.shutdown()
+    
+    async def run_async(self):
+        """Run the entire game from an asyncio event loop: asyncio.run(game.run_async()).
+        
+        Frames are the same as run()'s; in the idle time at the end of each frame the
+        loop runs background coroutines started with self.scheduler.spawn(), starting
+        with stream_game_assets() while the menu is up.
+        """
+        self.scheduler = FrameScheduler()
+        self.scheduler.spawn(self.stream_game_assets, name="game assets")
+        try:
+            await self.scheduler.run(self.session_frames(), self.clock)
+        finally:
+            await self.scheduler.shutdown()
+        self.shutdown()
+    
+    def session_frames(self):
+        """Frame generator of a whole session: menu, game, menu, ... until the player quits"""
         running = True
         
         while running:
             # Show menu (this will restart menu music)
-            if not self.menu.run():
-                break
+            if self.start_level is not None:
+                # Started from the command line at a level: no menu the first time
+                self.current_level = self.start_level
+                choice = 'endless' if self.start_level == ENDLESS_LEVEL else True
+                self.start_level = None
+            else:
+                gc_policy.enter_idle("menu")
+                self.answer_unattended(pygame.K_RETURN)  # PLAY
+                choice = yield from self.menu.frames()
+                if not choice:
+                    break
+            self.endless = EndlessMode() if choice == 'endless' else None
+            
+            # Load deferred gameplay assets on first PLAY (no-op afterwards)
+            self.load_game_assets()
             
             # Initialize/reset game
+            if self.seed is not None:
+                random.seed(self.seed)
             self.initialize_game()
+            telemetry.incr('games')
+            tracer.instant('level_start', 'level', {'level': self.current_level})
+            
+            # Freeze the assets and the level's entities before play starts
+            gc_policy.enter_gameplay()
             
             # Run game loop
-            if not self.game_loop():
+            cpu_meter.enter("gameplay")
+            if not (yield from self.game_loop_frames()):
                 break
-        
-        # Clean up
+    
+    def shutdown(self):
+        """Report the session's measurements and shut pygame down"""
+        cpu_meter.report()
+        alloc_counter.report()
+        self.renderer.report()
+        tick_jitter.report("threaded" if self.threaded_simulation else "serial")
+        gc_policy.report()
+        diagnostics.report()
+        if self.autopilot is not None:
+            self.autopilot.report()
+        telemetry.close()
+        tracer.stop()
         pygame.quit()
@@ -0,0 +1,99 @@
+import gc
+import time
+import atexit
+from collections import deque
+from src.constants import *
+from src.log import log
+from src.trace import tracer
+from src.telemetry import telemetry
+
+class GcPolicy:
+    """Keeps cyclic garbage collection out of gameplay frames.
+
+    enter_gameplay() freezes everything built so far (assets, cached screens, the
+    level's entities) into the permanent generation, so collections during play
+    only scan objects made since, and raises the generation thresholds to
+    GC_GAMEPLAY_THRESHOLDS. enter_idle() is called when a static screen comes up
+    (menu, level complete, game over): it restores the default thresholds,
+    unfreezes and runs a full collection while nothing is animating.
+
+    Every collection is timed through gc.callbacks, recorded as a trace span and
+    kept for the report at exit; pauses of GC_SLOW_PAUSE_MS or more are logged
+    (rate limited), shorter ones only at DEBUG. The callback can run inside any
+    allocation, including one made while telemetry holds its lock, so pauses are
+    only queued there and sent to telemetry from the frame loop by record().
+    """
+    def __init__(self, enabled=GC_POLICY):
+        self.enabled = enabled
+        self.default_thresholds = gc.get_threshold()
+        self.mode = "startup"
+        self.pause_start = 0
+        self.pending = deque(maxlen=GC_PENDING_PAUSES)  # (generation, milliseconds) not yet sent to telemetry
+        self.pauses = {}  # (mode, generation) -> [count, total ms, max ms]
+        gc.callbacks.append(self.on_collection)
+        atexit.register(self.close)
+
+    def close(self):
+        """Stop timing collections (the ones while the interpreter shuts down would log after the log is gone)"""
+        if self.on_collection in gc.callbacks:
+            gc.callbacks.remove(self.on_collection)
+
+    def enter_gameplay(self):
+        """Freeze what the level was built from and tune thresholds for play"""
+        if self.enabled:
+            self.mode = "level start"
+            gc.collect()  # Don't freeze what the level just replaced (the previous game's entity lists)
+            gc.freeze()
+            gc.set_threshold(*GC_GAMEPLAY_THRESHOLDS)
+            log.debug("GC frozen for gameplay", frozen=gc.get_freeze_count(), thresholds=GC_GAMEPLAY_THRESHOLDS)
+        self.mode = "gameplay"
+
+    def enter_idle(self, screen):
+        """Collect everything on a static screen, where a pause cannot be seen"""
+        self.mode = screen
+        if not self.enabled:
+            return
+        gc.set_threshold(*self.default_thresholds)
+        gc.unfreeze()
+        gc.collect()
+
+    def on_collection(self, phase, info):
+        if phase == 'start':
+            self.pause_start = time.perf_counter_ns()
+            return
+        end = time.perf_counter_ns()
+        generation = info['generation']
+        milliseconds = (end - self.pause_start) / 1e6
+
+        stats = self.pauses.get((self.mode, generation))
+        if stats is None:
+            stats = self.pauses[(self.mode, generation)] = [0, 0.0, 0.0]
+        stats[0] += 1
+        stats[1] += milliseconds
+        stats[2] = max(stats[2], milliseconds)
+        self.pending.append((generation, milliseconds))
+
+        tracer.complete(f"gc.gen{generation}", 'gc', self.pause_start,
+                        {'collected': info['collected'], 'uncollectable': info['uncollectable']})
+        if milliseconds >= GC_SLOW_PAUSE_MS:
+            log.info("GC pause", 1.0, generation=generation, ms=f"{milliseconds:.3f}", collected=info['collected'],
+                     mode=self.mode)
+        else:
+            log.debug("GC pause", generation=generation, ms=f"{milliseconds:.3f}", collected=info['collected'],
+                      mode=self.mode)
+
+    def record(self):
+        """Send queued pauses to telemetry (called once per frame)"""
+        while self.pending:
+            generation, milliseconds = self.pending.popleft()
+            telemetry.timing(f"gc.gen{generation}", milliseconds)
+
+    def report(self):
+        """Log the GC pauses of the session by screen and generation"""
+        self.record()
+        for (mode, generation), (count, total, maximum) in sorted(self.pauses.items()):
+            log.info("GC pauses", mode=mode, generation=generation, count=count, total_ms=f"{total:.2f}",
+                     max_ms=f"{maximum:.3f}")
+
+# Shared policy for the whole game
+gc_policy = GcPolicy()
@@ -0,0 +1,126 @@
+import sys
+import time
+import atexit
+import threading
+from collections import deque
+from src.constants import *
+
+# Log levels (same numbering as the standard logging module)
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+LEVELS_BY_NAME = {name: level for level, name in LEVEL_NAMES.items()}
+
+class GameLogger:
+    """Structured logger that never writes to the terminal from the game loop.
+    
+    Records are appended to an in-memory ring buffer and written out by a
+    background thread, so a log call costs a level check, an optional rate-limit
+    check and a deque append. Messages are templates; per-record values go in
+    keyword fields, which keeps the message usable as a rate-limit key.
+    """
+    def __init__(self, level=LOG_LEVEL, buffer_size=LOG_BUFFER_SIZE, flush_interval=LOG_FLUSH_INTERVAL, stream=None):
+        self.level = LEVELS_BY_NAME.get(level, level) if isinstance(level, str) else level
+        self.records = deque(maxlen=buffer_size)  # Oldest records are dropped when full
+        self.flush_interval = flush_interval
+        self.stream = stream
+        
+        # Rate limiting state per message key
+        self.last_emit_time = {}
+        self.suppressed_counts = {}
+        
+        self.flush_lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.thread = None
+        atexit.register(self.flush)
+        
+    def set_level(self, level):
+        self.level = LEVELS_BY_NAME.get(level, level) if isinstance(level, str) else level
+        
+    def is_enabled(self, level):
+        return level >= self.level
+    
+    def log(self, level, message, interval=0.0, key=None, /, **fields):
+        """Queue a record; with interval > 0 the same key is emitted at most once per interval seconds.
+        
+        The parameters are positional-only so fields may use any name (e.g. level=).
+        """
+        if level < self.level:
+            return
+        
+        now = time.time()
+        suppressed = 0
+        if interval > 0:
+            if key is None:
+                key = message
+            last_time = self.last_emit_time.get(key)
+            if last_time is not None and now - last_time < interval:
+                self.suppressed_counts[key] = self.suppressed_counts.get(key, 0) + 1
+                return
+            self.last_emit_time[key] = now
+            suppressed = self.suppressed_counts.pop(key, 0)
+        
+        self.records.append((now, level, message, fields, suppressed))
+        
+        # Start the writer thread on first use
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.writer_loop, name="log-writer", daemon=True)
+            self.thread.start()
+        if level >= ERROR:
+            self.wakeup.set()  # Errors are written out promptly
+    
+    def debug(self, message, interval=0.0, key=None, **fields):
+        self.log(DEBUG, message, interval, key, **fields)
+        
+    def info(self, message, interval=0.0, key=None, **fields):
+        self.log(INFO, message, interval, key, **fields)
+        
+    def warning(self, message, interval=0.0, key=None, **fields):
+        self.log(WARNING, message, interval, key, **fields)
+        
+    def error(self, message, interval=0.0, key=None, **fields):
+        self.log(ERROR, message, interval, key, **fields)
+    
+    def format_value(self, value):
+        # Quote strings with spaces so key=value pairs stay unambiguous
+        if isinstance(value, str) and (" " in value or not value):
+            return f'"{value}"'
+        return value
+    
+    def format_record(self, record):
+        timestamp, level, message, fields, suppressed = record
+        clock = time.strftime("%H:%M:%S", time.localtime(timestamp))
+        line = f"{clock}.{int(timestamp * 1000) % 1000:03d} {LEVEL_NAMES.get(level, level):<7} {message}"
+        if fields:
+            line += " " + " ".join(f"{name}={self.format_value(value)}" for name, value in fields.items())
+        if suppressed:
+            line += f" (+{suppressed} suppressed)"
+        return line
+    
+    def flush(self):
+        """Write out every buffered record (called by the writer thread and at exit)"""
+        with self.flush_lock:
+            lines = []
+            while self.records:
+                try:
+                    lines.append(self.format_record(self.records.popleft()))
+                except IndexError:
+                    break
+            if lines:
+                stream = self.stream or sys.stdout
+                try:
+                    stream.write("\n".join(lines) + "\n")
+                    stream.flush()
+                except (ValueError, OSError):
+                    pass  # Stream closed during interpreter shutdown
+    
+    def writer_loop(self):
+        while True:
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+            self.flush()
+
+# Shared logger for the whole game
+log = GameLogger()
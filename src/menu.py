@@ -3,8 +3,18 @@ import os
 import random
 import math
 from src.constants import *
+from src.startup import startup_trace
+from src.assets import load_image
+from src.cpu_usage import cpu_meter
+from src.music import play_music, stop_music
+from src.scheduler import run_frames, WAIT_FOR_EVENT
+
+# Timer event that drives the menu star animation
+MENU_ANIMATION_EVENT = pygame.USEREVENT + 1
 
 class Star:
+    __slots__ = ('x', 'y', 'brightness', 'fade_speed', 'size', 'twinkle_phase', 'twinkle_speed', 'lifetime', 'age',
+                 'current_brightness')
     def __init__(self):
         self.x = random.randint(0, SCREEN_WIDTH)
         self.y = random.randint(0, SCREEN_HEIGHT)
@@ -48,33 +58,34 @@ class Menu:
         self.screen = screen
         
         # Load Press Start 2P font
-        try:
-            self.font_title = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 36)
-            self.font_button = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 24)
-            self.font_small = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 16)
-            self.font_tiny = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 12)
-        except:
-            # Fallback to system fonts if Press Start 2P fails to load
-            self.font_title = pygame.font.Font(None, 72)
-            self.font_button = pygame.font.Font(None, 48)
-            self.font_small = pygame.font.Font(None, 32)
-            self.font_tiny = pygame.font.Font(None, 24)
+        with startup_trace.stage("menu fonts"):
+            try:
+                self.font_title = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 36)
+                self.font_button = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 24)
+                self.font_small = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 16)
+                self.font_tiny = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 12)
+            except:
+                # Fallback to system fonts if Press Start 2P fails to load
+                self.font_title = pygame.font.Font(None, 72)
+                self.font_button = pygame.font.Font(None, 48)
+                self.font_small = pygame.font.Font(None, 32)
+                self.font_tiny = pygame.font.Font(None, 24)
         
         # Load background image
-        try:
-            self.background = pygame.image.load('assets/images/bg/main_menu_background.png')
-            self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        except:
-            self.background = None
+        with startup_trace.stage("menu background"):
+            try:
+                self.background = load_image('assets/images/bg/main_menu_background.png', (SCREEN_WIDTH, SCREEN_HEIGHT))
+            except:
+                self.background = None
             
-        # Load and play menu music
-        try:
-            if ENABLE_AUDIO:
-                pygame.mixer.music.load('assets/audio/main_menu.wav')
-                pygame.mixer.music.set_volume(MENU_MUSIC_VOLUME)
-                pygame.mixer.music.play(-1)  # Loop indefinitely
-        except:
-            pass
+        # Load and play menu music (lazy mode leaves this to run(), which restarts it anyway)
+        if not LAZY_INIT:
+            with startup_trace.stage("menu music"):
+                try:
+                    if ENABLE_AUDIO:
+                        play_music('assets/audio/main_menu.wav', MENU_MUSIC_VOLUME)
+                except:
+                    pass
             
         # Button properties
         self.button_width = 200
@@ -85,14 +96,20 @@ class Menu:
             self.button_width,
             self.button_height
         )
-        self.exit_button_rect = pygame.Rect(
+        self.endless_button_rect = pygame.Rect(
             SCREEN_WIDTH // 2 - self.button_width // 2,
             SCREEN_HEIGHT // 2 + 130,
             self.button_width,
             self.button_height
         )
+        self.exit_button_rect = pygame.Rect(
+            SCREEN_WIDTH // 2 - self.button_width // 2,
+            SCREEN_HEIGHT // 2 + 210,
+            self.button_width,
+            self.button_height
+        )
         
-        self.selected_button = 0  # 0 = play, 1 = exit
+        self.selected_button = 0  # 0 = play, 1 = endless, 2 = exit
         
         # Initialize stars
         self.stars = []
@@ -180,8 +197,7 @@ class Menu:
         else:
             self.screen.fill(BLACK)
         
-        # Update and draw stars
-        self.update_stars()
+        # Draw stars (animated by run() on timer ticks)
         self.draw_stars()
         
         # Draw title with pixel-style outline
@@ -214,13 +230,22 @@ class Menu:
             self.selected_button == 0
         )
         
+        self.draw_transparent_button(
+            self.endless_button_rect,
+            "ENDLESS",
+            self.font_button,
+            WHITE if self.selected_button != 1 else AWS_ORANGE,
+            AWS_ORANGE if self.selected_button == 1 else WHITE,
+            self.selected_button == 1
+        )
+        
         self.draw_transparent_button(
             self.exit_button_rect,
             "EXIT",
             self.font_button,
-            WHITE if self.selected_button != 1 else RED,
-            RED if self.selected_button == 1 else WHITE,
-            self.selected_button == 1
+            WHITE if self.selected_button != 2 else RED,
+            RED if self.selected_button == 2 else WHITE,
+            self.selected_button == 2
         )
         
         # Draw controls hint at bottom
@@ -236,57 +261,116 @@ class Menu:
         pygame.display.flip()
         
     def run(self):
-        """Run the menu and return True if player wants to play, False to quit"""
+        """Run the menu and return True if player wants to play, 'endless' for endless mode, False to quit"""
+        return run_frames(self.frames())
+    
+    def frames(self):
+        """Frame generator of the menu (see src/scheduler.py); returns True to play, 'endless' for endless mode, False to quit"""
         # Restart menu music when returning to menu
         try:
             if ENABLE_AUDIO:
-                pygame.mixer.music.stop()  # Stop any current music
-                pygame.mixer.music.load('assets/audio/main_menu.wav')
-                pygame.mixer.music.set_volume(MENU_MUSIC_VOLUME)
-                pygame.mixer.music.play(-1)  # Loop indefinitely
+                stop_music()  # Stop any current music
+                play_music('assets/audio/main_menu.wav', MENU_MUSIC_VOLUME)
         except:
             pass
             
-        clock = pygame.time.Clock()
-        
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.mixer.music.stop()
-                    return False
-                    
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_UP:
-                        self.selected_button = max(0, self.selected_button - 1)
-                    elif event.key == pygame.K_DOWN:
-                        self.selected_button = min(1, self.selected_button + 1)
-                    elif event.key == pygame.K_RETURN:
-                        pygame.mixer.music.stop()
-                        if self.selected_button == 0:  # Play
-                            return True
-                        else:  # Exit
-                            return False
-                    elif event.key == pygame.K_ESCAPE:
-                        pygame.mixer.music.stop()
+        # Block on events instead of redrawing at a fixed rate: the scene is only
+        # redrawn on animation timer ticks and when input changes the selection
+        cpu_meter.enter("menu")
+        self.set_animation_rate(MENU_ANIMATION_FPS)
+        self.draw_main_menu()
+        self.report_first_frame()
+        
+        try:
+            while True:
+                # Handle everything that queued up while we were drawing in one batch
+                events = [(yield WAIT_FOR_EVENT)] + pygame.event.get()
+                redraw = False
+                
+                for event in events:
+                    if event.type == MENU_ANIMATION_EVENT:
+                        # Stars are tuned for 60 updates per second
+                        for _ in range(self.star_steps_per_tick):
+                            self.update_stars()
+                        redraw = True
+                        
+                    elif event.type == pygame.QUIT:
+                        stop_music()
                         return False
                         
-                elif event.type == pygame.MOUSEMOTION:
-                    # Check if mouse is over buttons
-                    mouse_pos = pygame.mouse.get_pos()
-                    if self.play_button_rect.collidepoint(mouse_pos):
-                        self.selected_button = 0
-                    elif self.exit_button_rect.collidepoint(mouse_pos):
-                        self.selected_button = 1
+                    elif event.type == pygame.WINDOWFOCUSLOST:
+                        self.set_animation_rate(UNFOCUSED_FPS)
+                        cpu_meter.enter("menu (unfocused)")
+                        
+                    elif event.type == pygame.WINDOWFOCUSGAINED:
+                        self.set_animation_rate(MENU_ANIMATION_FPS)
+                        cpu_meter.enter("menu")
+                        redraw = True
                         
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:  # Left click
+                    elif event.type == pygame.WINDOWEXPOSED:
+                        redraw = True
+                        
+                    elif event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_UP:
+                            self.selected_button = max(0, self.selected_button - 1)
+                            redraw = True
+                        elif event.key == pygame.K_DOWN:
+                            self.selected_button = min(2, self.selected_button + 1)
+                            redraw = True
+                        elif event.key == pygame.K_RETURN:
+                            stop_music()
+                            if self.selected_button == 0:  # Play
+                                return True
+                            elif self.selected_button == 1:  # Endless
+                                return 'endless'
+                            else:  # Exit
+                                return False
+                        elif event.key == pygame.K_ESCAPE:
+                            stop_music()
+                            return False
+                            
+                    elif event.type == pygame.MOUSEMOTION:
+                        # Check if mouse is over buttons
                         mouse_pos = pygame.mouse.get_pos()
                         if self.play_button_rect.collidepoint(mouse_pos):
-                            pygame.mixer.music.stop()
-                            return True
+                            if self.selected_button != 0:
+                                self.selected_button = 0
+                                redraw = True
+                        elif self.endless_button_rect.collidepoint(mouse_pos):
+                            if self.selected_button != 1:
+                                self.selected_button = 1
+                                redraw = True
                         elif self.exit_button_rect.collidepoint(mouse_pos):
-                            pygame.mixer.music.stop()
-                            return False
-            
-            self.draw_main_menu()
-            clock.tick(60)  # 60 FPS
+                            if self.selected_button != 2:
+                                self.selected_button = 2
+                                redraw = True
+                            
+                    elif event.type == pygame.MOUSEBUTTONDOWN:
+                        if event.button == 1:  # Left click
+                            mouse_pos = pygame.mouse.get_pos()
+                            if self.play_button_rect.collidepoint(mouse_pos):
+                                stop_music()
+                                return True
+                            elif self.endless_button_rect.collidepoint(mouse_pos):
+                                stop_music()
+                                return 'endless'
+                            elif self.exit_button_rect.collidepoint(mouse_pos):
+                                stop_music()
+                                return False
+                
+                if redraw:
+                    self.draw_main_menu()
+        finally:
+            # Stop the animation timer so no menu ticks leak into gameplay
+            pygame.time.set_timer(MENU_ANIMATION_EVENT, 0)
+    
+    def set_animation_rate(self, fps):
+        """(Re)start the star animation timer at the given rate"""
+        self.star_steps_per_tick = max(1, 60 // fps)
+        pygame.time.set_timer(MENU_ANIMATION_EVENT, 1000 // fps)
+        
+    def report_first_frame(self):
+        """Report the startup trace once the first menu frame is on screen"""
+        if startup_trace.first_menu_frame_time is None:
+            startup_trace.mark_first_menu_frame()
+            startup_trace.report()
@@ -0,0 +1,17 @@
+import pygame
+
+# Every background music call goes through here: with audio disabled (or a lazy
+# start that never brought the mixer up) pygame.mixer.music raises
+# "mixer not initialized", so these do nothing until the mixer is running.
+
+def play_music(path, volume=1.0, loops=-1):
+    """Load and play a music file (looped by default); raises pygame.error / FileNotFoundError like pygame"""
+    if not pygame.mixer.get_init():
+        return
+    pygame.mixer.music.load(path)
+    pygame.mixer.music.set_volume(volume)
+    pygame.mixer.music.play(loops)
+
+def stop_music():
+    if pygame.mixer.get_init():
+        pygame.mixer.music.stop()
@@ -0,0 +1,138 @@
+import os
+import json
+import time
+import pstats
+import cProfile
+import threading
+from src.constants import *
+from src.log import log
+
+def function_label(function):
+    """flamegraph-friendly name for a pstats function key (filename, line, name)"""
+    filename, line, name = function
+    if filename == '~':
+        label = name  # Built-in, e.g. <method 'blits' of 'pygame.surface.Surface' objects>
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{line})"
+    return label.replace(';', ',')
+
+def collapsed_stacks(stats, max_depth=PROFILE_MAX_STACK_DEPTH):
+    """Rebuild "root;caller;callee microseconds" lines from a pstats call graph.
+
+    cProfile only records caller -> callee edges, not whole stacks, so each
+    callee's time is split between its callers in proportion to the time spent
+    in it from each one. Recursive calls are folded into the first frame.
+    """
+    callees = {}
+    for function, (cc, nc, tt, ct, callers) in stats.stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((function, edge[3]))
+    roots = [function for function, entry in stats.stats.items() if not entry[4]]
+
+    totals = {}
+    def visit(function, stack, time_on_path):
+        cc, nc, tt, ct, callers = stats.stats[function]
+        if ct <= 0:
+            return
+        share = time_on_path / ct
+        key = ';'.join(stack)
+        totals[key] = totals.get(key, 0.0) + tt * share
+        if len(stack) >= max_depth:
+            return
+        for callee, edge_time in callees.get(function, ()):
+            if callee not in stack_functions:
+                stack_functions.add(callee)
+                visit(callee, stack + [function_label(callee)], edge_time * share)
+                stack_functions.discard(callee)
+
+    for root in roots:
+        stack_functions = {root}
+        visit(root, [function_label(root)], stats.stats[root][3])
+    return [f"{stack} {round(seconds * 1e6)}" for stack, seconds in totals.items() if round(seconds * 1e6) > 0]
+
+class ProfileCapture:
+    """On-demand cProfile capture around Game.update and Game.draw.
+
+    Nothing is profiled until start() (F9 in game, or the --profile option);
+    wrapped calls then run under a cProfile.Profile per thread (the simulation
+    may run on its own thread) until the capture's time is up. stop() writes a
+    .pstats file, a collapsed-stack .folded file for flame graph tools and a
+    .json file with the tags (level, entity counts) to PROFILE_DIR.
+    """
+    def __init__(self):
+        self.active = False
+        self.profiles = {}  # Thread id -> (Profile, lock held while it runs)
+        self.profiles_lock = threading.Lock()
+        self.stop_time = 0.0
+        self.start_time = 0.0
+        self.tags = {}
+        self.calls = 0
+
+    def start(self, seconds, tags):
+        if self.active:
+            return
+        self.profiles = {}
+        self.calls = 0
+        self.tags = dict(tags)
+        self.start_time = time.perf_counter()
+        self.stop_time = self.start_time + seconds
+        self.active = True
+        log.info("Profile capture started", seconds=seconds, level=tags.get('level'))
+
+    def call(self, function, *args):
+        """Call function, under the profiler while a capture is running"""
+        if not self.active:
+            return function(*args)
+        profile, lock = self.thread_profile()
+        with lock:
+            self.calls += 1
+            return profile.runcall(function, *args)
+
+    def thread_profile(self):
+        thread_id = threading.get_ident()
+        entry = self.profiles.get(thread_id)
+        if entry is None:
+            with self.profiles_lock:
+                entry = self.profiles[thread_id] = (cProfile.Profile(), threading.Lock())
+        return entry
+
+    def expired(self):
+        return self.active and time.perf_counter() >= self.stop_time
+
+    def stop(self, tags):
+        """End the capture and write its files; tags are merged into the ones given to start()"""
+        if not self.active:
+            return None
+        self.active = False
+        seconds = time.perf_counter() - self.start_time
+
+        # Wait for wrapped calls still running on other threads
+        stats = None
+        with self.profiles_lock:
+            entries = list(self.profiles.values())
+        for profile, lock in entries:
+            with lock:
+                profile.create_stats()
+            if stats is None:
+                stats = pstats.Stats(profile)
+            else:
+                stats.add(profile)
+        if stats is None:
+            log.info("Profile capture stopped with nothing recorded")
+            return None
+
+        self.tags.update(tags)
+        self.tags['seconds'] = round(seconds, 3)
+        self.tags['calls'] = self.calls
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        base = os.path.join(PROFILE_DIR, time.strftime("profile_%Y%m%d_%H%M%S") + f"_level{self.tags.get('level', 0)}")
+        stats.dump_stats(base + '.pstats')
+        with open(base + '.folded', 'w') as f:
+            f.write('\n'.join(collapsed_stacks(stats)) + '\n')
+        with open(base + '.json', 'w') as f:
+            json.dump(self.tags, f, indent=1)
+        log.info("Profile capture written", path=base + '.pstats', seconds=f"{seconds:.1f}", calls=self.calls)
+        return base
+
+# Shared capture for the whole game
+profile_capture = ProfileCapture()
@@ -0,0 +1,50 @@
+from src.constants import *
+from src.log import log
+from src.trace import tracer
+
+class LayeredRenderer:
+    """Collects (surface, position) pairs per z-layer and submits each layer in one batched call.
+
+    Layers are drawn in RENDER_LAYERS order (back to front), each with a single
+    Surface.fblits (pygame-ce) or Surface.blits call instead of one Python-level
+    blit per sprite. Blit counts per layer are kept for the end-of-run report.
+    """
+    def __init__(self, layers=RENDER_LAYERS):
+        self.layers = {layer: [] for layer in layers}
+        self.last_counts = {layer: 0 for layer in layers}  # Blits per layer in the last frame
+        self.total_counts = {layer: 0 for layer in layers}
+        self.peak_counts = {layer: 0 for layer in layers}
+        self.frames = 0
+        self.trace_names = {layer: 'draw.' + layer for layer in layers}
+
+    def add(self, layer, surface, position):
+        self.layers[layer].append((surface, position))
+
+    def extend(self, layer, blits):
+        """Queue an iterable of (surface, position) pairs on a layer"""
+        self.layers[layer].extend(blits)
+
+    def flush(self, target):
+        """Draw every queued layer onto target, back to front, and empty the queues"""
+        fblits = getattr(target, 'fblits', None)
+        for layer, batch in self.layers.items():
+            count = len(batch)
+            self.last_counts[layer] = count
+            if not count:
+                continue
+            start = tracer.now()
+            if fblits:
+                fblits(batch)
+            else:
+                target.blits(batch, False)  # Don't build the list of changed rects
+            tracer.complete(self.trace_names[layer], 'draw', start)
+            self.total_counts[layer] += count
+            if count > self.peak_counts[layer]:
+                self.peak_counts[layer] = count
+            batch.clear()
+        self.frames += 1
+
+    def report(self):
+        for layer in self.layers:
+            average = self.total_counts[layer] / self.frames if self.frames else 0.0
+            log.info("Render layer", layer=layer, blits_per_frame=f"{average:.1f}", peak=self.peak_counts[layer])
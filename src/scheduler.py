@@ -0,0 +1,149 @@
+import time
+import asyncio
+import pygame
+from src.constants import *
+from src.log import log
+
+# The loops (Menu.frames, Game.session_frames, ...) are frame generators: they yield
+# the frame rate cap at the end of every frame, or WAIT_FOR_EVENT when nothing
+# changes until the next event, which the driver then sends back into the
+# generator. run_frames() drives one with clock.tick and pygame.event.wait();
+# FrameScheduler.run() drives the same generator from an asyncio event loop.
+WAIT_FOR_EVENT = None
+
+def run_frames(frames, clock=None):
+    """Drive a frame generator on the calling thread and return its result.
+
+    clock may be None for generators that only ever wait for events.
+    """
+    try:
+        request = next(frames)
+        while True:
+            if request is WAIT_FOR_EVENT:
+                request = frames.send(pygame.event.wait())
+            else:
+                clock.tick(request)
+                request = next(frames)
+    except StopIteration as stop:
+        return stop.value
+
+class TaskBudget:
+    """Per-frame time budget of one background task.
+
+    The task awaits checkpoint() between units of work; once the task has used
+    its budget in this frame's idle time (or the next frame is due) checkpoint()
+    suspends it until the next frame.
+    """
+    def __init__(self, scheduler, seconds):
+        self.scheduler = scheduler
+        self.seconds = seconds
+        self.resumed = 0.0
+        self.frames = 0  # Frames the task has been held over to
+
+    async def checkpoint(self):
+        scheduler = self.scheduler
+        now = time.perf_counter()
+        started = max(self.resumed, scheduler.idle_start)
+        if now - started >= self.seconds or now >= scheduler.deadline:
+            await self.next_frame()
+
+    async def next_frame(self):
+        """Suspend the task until the idle time of the next frame"""
+        self.frames += 1
+        await self.scheduler.next_frame()
+        self.resumed = time.perf_counter()
+
+class FrameScheduler:
+    """Drives frame generators from an asyncio event loop and hosts background coroutines.
+
+    Background tasks only run in the idle time at the end of a frame, between
+    presenting it and the frame rate cap, so they never interleave with update or
+    render code. The frame is still finished by clock.tick, so frame pacing is the
+    same as in the blocking loop.
+    """
+    def __init__(self):
+        self.tasks = set()
+        self.frame_waiters = []
+        self.frames = 0
+        self.idle_start = 0.0
+        self.deadline = 0.0
+        self.frame_start = time.perf_counter()
+        self.poll_clock = pygame.time.Clock()  # Paces event polling while a screen waits for input
+
+    def spawn(self, coroutine_function, budget_ms=TASK_BUDGET_MS, name=None):
+        """Start a background task; coroutine_function(budget) gets the task's TaskBudget"""
+        budget = TaskBudget(self, budget_ms / 1000)
+        task = asyncio.get_running_loop().create_task(coroutine_function(budget), name=name)
+        self.tasks.add(task)
+        task.add_done_callback(self.task_done)
+        return task
+
+    def task_done(self, task):
+        self.tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log.error("Background task failed", task=task.get_name(), error=repr(task.exception()))
+
+    async def next_frame(self):
+        future = asyncio.get_running_loop().create_future()
+        self.frame_waiters.append(future)
+        await future
+
+    async def end_frame(self, fps, clock):
+        """Wait out the rest of the frame like clock.tick(fps), running background tasks meanwhile"""
+        self.frames += 1
+        now = time.perf_counter()
+        self.idle_start = now
+
+        # Idle for a whole number of milliseconds, so clock.tick's millisecond rounding
+        # comes out the same as in the blocking loop (clock.tick counts a frame as
+        # int(1000 / fps) ms). Background tasks and the event loop's timer, which may
+        # wake late, must be done ASYNC_SLEEP_SLACK before idle_end; the rest is a plain sleep
+        # and a final ASYNC_SPIN_TIME spin.
+        frame_end = self.frame_start + int(1000 / fps) / 1000 if fps else now
+        idle_end = now + max(0, int((frame_end - now) * 1000)) / 1000
+        self.deadline = idle_end - ASYNC_SLEEP_SLACK
+
+        # Resume tasks that are waiting for the next frame
+        waiters, self.frame_waiters = self.frame_waiters, []
+        for future in waiters:
+            if not future.done():
+                future.set_result(None)
+
+        # The event loop always gets one pass, even when the frame is already late
+        await asyncio.sleep(max(0.0, self.deadline - now))
+        remaining = idle_end - time.perf_counter() - ASYNC_SPIN_TIME
+        if remaining > 0:
+            time.sleep(remaining)  # Finer-grained than the event loop's millisecond timer
+        while time.perf_counter() < idle_end:
+            pass
+        clock.tick(fps)
+        self.frame_start = time.perf_counter()
+
+    async def run(self, frames, clock=None):
+        """Drive a frame generator (see run_frames) and return its result"""
+        try:
+            request = next(frames)
+            while True:
+                if request is WAIT_FOR_EVENT:
+                    # Block on the next event like run_frames(), unless tasks are waiting to
+                    # run: then poll, so they get each frame's idle time until they finish
+                    event = pygame.event.poll()
+                    while event.type == pygame.NOEVENT:
+                        if not self.tasks:
+                            event = pygame.event.wait()
+                            break
+                        await self.end_frame(ASYNC_EVENT_POLL_FPS, self.poll_clock)
+                        event = pygame.event.poll()
+                    request = frames.send(event)
+                else:
+                    await self.end_frame(request, clock)
+                    request = next(frames)
+        except StopIteration as stop:
+            return stop.value
+
+    async def shutdown(self):
+        """Cancel every background task and wait for them to finish"""
+        for task in list(self.tasks):
+            task.cancel()
+        if self.tasks:
+            await asyncio.gather(*self.tasks, return_exceptions=True)
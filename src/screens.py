@@ -0,0 +1,60 @@
+import os
+import pygame
+from src.constants import *
+from src.assets import load_image
+
+class ScreenCompositor:
+    """Builds the static layers of full-screen backgrounds once and caches them for the session.
+    
+    Transition and end screens are composited as background + darkening overlay +
+    static text into a single display-format surface, so showing a screen is one
+    blit plus the dynamic text (credits, level, reason) rendered on top.
+    """
+    def __init__(self):
+        self.cache = {}
+        
+    def load_background(self, paths, fallback_color=BLACK):
+        """Load and scale the first background that exists, or a solid color fallback"""
+        for path in paths:
+            if os.path.exists(path):
+                try:
+                    return load_image(path, (SCREEN_WIDTH, SCREEN_HEIGHT))
+                except pygame.error:
+                    pass  # Try the next format
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        surface.fill(fallback_color)
+        return surface
+    
+    def level_background(self, level):
+        """Return the cached background for a level (None for levels without one)"""
+        key = ('level', level)
+        if key not in self.cache:
+            if level in LEVEL_CONFIGS:
+                fallback = LEVEL_FALLBACK_COLORS.get(level, BLACK)
+                self.cache[key] = self.load_background([LEVEL_CONFIGS[level]['background']], fallback)
+            else:
+                self.cache[key] = None
+        return self.cache[key]
+    
+    def screen(self, name, static_text=(), variant=None):
+        """Return the cached composite for a transition/end screen.
+        
+        static_text is a sequence of (font, text, color, center) drawn into the
+        composite; pass a distinct variant when the static text differs.
+        """
+        key = (name, variant)
+        if key not in self.cache:
+            paths, overlay_alpha = SCREEN_BACKGROUNDS[name]
+            surface = self.load_background(paths)
+            
+            # Semi-transparent overlay for better text readability
+            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            overlay.fill((0, 0, 0))
+            overlay.set_alpha(overlay_alpha)
+            surface.blit(overlay, (0, 0))
+            
+            for font, text, color, center in static_text:
+                text_surface = font.render(text, False, color)
+                surface.blit(text_surface, text_surface.get_rect(center=center))
+            self.cache[key] = surface
+        return self.cache[key]
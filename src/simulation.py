@@ -0,0 +1,120 @@
+import sys
+import time
+import threading
+import statistics
+from collections import deque
+from src.constants import *
+from src.log import log
+from src.diagnostics import diagnostics
+
+class TickJitterMeter:
+    """Records when each simulation tick starts and summarises the spacing between ticks.
+
+    With a steady simulation every interval is 1/SIMULATION_HZ; in the serial loop a
+    slow frame shows up as a long gap followed by back-to-back catch-up ticks.
+    """
+    def __init__(self, capacity=JITTER_SAMPLES):
+        self.intervals = deque(maxlen=capacity)
+        self.last_tick = None
+
+    def reset(self):
+        """Forget the last tick (after pauses and wait screens, which are not jitter)"""
+        self.last_tick = None
+
+    def tick(self):
+        now = time.perf_counter()
+        if self.last_tick is not None:
+            self.intervals.append(now - self.last_tick)
+        self.last_tick = now
+
+    def summary(self):
+        """Return interval statistics in milliseconds, or None before two ticks"""
+        if len(self.intervals) < 2:
+            return None
+        intervals = sorted(self.intervals)
+        ideal = 1.0 / SIMULATION_HZ
+        return {
+            'ticks': len(intervals),
+            'mean_ms': statistics.fmean(intervals) * 1000,
+            'stdev_ms': statistics.pstdev(intervals) * 1000,
+            'p99_ms': intervals[int(len(intervals) * 0.99)] * 1000,
+            'max_ms': intervals[-1] * 1000,
+            'late_ticks': sum(1 for interval in intervals if interval > ideal * 1.5)
+        }
+
+    def report(self, mode):
+        summary = self.summary()
+        if summary is None:
+            return
+        log.info("Simulation jitter", mode=mode, ticks=summary['ticks'],
+                 mean_ms=f"{summary['mean_ms']:.2f}", stdev_ms=f"{summary['stdev_ms']:.2f}",
+                 p99_ms=f"{summary['p99_ms']:.2f}", max_ms=f"{summary['max_ms']:.2f}",
+                 late_ticks=summary['late_ticks'])
+
+class SimulationThread:
+    """Runs Game.simulation_tick at SIMULATION_HZ on a worker thread.
+
+    After each batch of ticks the thread publishes a render snapshot to
+    game.snapshots. It stops by itself when the level is complete or the game is
+    over, and stop() ends it early (pauses, quitting). An exception in the
+    simulation is kept in error and re-raised by the main thread.
+    """
+    def __init__(self, game):
+        self.game = game
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.error = None
+        self.switch_interval = None
+
+    def start(self):
+        # Hand the GIL over more often than the 5ms default, so a tick is not held up by a render
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(SIM_SWITCH_INTERVAL)
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name="simulation", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Ask the thread to finish its current tick and wait for it"""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if self.switch_interval is not None:
+            sys.setswitchinterval(self.switch_interval)
+            self.switch_interval = None
+
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def run(self):
+        game = self.game
+        tick_length = 1.0 / SIMULATION_HZ
+        next_tick = time.perf_counter()
+        try:
+            while not self.stop_event.is_set():
+                ticks = 0
+                while time.perf_counter() >= next_tick and ticks < MAX_CATCHUP_TICKS:
+                    if game.autopilot is not None:
+                        game.input_keys = game.autopilot.keys(game)  # The pilot reads the entities, so between ticks here
+                    game.simulation_tick()
+                    next_tick += tick_length
+                    ticks += 1
+                    if game.game_over or game.level_complete or game.tick_limit_reached():
+                        game.snapshots.publish(game.build_snapshot())
+                        return
+
+                # Too far behind: drop the backlog (same rule as the serial loop)
+                if ticks == MAX_CATCHUP_TICKS and time.perf_counter() >= next_tick:
+                    next_tick = time.perf_counter()
+                if ticks:
+                    diagnostics.update(game)  # Between ticks, while the entity lists hold still
+                    game.snapshots.publish(game.build_snapshot())
+
+                self.stop_event.wait(max(0.0, next_tick - time.perf_counter()))
+        except Exception as e:
+            self.error = e
+            log.error("Simulation thread failed", error=repr(e))
+
+# Tick spacing of the simulation, whichever thread runs it
+tick_jitter = TickJitterMeter()
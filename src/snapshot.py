@@ -0,0 +1,40 @@
+import threading
+from collections import namedtuple
+
+# HUD values captured with a snapshot (boss_health is None when there is no boss,
+# wave and peak_entities are None outside endless mode)
+HudState = namedtuple('HudState', ['level', 'credits', 'enemy_count', 'boss_health', 'boss_max_health',
+                                   'boss_exploding', 's3_timer', 'load_balancer_timer', 'side_ships',
+                                   'wave', 'peak_entities'])
+
+# Everything needed to draw one simulation tick. layers is a tuple of (layer name,
+# entries) in RENDER_LAYERS order; each entry is (image, x, y, previous_x, previous_y),
+# with the previous position taken before the tick so the renderer can interpolate.
+# Images are shared surfaces, which are never modified once built.
+RenderSnapshot = namedtuple('RenderSnapshot', ['tick_time', 'background', 'layers', 'hud'])
+
+class SnapshotBuffer:
+    """Double buffer between the simulation and the renderer.
+
+    The simulation builds each snapshot privately (the back buffer) and publishes
+    it in one swap; the renderer always reads the latest complete snapshot (the
+    front buffer). Snapshots are immutable, so neither side ever waits on the other
+    for longer than the swap.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.front = None
+        self.published = 0
+
+    def publish(self, snapshot):
+        with self.lock:
+            self.front = snapshot
+            self.published += 1
+
+    def latest(self):
+        with self.lock:
+            return self.front
+
+    def clear(self):
+        with self.lock:
+            self.front = None
@@ -0,0 +1,160 @@
+import os
+import json
+import mmap
+import atexit
+import struct
+import pygame
+from src.constants import *
+from src.log import log
+
+# File layout: header, JSON index, then the raw pixel buffers back to back
+CACHE_MAGIC = b'CISC'
+CACHE_VERSION = 1
+HEADER = struct.Struct('<4sII')  # magic, version, index length in bytes
+
+class SpriteCache:
+    """On-disk cache of decoded and pre-scaled images, memory-mapped on first use.
+
+    Entries are keyed by source path and target size and remember the source file's
+    mtime and byte size, so changed art is simply treated as a miss. New entries are
+    collected in memory and the whole file is rewritten once at exit (stale entries
+    are dropped then).
+    """
+    def __init__(self, path=SPRITE_CACHE_PATH):
+        self.path = path
+        self.index = {}
+        self.data = None  # memoryview over the pixel section of the mapped file
+        self.mapped = None
+        self.opened = False
+        self.pending = {}
+        self.hits = 0
+        self.misses = 0
+        self.save_registered = False
+
+    def open(self):
+        """Map the cache file and read its index (a missing or broken file is an empty cache)"""
+        self.opened = True
+        try:
+            with open(self.path, 'rb') as cache_file:
+                self.mapped = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, index_length = HEADER.unpack_from(self.mapped, 0)
+            if magic != CACHE_MAGIC or version != CACHE_VERSION:
+                raise ValueError("unknown sprite cache format")
+            index_end = HEADER.size + index_length
+            self.index = json.loads(bytes(self.mapped[HEADER.size:index_end]))
+            self.data = memoryview(self.mapped)[index_end:]
+            log.debug("Sprite cache opened", path=self.path, entries=len(self.index))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning("Ignoring unreadable sprite cache", path=self.path, error=e)
+            self.index = {}
+            self.data = None
+
+    @staticmethod
+    def key(path, size):
+        """Index key for an image loaded at a target size (None = original size)"""
+        return f"{path}|{size[0]}x{size[1]}" if size else f"{path}|original"
+
+    @staticmethod
+    def source_stamp(path):
+        """mtime and byte size of the source image, used to detect changed art"""
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, path, size=None):
+        """Return the cached surface for path at size, or None on a miss"""
+        if not self.opened:
+            self.open()
+        entry = self.index.get(self.key(path, size))
+        try:
+            fresh = entry is not None and self.data is not None and \
+                (entry['mtime'], entry['bytes']) == self.source_stamp(path)
+        except OSError:
+            fresh = False  # Let pygame.image.load raise for a missing source
+        if not fresh:
+            self.misses += 1
+            return None
+        self.hits += 1
+        pixels = self.data[entry['offset']:entry['offset'] + entry['length']]
+        return pygame.image.frombuffer(pixels, (entry['width'], entry['height']), entry['format'])
+
+    def put(self, path, size, surface):
+        """Queue a decoded, scaled surface to be written with the next save"""
+        width, height = surface.get_size()
+        if surface.get_colorkey() is not None:
+            pixel_format = 'RGBA'
+        elif surface.get_flags() & pygame.SRCALPHA:
+            # Many backgrounds are saved with an alpha channel they never use
+            opaque = pygame.mask.from_surface(surface, 254).count() == width * height
+            pixel_format = 'RGB' if opaque else 'RGBA'
+        else:
+            pixel_format = 'RGB'
+        mtime, source_bytes = self.source_stamp(path)
+        entry = {
+            'mtime': mtime,
+            'bytes': source_bytes,
+            'width': width,
+            'height': height,
+            'format': pixel_format
+        }
+        self.pending[self.key(path, size)] = (entry, pygame.image.tobytes(surface, pixel_format))
+        if not self.save_registered:
+            atexit.register(self.save)
+            self.save_registered = True
+
+    def save(self):
+        """Rewrite the cache file with every still-valid entry plus the new ones"""
+        if not self.pending:
+            return
+        index = {}
+        chunks = []
+        offset = 0
+        dropped = 0
+
+        for key, entry in self.index.items():
+            if key in self.pending:
+                continue
+            path = key.rsplit('|', 1)[0]
+            try:
+                stale = (entry['mtime'], entry['bytes']) != self.source_stamp(path)
+            except OSError:
+                stale = True
+            if stale:
+                dropped += 1
+                continue
+            chunks.append(self.data[entry['offset']:entry['offset'] + entry['length']])
+            index[key] = dict(entry, offset=offset)
+            offset += entry['length']
+
+        for key, (entry, pixels) in self.pending.items():
+            chunks.append(pixels)
+            index[key] = dict(entry, offset=offset, length=len(pixels))
+            offset += len(pixels)
+
+        index_data = json.dumps(index).encode()
+        temp_path = self.path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(temp_path, 'wb') as cache_file:
+                cache_file.write(HEADER.pack(CACHE_MAGIC, CACHE_VERSION, len(index_data)))
+                cache_file.write(index_data)
+                for chunk in chunks:
+                    cache_file.write(chunk)
+            # Readers keep the old file mapped; replacing it never touches their pages
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            log.warning("Could not write sprite cache", path=self.path, error=e)
+            return
+
+        log.info("Sprite cache saved", path=self.path, entries=len(index),
+                 added=len(self.pending), dropped=dropped, bytes=HEADER.size + len(index_data) + offset)
+        self.pending = {}
+        # Map the new file on next use; surfaces still built from the old mapping keep it alive
+        self.opened = False
+        self.index = {}
+        self.data = None
+        self.mapped = None
+
+# Global sprite cache used by assets.load_image
+sprite_cache = SpriteCache()
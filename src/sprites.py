@@ -2,58 +2,43 @@ import pygame
 import random
 import os
 from src.constants import *
+from src.log import log
+from src import assets
+from src.entities import Entity
 
-class Player(pygame.sprite.Sprite):
+# Surfaces shared by every instance of a sprite type. They are built once and never
+# drawn on afterwards, so sprites switch visuals by reference instead of copying.
+shared_surfaces = {}
+
+def shared_surface(key, build):
+    """Return the shared surface for key, building it on first use"""
+    surface = shared_surfaces.get(key)
+    if surface is None:
+        surface = build()
+        shared_surfaces[key] = surface
+    return surface
+
+def tinted_surface(image, color, alpha):
+    """Build a copy of image with a translucent color overlay on its visible pixels"""
+    tinted = image.convert_alpha()
+    overlay = pygame.mask.from_surface(tinted, 0).to_surface(setcolor=(*color, alpha), unsetcolor=(0, 0, 0, 0))
+    tinted.blit(overlay, (0, 0))
+    return assets.optimize_surface(tinted)[0]
+
+class Player(Entity):
+    kind = 'player'  # EntityRegistry list
+    __slots__ = ('normal_image', 'shadow_image', 's3_image', 'speed', 'credits', 'cooldown', 'cooldown_time',
+                 'invincible', 'invincible_timer', 'invincible_duration', 'glitch_timer', 'use_shadow', 's3_power',
+                 's3_timer', 's3_duration', 'load_balancer_power', 'load_balancer_timer', 'load_balancer_duration')
     def __init__(self):
         super().__init__()
         
-        # Try to load sprite images
-        sprite_path = "assets/images/ship/starship_cirrus.png"
-        shadow_path = "assets/images/ship/starship_cirrus_shadow.png"
-        s3_path = "assets/images/ship/s3_powered_player_ship.png"
+        # Sprite images are shared between games (and with the side ships)
+        self.normal_image = shared_surface('ship_normal', self.load_normal_image)
+        self.shadow_image = shared_surface('ship_shadow', self.load_shadow_image)
+        self.s3_image = shared_surface('ship_s3', self.load_s3_image)
         
-        if os.path.exists(sprite_path):
-            self.normal_image = pygame.image.load(sprite_path)
-            self.normal_image = pygame.transform.scale(self.normal_image, PLAYER_SPRITE_SIZE)
-        else:
-            # Create the normal Starship Cirrus player ship (fallback)
-            self.normal_image = pygame.Surface(PLAYER_SPRITE_SIZE)
-            self.normal_image.fill(AWS_ORANGE)
-            
-            # Add AWS logo-like design
-            center_x, center_y = PLAYER_SPRITE_SIZE[0] // 2, PLAYER_SPRITE_SIZE[1] // 2
-            pygame.draw.polygon(self.normal_image, AWS_BLUE, [
-                (center_x, center_y - 15), 
-                (center_x + 20, center_y), 
-                (center_x, center_y + 15), 
-                (center_x - 20, center_y)
-            ])
-        
-        # Load shadow sprite
-        if os.path.exists(shadow_path):
-            self.shadow_image = pygame.image.load(shadow_path)
-            self.shadow_image = pygame.transform.scale(self.shadow_image, PLAYER_SPRITE_SIZE)
-        else:
-            # Create shadow fallback (darker version of normal sprite)
-            self.shadow_image = self.normal_image.copy()
-            shadow_overlay = pygame.Surface(PLAYER_SPRITE_SIZE)
-            shadow_overlay.fill((0, 0, 0))
-            shadow_overlay.set_alpha(150)  # Semi-transparent black
-            self.shadow_image.blit(shadow_overlay, (0, 0))
-        
-        # Load S3 powered sprite
-        if os.path.exists(s3_path):
-            self.s3_image = pygame.image.load(s3_path)
-            self.s3_image = pygame.transform.scale(self.s3_image, PLAYER_SPRITE_SIZE)
-        else:
-            # Create S3 fallback (green tinted version)
-            self.s3_image = self.normal_image.copy()
-            s3_overlay = pygame.Surface(PLAYER_SPRITE_SIZE)
-            s3_overlay.fill((0, 255, 0))
-            s3_overlay.set_alpha(100)
-            self.s3_image.blit(s3_overlay, (0, 0))
-        
-        self.image = self.normal_image.copy()
+        self.image = self.normal_image
         self.rect = self.image.get_rect()
         self.rect.x = SCREEN_WIDTH // 2 - PLAYER_SPRITE_SIZE[0] // 2
         self.rect.y = SCREEN_HEIGHT - PLAYER_SPRITE_SIZE[1] - 10
@@ -77,8 +62,43 @@ class Player(pygame.sprite.Sprite):
         self.load_balancer_power = False
         self.load_balancer_timer = 0
         self.load_balancer_duration = 600  # 10 seconds at 60fps
+    
+    @staticmethod
+    def load_normal_image():
+        sprite_path = "assets/images/ship/starship_cirrus.png"
+        if os.path.exists(sprite_path):
+            return assets.load_image(sprite_path, PLAYER_SPRITE_SIZE)
+        
+        # Create the normal Starship Cirrus player ship (fallback)
+        normal_image = pygame.Surface(PLAYER_SPRITE_SIZE)
+        normal_image.fill(AWS_ORANGE)
+        
+        # Add AWS logo-like design
+        center_x, center_y = PLAYER_SPRITE_SIZE[0] // 2, PLAYER_SPRITE_SIZE[1] // 2
+        pygame.draw.polygon(normal_image, AWS_BLUE, [
+            (center_x, center_y - 15), 
+            (center_x + 20, center_y), 
+            (center_x, center_y + 15), 
+            (center_x - 20, center_y)
+        ])
+        return normal_image
+    
+    def load_shadow_image(self):
+        shadow_path = "assets/images/ship/starship_cirrus_shadow.png"
+        if os.path.exists(shadow_path):
+            return assets.load_image(shadow_path, PLAYER_SPRITE_SIZE)
+        # Create shadow fallback (darker version of normal sprite)
+        return tinted_surface(self.normal_image, (0, 0, 0), 150)
+    
+    def load_s3_image(self):
+        s3_path = "assets/images/ship/s3_powered_player_ship.png"
+        if os.path.exists(s3_path):
+            return assets.load_image(s3_path, PLAYER_SPRITE_SIZE)
+        # Create S3 fallback (green tinted version)
+        return tinted_surface(self.normal_image, (0, 255, 0), 100)
 
-    def update(self):
+    def update(self, keys):
+        """Advance one tick; keys is the keyboard state captured by the game this frame"""
         # Handle S3 power-up
         if self.s3_power:
             self.s3_timer -= 1
@@ -103,9 +123,9 @@ class Player(pygame.sprite.Sprite):
                     
                 # Apply the appropriate sprite
                 if self.use_shadow:
-                    self.image = self.shadow_image.copy()
+                    self.image = self.shadow_image
                 else:
-                    self.image = self.s3_image.copy() if self.s3_power else self.normal_image.copy()
+                    self.image = self.s3_image if self.s3_power else self.normal_image
                 
                 # End invincibility
                 if self.invincible_timer <= 0:
@@ -113,10 +133,10 @@ class Player(pygame.sprite.Sprite):
                     self.use_shadow = False
             else:
                 # S3 power without invincibility glitch
-                self.image = self.s3_image.copy()
+                self.image = self.s3_image
         else:
             # Use normal sprite when no special effects
-            self.image = self.normal_image.copy()
+            self.image = self.normal_image
             
         # Decrease cooldown timer
         if self.cooldown > 0:
@@ -124,14 +144,12 @@ class Player(pygame.sprite.Sprite):
             
         # Get keyboard input (only if not invincible)
         if not self.invincible:
-            keys = pygame.key.get_pressed()
             if keys[pygame.K_LEFT] and self.rect.left > 0:
                 self.rect.x -= self.speed
             if keys[pygame.K_RIGHT] and self.rect.right < SCREEN_WIDTH:
                 self.rect.x += self.speed
         else:
             # Limited movement during invincibility (50% speed)
-            keys = pygame.key.get_pressed()
             if keys[pygame.K_LEFT] and self.rect.left > 0:
                 self.rect.x -= self.speed // 2
             if keys[pygame.K_RIGHT] and self.rect.right < SCREEN_WIDTH:
@@ -186,7 +204,10 @@ class Player(pygame.sprite.Sprite):
             self.load_balancer_timer = self.load_balancer_duration
         # Auto scaling is handled externally by the game
 
-class Enemy(pygame.sprite.Sprite):
+class Enemy(Entity):
+    kind = 'ec2'  # EntityRegistry list
+    __slots__ = ('level', 'config', 'health', 'max_health', 'stationary', 'boss_level_mode', 'shoot_timer',
+                 'shoot_interval', 'original_image', 'direction', 'speed', 'spawn_y')
     def __init__(self, x, y, level=1, stationary=False):
         super().__init__()
         
@@ -196,6 +217,7 @@ class Enemy(pygame.sprite.Sprite):
         self.max_health = self.health
         self.stationary = stationary  # For boss-spawned stationary enemies
         self.boss_level_mode = False  # Flag for boss level behavior
+        self.spawn_y = None  # Y position locked on the first boss level move
         
         # Shooting timer system
         self.shoot_timer = 0
@@ -204,33 +226,35 @@ class Enemy(pygame.sprite.Sprite):
         if self.shoot_interval > 0:
             self.shoot_timer = random.randint(0, self.shoot_interval)
         
-        # Load appropriate sprite based on level
-        sprite_path = self.config['enemy_sprite']
-        if os.path.exists(sprite_path):
-            self.image = pygame.image.load(sprite_path)
-            self.image = pygame.transform.scale(self.image, ENEMY_SPRITE_SIZE)
-        else:
-            # Create generated sprite (fallback)
-            self.image = pygame.Surface(ENEMY_SPRITE_SIZE)
-            color = AWS_ORANGE if level == 1 else (153, 50, 204)  # Purple for DynamoDB
-            self.image.fill(color)
-            
-            # Add service text
-            try:
-                font = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 20)
-            except:
-                font = pygame.font.SysFont(None, 24)
-            text = font.render(self.config['enemy_type'], False, WHITE)
-            text_rect = text.get_rect(center=(ENEMY_SPRITE_SIZE[0]//2, ENEMY_SPRITE_SIZE[1]//2))
-            self.image.blit(text, text_rect)
-        
-        self.original_image = self.image.copy()  # Store original for damage effects
+        # Load appropriate sprite based on level (shared by all enemies of the level)
+        self.image = shared_surface(('enemy', level), self.load_image)
+        self.original_image = self.image  # Undamaged sprite for damage effects
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
         self.direction = 1  # 1 for right, -1 for left
         self.speed = self.config['enemy_speed']
     
+    def load_image(self):
+        sprite_path = self.config['enemy_sprite']
+        if os.path.exists(sprite_path):
+            return assets.load_image(sprite_path, ENEMY_SPRITE_SIZE)
+        
+        # Create generated sprite (fallback)
+        image = pygame.Surface(ENEMY_SPRITE_SIZE)
+        color = AWS_ORANGE if self.level == 1 else (153, 50, 204)  # Purple for DynamoDB
+        image.fill(color)
+        
+        # Add service text
+        try:
+            font = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 20)
+        except:
+            font = pygame.font.SysFont(None, 24)
+        text = font.render(self.config['enemy_type'], False, WHITE)
+        text_rect = text.get_rect(center=(ENEMY_SPRITE_SIZE[0]//2, ENEMY_SPRITE_SIZE[1]//2))
+        image.blit(text, text_rect)
+        return image
+    
     def set_boss_level_mode(self, boss_mode=True):
         """Set whether this enemy should use boss level movement (horizontal only)"""
         self.boss_level_mode = boss_mode
@@ -252,7 +276,7 @@ class Enemy(pygame.sprite.Sprite):
             # Movement behavior depends on boss level mode
             if self.boss_level_mode:
                 # BOSS LEVEL: Lock Y position for horizontal-only movement
-                if not hasattr(self, 'spawn_y'):
+                if self.spawn_y is None:
                     self.spawn_y = self.rect.y
                 # Force Y position to stay at spawn height
                 self.rect.y = self.spawn_y
@@ -280,30 +304,29 @@ class Enemy(pygame.sprite.Sprite):
         """Handle taking damage and return True if enemy is destroyed"""
         self.health -= 1
         
-        # Visual damage effect - make sprite more transparent/red
+        # Visual damage effect - switch to the shared red-tinted sprite for this health
         if self.health > 0:
             damage_ratio = 1 - (self.health / self.max_health)
-            # Create damage effect by tinting red
-            self.image = self.original_image.copy()
-            red_overlay = pygame.Surface(ENEMY_SPRITE_SIZE)
-            red_overlay.fill((255, 0, 0))
-            red_overlay.set_alpha(int(100 * damage_ratio))
-            self.image.blit(red_overlay, (0, 0))
+            self.image = shared_surface(('enemy_damage', self.level, self.health),
+                                        lambda: tinted_surface(self.original_image, (255, 0, 0), int(100 * damage_ratio)))
             
         return self.health <= 0
 
 class DynamoDBEnemy(Enemy):
+    kind = 'dynamodb'  # EntityRegistry list
+    __slots__ = ('charge_timer', 'charge_time', 'charge_rate', 'is_charging')
     def __init__(self, x, y):
         super().__init__(x, y, level=2)
         self.charge_timer = 0
         self.charge_time = random.randint(DYNAMODB_CHARGE_TIME_MIN, DYNAMODB_CHARGE_TIME_MAX)
+        self.charge_rate = 1  # Charge gained per tick (endless mode raises it)
         self.is_charging = False
         
     def update(self):
         super().update()
         
         # Handle charging system
-        self.charge_timer += 1
+        self.charge_timer += self.charge_rate
         if self.charge_timer >= self.charge_time:
             self.is_charging = True
             
@@ -325,19 +348,15 @@ class DynamoDBEnemy(Enemy):
             return asteroids
         return []
 
-class Asteroid(pygame.sprite.Sprite):
+class Asteroid(Entity):
+    kind = 'asteroid'  # EntityRegistry list
+    __slots__ = ('speed', 'drift')
     def __init__(self, x, y):
         super().__init__()
         
         # Randomly choose an asteroid sprite
         sprite_path = random.choice(ASTEROID_SPRITES)
-        if os.path.exists(sprite_path):
-            self.image = pygame.image.load(sprite_path)
-            self.image = pygame.transform.scale(self.image, (32, 32))  # Smaller than enemies
-        else:
-            # Fallback asteroid
-            self.image = pygame.Surface((32, 32))
-            self.image.fill((139, 69, 19))  # Brown color
+        self.image = shared_surface(('asteroid', sprite_path), lambda: self.load_image(sprite_path))
             
         self.rect = self.image.get_rect()
         self.rect.centerx = x
@@ -346,6 +365,14 @@ class Asteroid(pygame.sprite.Sprite):
         
         # Add some random horizontal drift
         self.drift = random.uniform(-1, 1)
+    
+    def load_image(self, sprite_path):
+        if os.path.exists(sprite_path):
+            return assets.load_image(sprite_path, (32, 32))  # Smaller than enemies
+        # Fallback asteroid
+        image = pygame.Surface((32, 32))
+        image.fill((139, 69, 19))  # Brown color
+        return image
         
     def update(self):
         self.rect.y += self.speed
@@ -355,11 +382,22 @@ class Asteroid(pygame.sprite.Sprite):
         if self.rect.top > SCREEN_HEIGHT:
             self.kill()
 
-class PowerUp(pygame.sprite.Sprite):
+class PowerUp(Entity):
+    kind = 'power_up'  # EntityRegistry list
+    __slots__ = ('power_type', 'speed_y')
     def __init__(self, x, y, power_type):
         super().__init__()
         self.power_type = power_type
         
+        # Load power-up sprite (shared by all power-ups of this type)
+        self.image = shared_surface(('power_up', power_type), self.load_image)
+        
+        self.rect = self.image.get_rect()
+        self.rect.x = x
+        self.rect.y = y
+        self.speed_y = 2  # Slow fall speed
+    
+    def load_image(self):
         # Load power-up sprites
         power_up_images = {
             's3': 'assets/images/power_ups/s3.png',
@@ -368,27 +406,22 @@ class PowerUp(pygame.sprite.Sprite):
         }
         
         try:
-            self.image = pygame.image.load(power_up_images[power_type])
-            self.image = pygame.transform.scale(self.image, (48, 48))  # Smaller than enemies
+            return assets.load_image(power_up_images[self.power_type], (48, 48))  # Smaller than enemies
         except:
             # Fallback power-up
-            self.image = pygame.Surface((48, 48))
+            image = pygame.Surface((48, 48))
             colors = {'s3': (0, 255, 0), 'load_balancer': (0, 0, 255), 'auto_scaling': (255, 255, 0)}
-            self.image.fill(colors.get(power_type, (255, 255, 255)))
+            image.fill(colors.get(self.power_type, (255, 255, 255)))
             
             # Add text label
             try:
                 font = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 8)
             except:
                 font = pygame.font.SysFont(None, 16)
-            text = font.render(power_type.upper()[:2], False, BLACK)
+            text = font.render(self.power_type.upper()[:2], False, BLACK)
             text_rect = text.get_rect(center=(24, 24))
-            self.image.blit(text, text_rect)
-        
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
-        self.speed_y = 2  # Slow fall speed
+            image.blit(text, text_rect)
+            return image
         
     def update(self):
         self.rect.y += self.speed_y
@@ -397,20 +430,16 @@ class PowerUp(pygame.sprite.Sprite):
         if self.rect.top > SCREEN_HEIGHT:
             self.kill()
 
-class SideShip(pygame.sprite.Sprite):
+class SideShip(Entity):
     """Auto Scaling duplicate ships"""
+    kind = 'side_ship'  # EntityRegistry list
+    __slots__ = ('side', 'speed', 'cooldown', 'cooldown_time')
     def __init__(self, x, y, side='left'):
         super().__init__()
         self.side = side
         
-        # Load ship sprite (same as player)
-        try:
-            self.image = pygame.image.load("assets/images/ship/starship_cirrus.png")
-            self.image = pygame.transform.scale(self.image, PLAYER_SPRITE_SIZE)
-        except:
-            # Fallback
-            self.image = pygame.Surface(PLAYER_SPRITE_SIZE)
-            self.image.fill(AWS_ORANGE)
+        # Ship sprite (same shared surface as the player)
+        self.image = shared_surface('ship_normal', Player.load_normal_image)
         
         self.rect = self.image.get_rect()
         self.rect.x = x
@@ -449,22 +478,26 @@ class SideShip(pygame.sprite.Sprite):
             return Laser(self.rect.centerx, self.rect.top, -10)
         return None
 
-class Laser(pygame.sprite.Sprite):
+class Laser(Entity):
+    # No kind: the game files lasers under 'player_laser' or 'enemy_laser' by who fired them
+    __slots__ = ('speed', 'speed_x')
     def __init__(self, x, y, speed):
         super().__init__()
-        self.image = pygame.Surface([4, 15])
-        
         # Player lasers are blue, enemy lasers are red
-        if speed < 0:  # Player laser (moving up)
-            self.image.fill(BLUE)
-        else:  # Enemy laser (moving down)
-            self.image.fill(RED)
+        color = BLUE if speed < 0 else RED
+        self.image = shared_surface(('laser', color), lambda: self.build_image(color))
             
         self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.y = y
         self.speed = speed
         self.speed_x = 0  # For Load Balancer spread effect
+    
+    @staticmethod
+    def build_image(color):
+        image = pygame.Surface([4, 15])
+        image.fill(color)
+        return image
         
     def update(self):
         self.rect.y += self.speed
@@ -473,13 +506,38 @@ class Laser(pygame.sprite.Sprite):
         if self.rect.bottom < 0 or self.rect.top > SCREEN_HEIGHT or self.rect.right < 0 or self.rect.left > SCREEN_WIDTH:
             self.kill()
 
-class LaserBeam(pygame.sprite.Sprite):
-    """Lambda's charged laser beam that lasts for 1 second and follows Lambda movement"""
+def beam_hits(beam_rect, rect):
+    """Return True if rect overlaps a beam's column below its top (beams reach the bottom of the screen)"""
+    return (rect.right > beam_rect.left and rect.left < beam_rect.right
+            and rect.bottom > beam_rect.top)
+
+def beam_frames(width, colors):
+    """Return the shared full-height flash frames of a beam (one per color)"""
+    frames = []
+    for color in colors:
+        def build(color=color):
+            frame = pygame.Surface((width, SCREEN_HEIGHT))
+            frame.fill(color)
+            return frame
+        frames.append(shared_surface(('beam', width, color), build))
+    return frames
+
+class LaserBeam(Entity):
+    """Lambda's charged laser beam that lasts for 1 second and follows Lambda movement.
+    
+    The beam only owns its position: it is drawn with shared pre-rendered flash
+    frames and collides as an x-interval reaching from its top to the bottom of
+    the screen (see hits()).
+    """
+    kind = 'laser_beam'  # EntityRegistry list
+    __slots__ = ('frames', 'lambda_enemy', 'duration', 'timer')
+    width = 4
+    
     def __init__(self, lambda_enemy):
         super().__init__()
-        # Create a thin vertical laser beam
-        self.image = pygame.Surface((4, SCREEN_HEIGHT))
-        self.image.fill(YELLOW)  # Bright yellow laser beam
+        # Thin vertical laser beam flashing between bright yellow and white
+        self.frames = beam_frames(self.width, (YELLOW, WHITE))
+        self.image = self.frames[0]
         
         self.rect = self.image.get_rect()
         self.lambda_enemy = lambda_enemy  # Reference to the Lambda that created this beam
@@ -489,31 +547,38 @@ class LaserBeam(pygame.sprite.Sprite):
         # Laser beam duration (1 second at 60fps)
         self.duration = 60
         self.timer = 0
+    
+    def hits(self, rect):
+        return beam_hits(self.rect, rect)
         
     def update(self):
         self.timer += 1
         
-        # Follow the Lambda's horizontal movement
-        if self.lambda_enemy and hasattr(self.lambda_enemy, 'rect'):
-            self.rect.centerx = self.lambda_enemy.rect.centerx
+        # Follow the Lambda's horizontal movement; let go of it once it is destroyed
+        if self.lambda_enemy is not None:
+            if self.lambda_enemy.alive():
+                self.rect.centerx = self.lambda_enemy.rect.centerx
+            else:
+                self.lambda_enemy = None
         
-        # Flash effect - alternate between yellow and white
-        if self.timer % 6 < 3:  # Flash every 6 frames
-            self.image.fill(YELLOW)
-        else:
-            self.image.fill(WHITE)
+        # Flash effect - alternate between yellow and white every 3 frames
+        self.image = self.frames[0 if self.timer % 6 < 3 else 1]
         
         # Remove after duration
         if self.timer >= self.duration:
             self.kill()
 
-class BossLaser(pygame.sprite.Sprite):
-    """Boss's massive laser beam that follows the boss"""
+class BossLaser(Entity):
+    """Boss's massive laser beam that follows the boss (drawn and collided like LaserBeam)"""
+    kind = 'boss_laser'  # EntityRegistry list
+    __slots__ = ('frames', 'boss', 'duration', 'timer')
+    width = 12
+    
     def __init__(self, boss):
         super().__init__()
-        # Create a thick vertical laser beam
-        self.image = pygame.Surface((12, SCREEN_HEIGHT))
-        self.image.fill(RED)  # Red boss laser
+        # Thick vertical laser beam flashing between red and orange
+        self.frames = beam_frames(self.width, (RED, (255, 100, 0)))
+        self.image = self.frames[0]
         
         self.rect = self.image.get_rect()
         self.boss = boss  # Reference to the boss
@@ -523,30 +588,39 @@ class BossLaser(pygame.sprite.Sprite):
         # Laser beam duration (5 seconds at 60fps)
         self.duration = BOSS_LASER_DURATION
         self.timer = 0
+    
+    def hits(self, rect):
+        return beam_hits(self.rect, rect)
         
     def update(self):
         self.timer += 1
         
-        # Follow the boss's horizontal movement
-        if self.boss and hasattr(self.boss, 'rect'):
-            self.rect.centerx = self.boss.rect.centerx
+        # Follow the boss's horizontal movement; let go of it once it is destroyed
+        if self.boss is not None:
+            if self.boss.alive():
+                self.rect.centerx = self.boss.rect.centerx
+            else:
+                self.boss = None
         
-        # Flash effect - alternate between red and orange
-        if self.timer % 8 < 4:  # Flash every 8 frames
-            self.image.fill(RED)
-        else:
-            self.image.fill((255, 100, 0))  # Orange
+        # Flash effect - alternate between red and orange every 4 frames
+        self.image = self.frames[0 if self.timer % 8 < 4 else 1]
         
         # Remove after duration
         if self.timer >= self.duration:
             self.kill()
 
-class CloudFormationBoss(pygame.sprite.Sprite):
+class CloudFormationBoss(Entity):
     """CloudFormation boss enemy with multiple abilities and explosion sequence"""
+    kind = 'boss'  # EntityRegistry list
+    __slots__ = ('sprites', 'explosion_sprites', 'current_sprite', 'fade_frames', 'max_health', 'health', 'speed_x',
+                 'boss_direction', 'ability_timer', 'ability_interval', 'ability_chance', 'ability_active',
+                 'ability_duration', 'ability_timer_active', 'ability_warning', 'ability_warning_timer',
+                 'next_ability', 'laser_active', 'laser_timer', 'alpha', 'fading_in', 'fade_timer', 'intro_complete',
+                 'exploding', 'explosion_frame', 'explosion_timer', 'explosion_positions', 'spawn_y')
     def __init__(self, x, y):
         super().__init__()
         
-        # Load boss sprites for different abilities
+        # Load boss sprites for different abilities (shared between games)
         self.sprites = {}
         # Map expected names to actual file names in the codebase
         sprite_mapping = {
@@ -558,53 +632,19 @@ class CloudFormationBoss(pygame.sprite.Sprite):
         }
         
         for sprite_key, sprite_filename in sprite_mapping.items():
-            try:
-                sprite = pygame.image.load(f"assets/images/enemies/boss/{sprite_filename}")
-                self.sprites[sprite_key] = pygame.transform.scale(sprite, BOSS_SIZE)
-            except:
-                # Fallback sprites
-                fallback = pygame.Surface(BOSS_SIZE)
-                fallback.fill((100, 100, 100))  # Gray cloud
-                
-                try:
-                    font = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 12)
-                except:
-                    font = pygame.font.SysFont(None, 16)
-                
-                # Different text for different abilities
-                if 'laser' in sprite_key:
-                    text = font.render("CF-L", False, RED)
-                elif 'ec2' in sprite_key:
-                    text = font.render("CF-E", False, BLUE)
-                elif 'dynamodb' in sprite_key:
-                    text = font.render("CF-D", False, PURPLE)
-                elif 'lambda' in sprite_key:
-                    text = font.render("CF-λ", False, YELLOW)
-                else:
-                    text = font.render("CF", False, WHITE)
-                
-                text_rect = text.get_rect(center=(BOSS_SIZE[0]//2, BOSS_SIZE[1]//2))
-                fallback.blit(text, text_rect)
-                self.sprites[sprite_key] = fallback
+            self.sprites[sprite_key] = shared_surface(('boss', sprite_key),
+                                                      lambda: self.load_sprite(sprite_key, sprite_filename))
         
-        # Load explosion sprites from the explosion directory
-        self.explosion_sprites = []
-        for i in range(1, 10):  # 1.png to 9.png
-            try:
-                explosion = pygame.image.load(f"assets/images/explosion/{i}.png")
-                explosion = pygame.transform.scale(explosion, BOSS_SIZE)
-                self.explosion_sprites.append(explosion)
-            except:
-                # Fallback explosion frame
-                explosion = pygame.Surface(BOSS_SIZE)
-                colors = [(255, 255, 0), (255, 200, 0), (255, 100, 0), (255, 50, 0), (255, 0, 0)]
-                color = colors[min(i-1, len(colors)-1)]
-                explosion.fill(color)
-                self.explosion_sprites.append(explosion)
+        # Load explosion sprites from the explosion directory (1.png to 9.png)
+        self.explosion_sprites = [shared_surface(('explosion', i), lambda: self.load_explosion(i)) for i in range(1, 10)]
         
         # Set initial sprite
         self.current_sprite = 'cloudformation'
-        self.image = self.sprites[self.current_sprite].copy()
+        self.image = self.sprites[self.current_sprite]
+        
+        # Pre-rendered alpha ramp for the fade-in (shared between games)
+        self.fade_frames = [shared_surface(('boss_fade', step), lambda: self.build_fade_frame(step))
+                            for step in range(BOSS_FADE_STEPS)]
         
         self.rect = self.image.get_rect()
         self.rect.x = x
@@ -644,6 +684,53 @@ class CloudFormationBoss(pygame.sprite.Sprite):
         self.explosion_frame = 0
         self.explosion_timer = 0
         self.explosion_positions = []  # Store multiple explosion positions and timers
+        self.spawn_y = None  # Y position locked once the battle starts
+    
+    def load_sprite(self, sprite_key, sprite_filename):
+        try:
+            return assets.load_image(f"assets/images/enemies/boss/{sprite_filename}", BOSS_SIZE)
+        except:
+            # Fallback sprites
+            fallback = pygame.Surface(BOSS_SIZE)
+            fallback.fill((100, 100, 100))  # Gray cloud
+            
+            try:
+                font = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 12)
+            except:
+                font = pygame.font.SysFont(None, 16)
+            
+            # Different text for different abilities
+            if 'laser' in sprite_key:
+                text = font.render("CF-L", False, RED)
+            elif 'ec2' in sprite_key:
+                text = font.render("CF-E", False, BLUE)
+            elif 'dynamodb' in sprite_key:
+                text = font.render("CF-D", False, PURPLE)
+            elif 'lambda' in sprite_key:
+                text = font.render("CF-λ", False, YELLOW)
+            else:
+                text = font.render("CF", False, WHITE)
+            
+            text_rect = text.get_rect(center=(BOSS_SIZE[0]//2, BOSS_SIZE[1]//2))
+            fallback.blit(text, text_rect)
+            return fallback
+    
+    def build_fade_frame(self, step):
+        """Base sprite at the alpha of one step of the fade-in ramp"""
+        frame = self.sprites['cloudformation'].copy()
+        frame.set_alpha(int(255 * step / BOSS_FADE_STEPS))
+        return frame
+    
+    def load_explosion(self, i):
+        try:
+            return assets.load_image(f"assets/images/explosion/{i}.png", BOSS_SIZE)
+        except:
+            # Fallback explosion frame
+            explosion = pygame.Surface(BOSS_SIZE)
+            colors = [(255, 255, 0), (255, 200, 0), (255, 100, 0), (255, 50, 0), (255, 0, 0)]
+            color = colors[min(i-1, len(colors)-1)]
+            explosion.fill(color)
+            return explosion
         
     def update(self):
         # Handle fade in effect
@@ -651,16 +738,15 @@ class CloudFormationBoss(pygame.sprite.Sprite):
             self.fade_timer += 1
             self.alpha = min(255, (self.fade_timer / BOSS_FADE_IN_DURATION) * 255)
             
-            # Apply alpha to current sprite
-            temp_image = self.sprites[self.current_sprite].copy()
-            temp_image.set_alpha(int(self.alpha))
-            self.image = temp_image
+            # Show the pre-rendered ramp frame for the current alpha
+            step = min(BOSS_FADE_STEPS - 1, int(self.alpha * BOSS_FADE_STEPS / 255))
+            self.image = self.fade_frames[step]
             
             if self.fade_timer >= BOSS_FADE_IN_DURATION:
                 self.fading_in = False
                 self.intro_complete = True
                 self.alpha = 255
-                self.image = self.sprites[self.current_sprite].copy()
+                self.image = self.sprites[self.current_sprite]
             return None  # Don't do any other updates during fade-in
         
         # Handle explosion sequence
@@ -700,12 +786,6 @@ class CloudFormationBoss(pygame.sprite.Sprite):
         if not self.intro_complete:
             return None  # Don't move or use abilities until intro is done
         
-        # Protect boss direction from external interference
-        if hasattr(self, 'direction'):
-            # If something set the generic 'direction' attribute, ignore it
-            # Boss uses boss_direction exclusively
-            pass
-        
         # Handle ability sprite display (after ability execution)
         if self.ability_active:
             self.ability_timer_active += 1
@@ -713,7 +793,7 @@ class CloudFormationBoss(pygame.sprite.Sprite):
                 self.ability_active = False
                 self.ability_timer_active = 0
                 self.current_sprite = 'cloudformation'
-                self.image = self.sprites[self.current_sprite].copy()
+                self.image = self.sprites[self.current_sprite]
         
         # Handle laser ability duration (3 seconds)
         if self.laser_active:
@@ -722,8 +802,8 @@ class CloudFormationBoss(pygame.sprite.Sprite):
                 self.laser_active = False
                 self.laser_timer = 0
                 self.current_sprite = 'cloudformation'
-                self.image = self.sprites[self.current_sprite].copy()
-                print("Boss laser ability ended")
+                self.image = self.sprites[self.current_sprite]
+                log.debug("Boss laser ability ended")
         
         # Move horizontally very slowly (HORIZONTAL ONLY - NO VERTICAL MOVEMENT)
         # Apply movement (only affects X coordinate, Y stays constant)
@@ -731,18 +811,12 @@ class CloudFormationBoss(pygame.sprite.Sprite):
         self.rect.x += movement
         
         # ABSOLUTE Y POSITION LOCK - prevent any vertical drift
-        if not hasattr(self, 'spawn_y'):
+        if self.spawn_y is None:
             self.spawn_y = 100  # Store original spawn Y position
         self.rect.y = self.spawn_y  # Force Y position to stay at spawn height
         
-        # Debug: Print movement info occasionally
-        if hasattr(self, 'debug_counter'):
-            self.debug_counter += 1
-        else:
-            self.debug_counter = 0
-            
-        if self.debug_counter % 120 == 0:  # Every 2 seconds
-            print(f"Boss moving: speed={self.speed_x}, direction={self.boss_direction}, position=({self.rect.x}, {self.rect.y})")
+        # Debug: Log movement info occasionally (rate limited to once every 2 seconds)
+        log.debug("Boss moving", interval=2.0, speed=self.speed_x, direction=self.boss_direction, position=self.rect.topleft)
         
         # Check screen edges and reverse direction (stay at same Y position)
         # Use more generous margins and ensure proper boundary detection
@@ -750,12 +824,12 @@ class CloudFormationBoss(pygame.sprite.Sprite):
             if self.rect.right >= SCREEN_WIDTH - 5:  # 5 pixel margin from right edge
                 self.boss_direction = -1  # Change to move left
                 self.rect.right = SCREEN_WIDTH - 5  # Keep within bounds
-                print(f"Boss hit right edge, reversing to left. Position: {self.rect.x}, Direction: {self.boss_direction}")
+                log.debug("Boss hit edge, reversing", interval=1.0, edge="right", x=self.rect.x, direction=self.boss_direction)
         else:  # Moving left (boss_direction == -1)
             if self.rect.left <= 5:  # 5 pixel margin from left edge
                 self.boss_direction = 1   # Change to move right
                 self.rect.left = 5  # Keep within bounds
-                print(f"Boss hit left edge, reversing to right. Position: {self.rect.x}, Direction: {self.boss_direction}")
+                log.debug("Boss hit edge, reversing", interval=1.0, edge="left", x=self.rect.x, direction=self.boss_direction)
         
         # Boss abilities (only after intro is complete and not during laser)
         if not self.ability_active and not self.ability_warning and not self.laser_active:
@@ -777,8 +851,8 @@ class CloudFormationBoss(pygame.sprite.Sprite):
                 elif self.next_ability == 'spawn_lambda':
                     self.current_sprite = 'cloudformation_lambda_spawn'
                 
-                self.image = self.sprites[self.current_sprite].copy()
-                print(f"Boss warning: {self.next_ability} ability in 1 second!")
+                self.image = self.sprites[self.current_sprite]
+                log.debug("Boss ability warning", ability=self.next_ability)
                 self.ability_timer = 0
         
         # Handle ability warning phase
@@ -795,9 +869,9 @@ class CloudFormationBoss(pygame.sprite.Sprite):
                 if ability == 'laser':
                     self.laser_active = True
                     self.laser_timer = 0
-                    print("Boss executing laser ability (3 seconds)")
+                    log.debug("Boss executing laser ability", duration_frames=BOSS_LASER_DURATION)
                 else:
-                    print(f"Boss executing ability: {ability}")
+                    log.debug("Boss executing ability", ability=ability)
                 
                 return ability
         
@@ -816,7 +890,7 @@ class CloudFormationBoss(pygame.sprite.Sprite):
         
         # Change sprite to show ability
         self.current_sprite = sprite_name
-        self.image = self.sprites[sprite_name].copy()
+        self.image = self.sprites[sprite_name]
         self.ability_active = True
         self.ability_timer_active = 0
         
@@ -882,8 +956,9 @@ class CloudFormationBoss(pygame.sprite.Sprite):
         # Lambda enemies use group movement, so they'll move together horizontally
         return lambda_enemy
     
-    def draw_explosions(self, screen):
-        """Draw all explosion effects around the boss"""
+    def explosion_blits(self):
+        """Return (image, rect) pairs for all explosion effects around the boss"""
+        blits = []
         if self.exploding:
             for explosion in self.explosion_positions:
                 # Calculate current frame for this explosion
@@ -895,7 +970,8 @@ class CloudFormationBoss(pygame.sprite.Sprite):
                     explosion_rect = explosion_sprite.get_rect()
                     explosion_rect.centerx = explosion['x']
                     explosion_rect.centery = explosion['y']
-                    screen.blit(explosion_sprite, explosion_rect)
+                    blits.append((explosion_sprite, explosion_rect))
+        return blits
     
     def start_explosion(self):
         """Start the boss explosion sequence"""
@@ -909,8 +985,12 @@ class CloudFormationBoss(pygame.sprite.Sprite):
         self.health -= 1
         return self.health <= 0  # Return True if boss is destroyed
 
-class LambdaEnemy(pygame.sprite.Sprite):
+class LambdaEnemy(Entity):
     """Lambda enemy that shoots charged laser beams"""
+    kind = 'lambda'  # EntityRegistry list
+    __slots__ = ('original_image', 'powered_image', 'max_health', 'health', 'boss_level_mode', 'speed_x',
+                 'shoot_timer', 'shoot_interval', 'shoot_chance', 'charging', 'charge_timer', 'charge_duration',
+                 'spawn_y')
     # Class variables for coordinated movement
     group_direction = 1  # Shared direction for all Lambda instances
     edge_hit = False     # Flag to coordinate direction changes
@@ -918,33 +998,9 @@ class LambdaEnemy(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
         
-        # Load Lambda sprites
-        try:
-            self.original_image = pygame.image.load("assets/images/enemies/lambda.png")
-            self.original_image = pygame.transform.scale(self.original_image, ENEMY_SPRITE_SIZE)
-            self.powered_image = pygame.image.load("assets/images/enemies/lambda_powered.png")
-            self.powered_image = pygame.transform.scale(self.powered_image, ENEMY_SPRITE_SIZE)
-            self.image = self.original_image.copy()
-        except:
-            # Fallback Lambda enemy
-            self.original_image = pygame.Surface(ENEMY_SPRITE_SIZE)
-            self.original_image.fill(ORANGE)
-            
-            # Add Lambda symbol (λ)
-            try:
-                font = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 16)
-            except:
-                font = pygame.font.SysFont(None, 24)
-            text = font.render("λ", False, BLACK)
-            text_rect = text.get_rect(center=(ENEMY_SPRITE_SIZE[0]//2, ENEMY_SPRITE_SIZE[1]//2))
-            self.original_image.blit(text, text_rect)
-            
-            # Powered version (brighter)
-            self.powered_image = pygame.Surface(ENEMY_SPRITE_SIZE)
-            self.powered_image.fill(YELLOW)
-            self.powered_image.blit(text, text_rect)
-            
-            self.image = self.original_image.copy()
+        # Load Lambda sprites (shared by every Lambda)
+        self.original_image, self.powered_image = shared_surface('lambda', LambdaEnemy.load_images)
+        self.image = self.original_image
         
         self.rect = self.image.get_rect()
         self.rect.x = x
@@ -952,6 +1008,7 @@ class LambdaEnemy(pygame.sprite.Sprite):
         self.max_health = 3  # Lambda takes 3 hits to destroy
         self.health = self.max_health
         self.boss_level_mode = False  # Flag for boss level behavior
+        self.spawn_y = None  # Y position locked on the first boss level move
         
         # Movement pattern (horizontal only)
         self.speed_x = LEVEL_CONFIGS[3]['enemy_speed']  # Horizontal speed
@@ -964,7 +1021,33 @@ class LambdaEnemy(pygame.sprite.Sprite):
         # Charging mechanics
         self.charging = False
         self.charge_timer = 0
-        self.charge_duration = 78  # 1.3 seconds charge time (78 frames at 60fps)
+        self.charge_duration = 39  # 0.65 seconds charge time (39 ticks at 60Hz)
+    
+    @staticmethod
+    def load_images():
+        """Return the (original, powered) Lambda sprites"""
+        try:
+            original_image = assets.load_image("assets/images/enemies/lambda.png", ENEMY_SPRITE_SIZE)
+            powered_image = assets.load_image("assets/images/enemies/lambda_powered.png", ENEMY_SPRITE_SIZE)
+        except:
+            # Fallback Lambda enemy
+            original_image = pygame.Surface(ENEMY_SPRITE_SIZE)
+            original_image.fill(ORANGE)
+            
+            # Add Lambda symbol (λ)
+            try:
+                font = pygame.font.Font('assets/fonts/PressStart2P-Regular.ttf', 16)
+            except:
+                font = pygame.font.SysFont(None, 24)
+            text = font.render("λ", False, BLACK)
+            text_rect = text.get_rect(center=(ENEMY_SPRITE_SIZE[0]//2, ENEMY_SPRITE_SIZE[1]//2))
+            original_image.blit(text, text_rect)
+            
+            # Powered version (brighter)
+            powered_image = pygame.Surface(ENEMY_SPRITE_SIZE)
+            powered_image.fill(YELLOW)
+            powered_image.blit(text, text_rect)
+        return original_image, powered_image
     
     def set_boss_level_mode(self, boss_mode=True):
         """Set whether this enemy should use boss level movement (horizontal only)"""
@@ -978,7 +1061,7 @@ class LambdaEnemy(pygame.sprite.Sprite):
         # Movement behavior depends on boss level mode
         if self.boss_level_mode:
             # BOSS LEVEL: Lock Y position for horizontal-only movement
-            if not hasattr(self, 'spawn_y'):
+            if self.spawn_y is None:
                 self.spawn_y = self.rect.y
             self.rect.y = self.spawn_y  # Force Y position to stay at spawn height
         # For normal levels, Lambda enemies don't move down individually
@@ -1002,7 +1085,7 @@ class LambdaEnemy(pygame.sprite.Sprite):
         # Handle charging and shooting
         if self.charging:
             # Use powered sprite when charging
-            self.image = self.powered_image.copy()
+            self.image = self.powered_image
             
             self.charge_timer += 1
             
@@ -1037,35 +1120,36 @@ class LambdaEnemy(pygame.sprite.Sprite):
         """Update sprite appearance based on health (similar to DynamoDB)"""
         if self.health <= 0:
             return
-            
-        # Start with original image
-        self.image = self.original_image.copy()
         
+        # Damage variants are built once per health value and shared by all Lambdas
+        self.image = shared_surface(('lambda_damage', self.health, self.max_health), self.build_damage_image)
+    
+    def build_damage_image(self):
+        """Build the damage-tinted sprite for the current health"""
         # Calculate damage percentage
         damage_percent = 1.0 - (self.health / self.max_health)
         
-        if damage_percent > 0:
-            # Create damage overlay (gets redder as health decreases)
-            damage_overlay = pygame.Surface(ENEMY_SPRITE_SIZE)
-            
-            if damage_percent <= 0.2:  # 80-100% health - slight yellow tint
-                damage_overlay.fill((255, 255, 0))
-                alpha = int(30 * (damage_percent / 0.2))
-            elif damage_percent <= 0.4:  # 60-80% health - orange tint
-                damage_overlay.fill((255, 165, 0))
-                alpha = int(50 * ((damage_percent - 0.2) / 0.2))
-            elif damage_percent <= 0.6:  # 40-60% health - light red
-                damage_overlay.fill((255, 100, 100))
-                alpha = int(70 * ((damage_percent - 0.4) / 0.2))
-            elif damage_percent <= 0.8:  # 20-40% health - red
-                damage_overlay.fill((255, 50, 50))
-                alpha = int(90 * ((damage_percent - 0.6) / 0.2))
-            else:  # 0-20% health - dark red
-                damage_overlay.fill((200, 0, 0))
-                alpha = int(110 * ((damage_percent - 0.8) / 0.2))
-            
-            damage_overlay.set_alpha(alpha)
-            self.image.blit(damage_overlay, (0, 0))
+        if damage_percent <= 0:
+            return self.original_image
+        
+        # Damage overlay (gets redder as health decreases)
+        if damage_percent <= 0.2:  # 80-100% health - slight yellow tint
+            color = (255, 255, 0)
+            alpha = int(30 * (damage_percent / 0.2))
+        elif damage_percent <= 0.4:  # 60-80% health - orange tint
+            color = (255, 165, 0)
+            alpha = int(50 * ((damage_percent - 0.2) / 0.2))
+        elif damage_percent <= 0.6:  # 40-60% health - light red
+            color = (255, 100, 100)
+            alpha = int(70 * ((damage_percent - 0.4) / 0.2))
+        elif damage_percent <= 0.8:  # 20-40% health - red
+            color = (255, 50, 50)
+            alpha = int(90 * ((damage_percent - 0.6) / 0.2))
+        else:  # 0-20% health - dark red
+            color = (200, 0, 0)
+            alpha = int(110 * ((damage_percent - 0.8) / 0.2))
+        
+        return tinted_surface(self.original_image, color, alpha)
     
     def shoot_laser_beam(self):
         """Create a charged laser beam that follows this Lambda"""
@@ -0,0 +1,57 @@
+import time
+from contextlib import contextmanager
+from src.constants import *
+from src.log import log
+
+class StartupTrace:
+    """Records how long each startup stage takes until the first menu frame is shown"""
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.stages = []  # (name, depth, start offset, duration) in seconds
+        self.depth = 0
+        self.first_menu_frame_time = None
+        self.reported = False
+        
+    @contextmanager
+    def stage(self, name):
+        """Time a named startup stage (stages can be nested)"""
+        entry = [name, self.depth, time.perf_counter() - self.start_time, 0.0]
+        self.stages.append(entry)
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            entry[3] = time.perf_counter() - self.start_time - entry[2]
+            
+    def mark_first_menu_frame(self):
+        """Record the moment the first menu frame has been flipped to the screen"""
+        if self.first_menu_frame_time is None:
+            self.first_menu_frame_time = time.perf_counter() - self.start_time
+            
+    def time_to_menu_ms(self):
+        if self.first_menu_frame_time is None:
+            return None
+        return self.first_menu_frame_time * 1000
+    
+    def report(self):
+        """Log the startup trace once (stage durations and time-to-menu vs. target)"""
+        if self.reported or not STARTUP_TRACE:
+            return
+        self.reported = True
+        
+        time_to_menu = self.time_to_menu_ms()
+        mode = "lazy" if LAZY_INIT else "eager"
+        if time_to_menu is not None:
+            status = "OK" if time_to_menu <= STARTUP_TARGET_MS else "OVER TARGET"
+            log.info("Startup trace", mode=mode, time_to_menu_ms=f"{time_to_menu:.1f}",
+                     target_ms=STARTUP_TARGET_MS, status=status)
+        else:
+            log.info("Startup trace", mode=mode, time_to_menu_ms="not shown yet")
+        
+        for name, depth, start, duration in self.stages:
+            log.info("Startup stage", stage="  " * depth + name,
+                     start_ms=f"{start * 1000:.1f}", duration_ms=f"{duration * 1000:.1f}")
+
+# Shared trace for the whole process (started when this module is first imported)
+startup_trace = StartupTrace()
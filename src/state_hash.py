@@ -0,0 +1,132 @@
+import zlib
+import random
+import pygame
+from src.constants import *
+from src.log import log
+from src.entities import Entity
+from src.sprites import LambdaEnemy
+
+PLAIN = {int, float, bool, str, type(None)}  # Hashed as they are
+
+def state_value(value):
+    """value reduced to plain data for hashing (surfaces become None)"""
+    if type(value) in PLAIN:
+        return value
+    if isinstance(value, pygame.Rect):
+        return (value.x, value.y, value.width, value.height)
+    if isinstance(value, Entity):
+        return (type(value).__name__, state_value(value.rect))  # Referenced entity: which one and where
+    if isinstance(value, (tuple, list)):
+        return tuple(state_value(item) for item in value)
+    if isinstance(value, dict):
+        return tuple((key, state_value(item)) for key, item in value.items())
+    return None
+
+def holds_surfaces(value):
+    if isinstance(value, pygame.Surface):
+        return True
+    if isinstance(value, (tuple, list)):
+        return bool(value) and holds_surfaces(value[0])
+    if isinstance(value, dict):
+        return bool(value) and holds_surfaces(next(iter(value.values())))
+    return False
+
+# Slots that are never simulation state: list bookkeeping, the current image and the level settings
+IGNORED_SLOTS = {'entity_list', 'entity_index', 'image', 'config'}
+
+state_slots = {}  # Entity class -> names of the slots that are hashed
+
+def slots_of(entity):
+    """Names of the entity's slots that hold simulation state, found from the first instance of its class.
+
+    Slots holding surfaces (sprite images and animation frames) are left out.
+    """
+    cls = type(entity)
+    names = state_slots.get(cls)
+    if names is None:
+        names = state_slots[cls] = [name for klass in reversed(cls.__mro__)
+                                    for name in getattr(klass, '__slots__', ())
+                                    if name not in IGNORED_SLOTS and not holds_surfaces(getattr(entity, name, None))]
+    return names
+
+def entity_state(entity):
+    """(class name, slot values...) as hashed, in the order of slots_of()"""
+    state = [type(entity).__name__]
+    for name in slots_of(entity):
+        value = getattr(entity, name, None)
+        state.append(value if type(value) in PLAIN else state_value(value))
+    return tuple(state)
+
+def named_state(entity):
+    """entity_state() as (name, value) pairs, for reports"""
+    return (type(entity).__name__,) + tuple(zip(slots_of(entity), entity_state(entity)[1:]))
+
+# Game attributes that are simulation state outside the entity lists
+GAME_STATE = ('current_level', 'level_ticks', 'credit_timer', 'game_over', 'win', 'level_complete',
+              'boss_intro_active', 'boss_intro_timer', 'boss_exploding', 'boss_explosion_timer', 'player_can_shoot')
+
+def game_state(game):
+    """('game', GAME_STATE values..., Lambda group direction and edge flag)"""
+    return (('game',) + tuple(getattr(game, name) for name in GAME_STATE)
+            + (LambdaEnemy.group_direction, LambdaEnemy.edge_hit))
+
+def named_game_state(game):
+    """game_state() as (name, value) pairs, for reports"""
+    names = GAME_STATE + ('LambdaEnemy.group_direction', 'LambdaEnemy.edge_hit')
+    return ('game',) + tuple(zip(names, game_state(game)[1:]))
+
+def random_state():
+    """Position of the random module's generator: its index and the first and last words of its state.
+
+    The words only change all at once, every 624 draws, so these three tell
+    apart generators seeded differently or that have drawn different numbers
+    of values, without hashing all 625.
+    """
+    version, words, gauss = random.getstate()
+    return (words[-1], words[0], words[-2], gauss)
+
+def digest(state):
+    """CRC-32 of plain data (the same on every machine and Python process)"""
+    return zlib.crc32(repr(state).encode())
+
+class StateHasher:
+    """Hash of the simulation state after every tick, to check that changes keep gameplay identical.
+
+    A tick's hash covers the game state (level, timers, flags), the position of
+    the random module's generator and every entity: each slot that holds plain
+    data (numbers, flags, rects, lists of them), so positions, health, timers,
+    credits and power-ups; list order included, since the update order depends
+    on it. Surfaces are left out. Hashes are CRC-32s of the data's repr,
+    so they match across processes and machines. Each tick's hash is also
+    chained into a running hash of the whole game, logged when a level ends.
+
+    The per-entity digests of the last tick are kept (tick_digests), so a checker
+    can tell which entity differed (python -m tools.determinism).
+    """
+    def __init__(self, enabled=STATE_HASH):
+        self.enabled = enabled
+        self.reset()
+
+    def reset(self):
+        self.ticks = 0
+        self.running = 0
+        self.last = 0
+        self.tick_digests = {}  # Kind ('game', 'random' or an entity kind) -> per-entity digests, last tick
+
+    def tick(self, game):
+        """Hash the state after a simulation tick; returns the tick's hash"""
+        digests = {'game': [digest(game_state(game))], 'random': [digest(random_state())]}
+        for kind, entities in game.entities.kinds.items():
+            digests[kind] = [digest(entity_state(entity)) for entity in entities.entities]
+        tick_hash = digest(tuple(digests.values()))
+        self.ticks += 1
+        self.last = tick_hash
+        self.running = zlib.crc32(tick_hash.to_bytes(4, 'little'), self.running)
+        self.tick_digests = digests
+        return tick_hash
+
+    def level_done(self, level):
+        log.info("State hash", level=level, ticks=self.ticks, hash=f"{self.running:08x}")
+
+# Shared state hasher for the whole game
+state_hasher = StateHasher()
@@ -0,0 +1,181 @@
+import re
+import random
+import socket
+import atexit
+import threading
+from src.constants import *
+from src.log import log
+
+def metric_name(text):
+    """Turn free text (e.g. a game over reason) into a statsd metric name segment"""
+    return re.sub(r'[^a-z0-9]+', '_', text.lower()).strip('_') or 'unknown'
+
+def parse_address(address):
+    """Split "udp://host:port" or "unix:///path" into (socket family, sendto address)"""
+    if address.startswith('unix://'):
+        return socket.AF_UNIX, address[len('unix://'):]
+    if address.startswith('udp://'):
+        address = address[len('udp://'):]
+    host, port = address.rsplit(':', 1)
+    return socket.AF_INET, (host, int(port))
+
+class Histogram:
+    """Samples of one metric in the current flush interval (reservoir sampled beyond capacity)"""
+    __slots__ = ('samples', 'count', 'total', 'maximum')
+
+    def __init__(self):
+        self.samples = []
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def add(self, value, capacity, rng):
+        self.count += 1
+        self.total += value
+        if value > self.maximum:
+            self.maximum = value
+        if len(self.samples) < capacity:
+            self.samples.append(value)
+        else:
+            index = rng.randrange(self.count)
+            if index < capacity:
+                self.samples[index] = value
+
+class Telemetry:
+    """Per-session metrics aggregated in memory and exported to a statsd-style sink.
+
+    incr/gauge/timing only update in-memory aggregates under a lock; the socket is
+    only touched by a background thread that flushes every flush_interval seconds.
+    Counters and gauges are sent as-is, histograms (timing) as percentile gauges
+    plus a count. Lines are packed into datagrams of at most TELEMETRY_MAX_PACKET
+    bytes and sent without blocking: when the sink is slow or missing, packets are
+    dropped and counted instead of backing up into the game.
+    """
+    def __init__(self, address=TELEMETRY_ADDRESS, prefix=TELEMETRY_PREFIX, flush_interval=TELEMETRY_FLUSH_INTERVAL,
+                 enabled=TELEMETRY):
+        self.address = address
+        self.prefix = prefix
+        self.flush_interval = flush_interval
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+        self.rng = random.Random()  # Own generator, so sampling never touches the game's random state
+
+        self.sock = None
+        self.sent_packets = 0
+        self.dropped_packets = 0
+        self.wakeup = threading.Event()
+        self.thread = None
+        atexit.register(self.close)
+
+    def incr(self, name, value=1):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+        self.start()
+
+    def gauge(self, name, value):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.gauges[name] = value
+        self.start()
+
+    def timing(self, name, milliseconds):
+        """Add a sample to a histogram (frame times, level times, ...)"""
+        if not self.enabled:
+            return
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.add(milliseconds, TELEMETRY_HISTOGRAM_SIZE, self.rng)
+        self.start()
+
+    def start(self):
+        """Start the flush thread on first use"""
+        if self.thread is None:
+            self.wakeup.clear()
+            self.thread = threading.Thread(target=self.flush_loop, name="telemetry", daemon=True)
+            self.thread.start()
+
+    def take(self):
+        """Swap out the aggregates of the current interval (gauges keep their last value)"""
+        with self.lock:
+            counters, self.counters = self.counters, {}
+            histograms, self.histograms = self.histograms, {}
+            gauges = dict(self.gauges)
+        return counters, gauges, histograms
+
+    def format_lines(self, counters, gauges, histograms):
+        prefix = self.prefix + '.' if self.prefix else ''
+        lines = [f"{prefix}{name}:{value}|c" for name, value in counters.items()]
+        lines.extend(f"{prefix}{name}:{value}|g" for name, value in gauges.items())
+        for name, histogram in histograms.items():
+            samples = sorted(histogram.samples)
+            for percentile in TELEMETRY_PERCENTILES:
+                value = samples[min(len(samples) - 1, int(len(samples) * percentile / 100))]
+                lines.append(f"{prefix}{name}.p{percentile}:{value:.3f}|g")
+            lines.append(f"{prefix}{name}.max:{histogram.maximum:.3f}|g")
+            lines.append(f"{prefix}{name}.mean:{histogram.total / histogram.count:.3f}|g")
+            lines.append(f"{prefix}{name}.count:{histogram.count}|c")
+        return lines
+
+    def packets(self, lines):
+        """Pack newline-separated lines into datagrams of at most TELEMETRY_MAX_PACKET bytes"""
+        packet = b''
+        for line in lines:
+            data = line.encode()
+            if packet and len(packet) + 1 + len(data) > TELEMETRY_MAX_PACKET:
+                yield packet
+                packet = b''
+            packet = packet + b'\n' + data if packet else data
+        if packet:
+            yield packet
+
+    def flush(self):
+        """Send everything aggregated since the last flush (called by the flush thread and at exit)"""
+        lines = self.format_lines(*self.take())
+        if not lines:
+            return
+        try:
+            if self.sock is None:
+                family, self.sendto_address = parse_address(self.address)
+                self.sock = socket.socket(family, socket.SOCK_DGRAM)
+                self.sock.setblocking(False)
+        except OSError as e:
+            self.dropped_packets += 1
+            log.warning("Telemetry sink unavailable", 60.0, address=self.address, error=repr(e))
+            return
+        for packet in self.packets(lines):
+            try:
+                self.sock.sendto(packet, self.sendto_address)
+                self.sent_packets += 1
+            except OSError as e:
+                # Full socket buffer (slow sink), no listener, ...: drop, never wait
+                self.dropped_packets += 1
+                log.warning("Telemetry packets dropped", 60.0, address=self.address, error=repr(e),
+                            dropped=self.dropped_packets)
+
+    def flush_loop(self):
+        while not self.wakeup.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        """Final flush; stops the flush thread"""
+        if self.thread is None:
+            return
+        self.wakeup.set()
+        self.thread.join()
+        self.thread = None
+        self.flush()
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+        log.info("Telemetry", sent_packets=self.sent_packets, dropped_packets=self.dropped_packets)
+
+# Shared exporter for the whole game
+telemetry = Telemetry()
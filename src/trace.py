@@ -0,0 +1,136 @@
+import os
+import json
+import time
+import threading
+from collections import deque
+from src.constants import *
+from src.log import log
+
+class Span:
+    """Context manager recording one complete ("X") event"""
+    __slots__ = ('tracer', 'name', 'category', 'args', 'start')
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.tracer.complete(self.name, self.category, self.start, self.args)
+        return False
+
+class NullSpan:
+    """Span used while recording is off"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+NULL_SPAN = NullSpan()
+
+class Tracer:
+    """Records frame phases as Chrome trace events (chrome://tracing, Perfetto, speedscope).
+
+    Spans are kept in a ring buffer of TRACE_BUFFER_SIZE events, so a long
+    recording keeps only its most recent part. Recording can be switched on and
+    off at any time (F10 in game); switching it off writes the buffer to
+    TRACE_DIR. While off, span() returns a shared no-op context manager and
+    now()/complete() return immediately.
+
+    Two ways to record a span:
+        with tracer.span('handle_events', 'frame'): ...
+        phase = tracer.now(); ...; phase = tracer.complete('update.move', 'update', phase)
+    The second needs no extra indentation, chains phases one after another and
+    simply records nothing when the code in between returns early.
+    """
+    def __init__(self, buffer_size=TRACE_BUFFER_SIZE):
+        self.enabled = False
+        self.events = deque(maxlen=buffer_size)  # (phase, name, category, ts_ns, duration_ns, thread id, args)
+        self.thread_names = {}
+        self.origin = time.perf_counter_ns()
+
+    def start(self):
+        if self.enabled:
+            return
+        self.events.clear()
+        self.enabled = True
+        log.info("Trace recording started")
+
+    def stop(self):
+        """Stop recording and write the trace; returns its path"""
+        if not self.enabled:
+            return None
+        self.enabled = False
+        return self.write()
+
+    def toggle(self):
+        if self.enabled:
+            self.stop()
+        else:
+            self.start()
+
+    def span(self, name, category='game', args=None):
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, category, args)
+
+    def now(self):
+        """Start time for complete() (0 while recording is off)"""
+        return time.perf_counter_ns() if self.enabled else 0
+
+    def complete(self, name, category, start, args=None):
+        """Record a span from start (tracer.now()) until now; returns now, the start of the next phase"""
+        if not self.enabled or not start:
+            return self.now()
+        end = time.perf_counter_ns()
+        self.events.append(('X', name, category, start, end - start, self.thread_id(), args))
+        return end
+
+    def instant(self, name, category='game', args=None):
+        """Record a point in time (level transitions, boss abilities)"""
+        if not self.enabled:
+            return
+        self.events.append(('i', name, category, time.perf_counter_ns(), 0, self.thread_id(), args))
+
+    def thread_id(self):
+        thread_id = threading.get_native_id()
+        if thread_id not in self.thread_names:
+            self.thread_names[thread_id] = threading.current_thread().name
+        return thread_id
+
+    def trace_events(self):
+        """The buffered events in Chrome trace-event format (timestamps in microseconds)"""
+        pid = os.getpid()
+        events = [{'ph': 'M', 'name': 'thread_name', 'pid': pid, 'tid': thread_id, 'args': {'name': name}}
+                  for thread_id, name in self.thread_names.items()]
+        for phase, name, category, start, duration, thread_id, args in list(self.events):
+            event = {'ph': phase, 'name': name, 'cat': category, 'pid': pid, 'tid': thread_id,
+                     'ts': (start - self.origin) / 1000}
+            if phase == 'X':
+                event['dur'] = duration / 1000
+            else:
+                event['s'] = 'g'  # Instant events span all threads
+            if args:
+                event['args'] = args
+            events.append(event)
+        return events
+
+    def write(self):
+        os.makedirs(TRACE_DIR, exist_ok=True)
+        path = os.path.join(TRACE_DIR, time.strftime("trace_%Y%m%d_%H%M%S.json"))
+        events = self.trace_events()
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        log.info("Trace written", path=path, events=len(events))
+        return path
+
+# Shared tracer for the whole game
+tracer = Tracer()
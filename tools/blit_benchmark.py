@@ -0,0 +1,82 @@
+"""Blit throughput per game image, before and after the display-format pipeline.
+
+"Before" is what the game used to blit (pygame.image.load + transform.scale),
+"after" is src.assets.load_image. Run from the repository root:
+
+    python -m tools.blit_benchmark [--blits 2000]
+"""
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from src.constants import *
+from src import assets
+
+def load_game_images():
+    """Construct every sprite type and screen so each game image goes through assets.load_image"""
+    from src.sprites import Player, Enemy, DynamoDBEnemy, LambdaEnemy, Asteroid, PowerUp, SideShip, CloudFormationBoss
+    from src.screens import ScreenCompositor
+    from src.menu import Menu
+    
+    Player()
+    SideShip(0, 0)
+    Enemy(0, 0, level=1)
+    DynamoDBEnemy(0, 0)
+    LambdaEnemy(0, 0)
+    CloudFormationBoss(0, 0)
+    for sprite_path in ASTEROID_SPRITES:
+        Asteroid(0, 0).load_image(sprite_path)
+    for power_type in ('s3', 'load_balancer', 'auto_scaling'):
+        PowerUp(0, 0, power_type)
+    
+    compositor = ScreenCompositor()
+    for level in LEVEL_CONFIGS:
+        compositor.level_background(level)
+    for name in SCREEN_BACKGROUNDS:
+        compositor.screen(name)
+    Menu(pygame.display.get_surface())
+
+def blits_per_second(screen, surface, count):
+    width, height = surface.get_size()
+    max_x = max(1, SCREEN_WIDTH - width)
+    max_y = max(1, SCREEN_HEIGHT - height)
+    blit = screen.blit
+    start = time.perf_counter()
+    for i in range(count):
+        blit(surface, ((i * 37) % max_x, (i * 53) % max_y))
+    return count / (time.perf_counter() - start)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--blits', type=int, default=2000, help="blits per image and variant")
+    args = parser.parse_args(argv)
+    
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    load_game_images()
+    
+    print(f"{'image':<58} {'size':>9} {'path':>9} {'before/s':>10} {'after/s':>10} {'speedup':>8}")
+    for (path, size), kind in sorted(assets.loaded_images.items()):
+        raw = pygame.image.load(path)
+        if size is not None:
+            raw = pygame.transform.scale(raw, size)
+        optimized = assets.load_image(path, size)
+        
+        # Fewer blits for full-screen images so every row takes a similar time
+        count = max(50, args.blits * 4096 // (raw.get_width() * raw.get_height()) if raw.get_width() * raw.get_height() > 4096 * 4 else args.blits)
+        before = blits_per_second(screen, raw, count)
+        after = blits_per_second(screen, optimized, count)
+        size_text = f"{raw.get_width()}x{raw.get_height()}"
+        print(f"{path:<58} {size_text:>9} {kind:>9} {before:>10.0f} {after:>10.0f} {after / before:>7.2f}x")
+    
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""Collision check: collide_shots against pygame.sprite.groupcollide on random layouts.
+
+src.entities.collide_shots stands in for pygame.sprite.groupcollide(targets,
+shots, kill_targets, True) in the game's collision checks. This builds --layouts
+random layouts of targets and shots (overlapping, touching and apart, from
+--seed), resolves each with both, with kill_targets off and on, and compares the
+hits, which entities were killed and the order the lists are left in. Exits with
+status 1 at the first layout where they differ. Run from the repository root:
+
+    python -m tools.collide_check [--layouts 3000] [--seed 1]
+"""
+import sys
+import random
+import argparse
+
+import pygame
+from src.entities import Entity, EntityList, collide_shots
+
+class Box(Entity):
+    """A target or shot, numbered in the order it was added"""
+    __slots__ = ('number',)
+
+    def __init__(self, number, rect):
+        super().__init__()
+        self.number = number
+        self.rect = rect.copy()
+
+def layout(rng):
+    """Rects of some targets and shots in a small area, so that many overlap"""
+    def rect():
+        return pygame.Rect(rng.randint(0, 60), rng.randint(0, 60), rng.randint(1, 20), rng.randint(1, 20))
+    return ([rect() for i in range(rng.randint(0, 12))], [rect() for i in range(rng.randint(0, 8))])
+
+def resolve(collide, target_rects, shot_rects, kill_targets):
+    """Collide fresh lists built from the rects; returns (hits by number, targets left, shots left)"""
+    targets, shots = EntityList('targets'), EntityList('shots')
+    for number, rect in enumerate(target_rects):
+        targets.add(Box(number, rect))
+    for number, rect in enumerate(shot_rects):
+        shots.add(Box(number, rect))
+    hits = collide(targets, shots, kill_targets)
+    return ([(target.number, [shot.number for shot in hit]) for target, hit in hits.items()],
+            [target.number for target in targets.entities], [shot.number for shot in shots.entities])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--layouts', type=int, default=3000, help="random layouts to check")
+    parser.add_argument('--seed', type=int, default=1, help="seed of the layouts")
+    args = parser.parse_args(argv)
+
+    def groupcollide(targets, shots, kill_targets):
+        return pygame.sprite.groupcollide(targets, shots, kill_targets, True)
+
+    rng = random.Random(args.seed)
+    for index in range(args.layouts):
+        target_rects, shot_rects = layout(rng)
+        for kill_targets in (False, True):
+            expected = resolve(groupcollide, target_rects, shot_rects, kill_targets)
+            actual = resolve(collide_shots, target_rects, shot_rects, kill_targets)
+            if actual != expected:
+                print(f"Layout {index} differs (kill_targets={kill_targets})")
+                print(f"  targets: {target_rects}")
+                print(f"  shots:   {shot_rects}")
+                for name, want, got in zip(("hits", "targets left", "shots left"), expected, actual):
+                    print(f"  {name}: groupcollide {want}, collide_shots {got}")
+                return 1
+    print(f"{args.layouts} layouts: collide_shots matches groupcollide with kill_targets off and on")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
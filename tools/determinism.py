@@ -0,0 +1,161 @@
+"""Determinism checker: plays the same seeded game twice and reports the first tick where the state differs.
+
+The game is played by the soak-test autopilot (src/autopilot.py) from --level
+(0 for endless mode) for --ticks simulation ticks (or until the game ends),
+advancing through level completions, with the state hashed after every tick (src/state_hash.py). By
+default it is played twice in this process and the two runs are compared. To
+compare two machines or two versions of the code, --record the hashes on one
+and --compare against that file on the other (the file keeps the seed, level
+and tick count).
+
+At the first tick whose hash differs, the part of the state that differed is
+named: the game state, the random module's state, or an entity kind, its
+position in the kind's list and its class, with the slots that differ (or, when
+comparing against a file, the slots of the local entity). Exits with status 1
+when the runs differ. Run from the repository root:
+
+    python -m tools.determinism [--seed 1] [--level 1] [--ticks 3600]
+    python -m tools.determinism --record hashes.json [--seed 1] [--level 1] [--ticks 3600]
+    python -m tools.determinism --compare hashes.json
+"""
+import os
+import sys
+import json
+import random
+import argparse
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from src.constants import *
+
+def played_ticks(game, seed, level, ticks):
+    """Play a seeded game; yields (tick, tick hash, per-kind digests) after every tick"""
+    from src.autopilot import Autopilot
+    from src.endless import EndlessMode
+    from src.state_hash import state_hasher
+
+    state_hasher.enabled = True
+    random.seed(seed)
+    game.game_over = False
+    game.win = False
+    game.current_level = level
+    game.endless = EndlessMode() if level == ENDLESS_LEVEL else None
+    game.initialize_game()
+    pilot = Autopilot()
+    for tick in range(ticks):
+        game.input_keys = pilot.keys(game)
+        game.simulation_tick()
+        yield tick, state_hasher.last, state_hasher.tick_digests
+        if game.game_over or (game.level_complete and not game.next_level()):
+            return
+
+def part_state(game, kind, index):
+    """(name, value) pairs of one part of the game as hashed, or None for the random module"""
+    from src.state_hash import named_state, named_game_state
+    if kind == 'game':
+        return named_game_state(game)
+    if kind == 'random':
+        return None
+    return named_state(game.entities[kind].entities[index])
+
+def first_difference(reference, digests):
+    """(kind, index, description) of the first part whose digest differs"""
+    for kind, values in digests.items():
+        expected = reference.get(kind, [])
+        if values == expected:
+            continue
+        if len(values) != len(expected):
+            return kind, None, f"{kind}: {len(expected)} entities in the reference, {len(values)} here"
+        index = next(i for i, (a, b) in enumerate(zip(expected, values)) if a != b)
+        return kind, index, f"{kind}[{index}] differs"
+    return None, None, "the kinds hashed differ"
+
+def slot_lines(state):
+    return [f"    {name} = {value!r}" for name, value in state[1:]]
+
+def diff_lines(expected, actual):
+    """Slots of two entity states that differ"""
+    if expected[0] != actual[0]:
+        return [f"    class {expected[0]} in the reference, {actual[0]} here"]
+    expected_slots = dict(expected[1:])
+    return [f"    {name}: {expected_slots.get(name)!r} -> {value!r}"
+            for name, value in actual[1:] if expected_slots.get(name) != value]
+
+def compare(game, settings, reference, replay_reference):
+    """Play settings and compare each tick with reference [(hash, digests)]; returns True when they match.
+
+    When replay_reference is set, the reference is played again up to the
+    differing tick to show its slots next to the local ones.
+    """
+    seed, level, ticks = settings['seed'], settings['level'], settings['ticks']
+    played = 0
+    for tick, tick_hash, digests in played_ticks(game, seed, level, ticks):
+        played = tick + 1
+        if tick >= len(reference):
+            print(f"Tick {tick}: the reference ended after {len(reference)} ticks, this run goes on")
+            return False
+        if tick_hash == reference[tick][0]:
+            continue
+
+        kind, index, description = first_difference(reference[tick][1], digests)
+        print(f"First difference at tick {tick} (level {game.current_level}): {description}")
+        state = None if index is None else part_state(game, kind, index)
+        if state is None:
+            return False
+        if replay_reference:
+            for replay_tick, replay_hash, replay_digests in played_ticks(game, seed, level, tick + 1):
+                pass
+            if replay_hash != reference[tick][0]:
+                print("    (the reference replayed differs from itself here too; showing this run's slots)")
+                print("\n".join(slot_lines(state)))
+            else:
+                print("\n".join(diff_lines(part_state(game, kind, index), state)) or "    (no slot differs; list order?)")
+        else:
+            print("\n".join(slot_lines(state)))
+        return False
+
+    if played < len(reference):
+        print(f"This run ended after {played} ticks, the reference after {len(reference)}")
+        return False
+    return True
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seed', type=int, default=1, help="seed of the random module")
+    parser.add_argument('--level', type=int, default=1, help=f"level to start at ({ENDLESS_LEVEL} for endless mode)")
+    parser.add_argument('--ticks', type=int, default=3600, help="simulation ticks to play")
+    parser.add_argument('--record', help="write the hashes of one run to this file")
+    parser.add_argument('--compare', help="compare one run with hashes recorded by --record")
+    args = parser.parse_args(argv)
+
+    from src.game import Game
+    game = Game()
+    game.load_game_assets()
+    settings = {'seed': args.seed, 'level': args.level, 'ticks': args.ticks}
+
+    if args.compare:
+        with open(args.compare) as f:
+            recorded = json.load(f)
+        settings = {key: recorded[key] for key in settings}
+        reference = list(zip(recorded['hashes'], recorded['digests']))
+        same = compare(game, settings, reference, replay_reference=False)
+    else:
+        reference = [(tick_hash, digests) for tick, tick_hash, digests in played_ticks(game, **settings)]
+        if args.record:
+            with open(args.record, 'w') as f:
+                json.dump(dict(settings, hashes=[tick_hash for tick_hash, digests in reference],
+                               digests=[digests for tick_hash, digests in reference]), f)
+            print(f"{len(reference)} tick hashes written to {args.record}")
+            pygame.quit()
+            return 0
+        same = compare(game, settings, reference, replay_reference=True)
+
+    if same:
+        print(f"Identical: {len(reference)} ticks, seed {settings['seed']}, from level {settings['level']}")
+    pygame.quit()
+    return 0 if same else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
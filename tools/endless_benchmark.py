@@ -0,0 +1,98 @@
+"""Endless mode benchmark: update and draw times per wave as the waves grow.
+
+Plays endless mode headless from --wave for --ticks simulation ticks with the
+soak-test autopilot (src/autopilot.py) at the controls, or nobody with --idle so
+the waves pile up to ENDLESS_MAX_ENEMIES, and the credits topped up so the game
+never ends. Each tick is simulated and drawn once, and per wave it prints the
+most entities, enemies and projectiles alive at once and the update and draw
+time percentiles, counting the frames over the 60 FPS budget. --profile also prints the functions that took the
+most time. Run from the repository root:
+
+    python -m tools.endless_benchmark [--wave 20] [--ticks 7200] [--seed 1] [--idle] [--profile 25]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from src.constants import *
+
+FRAME_BUDGET_MS = 1000 / 60
+
+def play(first_wave, ticks, seed, idle):
+    """Play the waves; returns {wave: (peaks, sorted update ms, sorted draw ms, frames over budget)}"""
+    from src.game import Game
+    from src.endless import EndlessMode, PROJECTILE_KINDS
+    from src.autopilot import Autopilot, PilotKeys
+    from src.gc_policy import gc_policy
+
+    game = Game()
+    game.load_game_assets()
+    random.seed(seed)
+    game.endless = EndlessMode(first_wave)
+    game.initialize_game()
+    gc_policy.enter_gameplay()  # As the game loop does
+    pilot = None if idle else Autopilot()
+    nothing_pressed = PilotKeys(frozenset())
+    endless = game.endless
+    waves = {}  # Wave -> (peaks, update ms, draw ms)
+    for tick in range(ticks):
+        game.player.credits = 10 ** 9  # Keep the player alive however many enemies pile up
+        game.input_keys = pilot.keys(game) if pilot else nothing_pressed
+        start = time.perf_counter()
+        game.simulation_tick()
+        drawn = time.perf_counter()
+        game.draw()
+        end = time.perf_counter()
+
+        peaks, update_times, draw_times = waves.setdefault(endless.wave, (dict.fromkeys(endless.peaks, 0), [], []))
+        update_times.append((drawn - start) * 1000)
+        draw_times.append((end - drawn) * 1000)
+        counts = {'entities': sum(len(kind) for kind in game.entities.kinds.values()),
+                  'enemies': game.entities.enemy_count(),
+                  'projectiles': sum(len(game.entities[kind]) for kind in PROJECTILE_KINDS)}
+        for name, count in counts.items():
+            peaks[name] = max(peaks[name], count)
+    return {wave: (peaks, sorted(update_times), sorted(draw_times),
+                   sum(1 for u, d in zip(update_times, draw_times) if u + d > FRAME_BUDGET_MS))
+            for wave, (peaks, update_times, draw_times) in waves.items()}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--wave', type=int, default=20, help="wave to start at")
+    parser.add_argument('--ticks', type=int, default=7200, help="simulation ticks to play")
+    parser.add_argument('--seed', type=int, default=1, help="seed of the random module")
+    parser.add_argument('--idle', action='store_true', help="nobody at the controls: every wave piles up")
+    parser.add_argument('--profile', type=int, metavar='N', help="print the N functions with the most time")
+    args = parser.parse_args(argv)
+
+    from src.autopilot import percentile
+    if args.profile:
+        import cProfile
+        import pstats
+        profile = cProfile.Profile()
+        profile.enable()
+    results = play(args.wave, args.ticks, args.seed, args.idle)
+    if args.profile:
+        profile.disable()
+
+    print(f"{'wave':>4} {'ticks':>6} {'entities':>8} {'enemies':>7} {'shots':>6} "
+          f"{'upd p50':>7} {'upd p99':>7} {'draw p50':>8} {'draw p99':>8} {'over':>5}")
+    for wave, (peaks, update_times, draw_times, over_budget) in results.items():
+        print(f"{wave:>4} {len(update_times):>6} {peaks['entities']:>8} {peaks['enemies']:>7} {peaks['projectiles']:>6} "
+              f"{percentile(update_times, 50):>7.2f} {percentile(update_times, 99):>7.2f} "
+              f"{percentile(draw_times, 50):>8.2f} {percentile(draw_times, 99):>8.2f} {over_budget:>5}")
+    print(f"(milliseconds; over = frames above the {FRAME_BUDGET_MS:.1f} ms budget of 60 FPS)")
+
+    if args.profile:
+        pstats.Stats(profile).sort_stats('tottime').print_stats(args.profile)
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
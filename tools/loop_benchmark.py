@@ -0,0 +1,92 @@
+"""Frame times of the blocking game loop versus the asyncio loop (ASYNC_LOOP).
+
+Plays the same level headless with Game.game_loop() and with
+Game.game_loop_async(); the asyncio run also hosts a background task that does
+busy work in TASK_BUDGET_MS slices, as a streaming or autosave task would. Frame
+time is the time between display flips. Run from the repository root:
+
+    python -m tools.loop_benchmark [--level 1] [--seconds 5] [--no-task]
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from src.constants import *
+
+async def busy_task(budget, work_done):
+    """Background task that always has work: one small unit per checkpoint"""
+    while True:
+        sum(range(2000))
+        work_done[0] += 1
+        await budget.checkpoint()
+
+async def play_async(game, background_task, work_done):
+    from src.scheduler import FrameScheduler
+    game.scheduler = FrameScheduler()
+    if background_task:
+        game.scheduler.spawn(lambda budget: busy_task(budget, work_done), name="busy")
+    try:
+        await game.game_loop_async()
+    finally:
+        await game.scheduler.shutdown()
+
+def measure(use_async, level, seconds, background_task):
+    """Play level for seconds with one loop; return (frame times in seconds, background work units)"""
+    from src.game import Game
+
+    game = Game()
+    game.load_game_assets()
+    game.current_level = level
+    game.initialize_game()
+    game.player.credits = 10 ** 9  # Keep the player alive for the whole run
+    game.show_game_over_screen = lambda: None
+    game.wait_for_key = lambda keys: (yield from ())  # No key wait at the end
+
+    flip = pygame.display.flip
+    flips = []
+    deadline = time.perf_counter() + seconds
+
+    def timed_flip():
+        flip()
+        flips.append(time.perf_counter())
+        if flips[-1] >= deadline:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    work_done = [0]
+    pygame.display.flip = timed_flip
+    try:
+        if use_async:
+            asyncio.run(play_async(game, background_task, work_done))
+        else:
+            game.game_loop()
+    finally:
+        pygame.display.flip = flip
+    return [b - a for a, b in zip(flips, flips[1:])], work_done[0]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--level', type=int, default=1, help="level to play")
+    parser.add_argument('--seconds', type=float, default=5.0, help="play time per loop")
+    parser.add_argument('--no-task', action='store_true', help="run the asyncio loop without the background task")
+    args = parser.parse_args(argv)
+
+    print(f"{'loop':<10} {'frames':>7} {'median ms':>10} {'p95 ms':>7} {'max ms':>7} {'task units':>11}")
+    for use_async in (False, True):
+        frame_times, work_done = measure(use_async, args.level, args.seconds, not args.no_task)
+        frame_times.sort()
+        print(f"{'asyncio' if use_async else 'blocking':<10} {len(frame_times):>7} "
+              f"{statistics.median(frame_times) * 1000:>10.2f} {frame_times[int(len(frame_times) * 0.95)] * 1000:>7.2f} "
+              f"{frame_times[-1] * 1000:>7.2f} {work_done:>11}")
+
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""Bytes per entity for each sprite type and the menu stars, measured with tracemalloc.
+
+Counts everything an instance owns (the object, its rect, per-instance dicts and
+lists, its registry slot) but not the surfaces shared between instances. Run
+from the repository root:
+
+    python -m tools.memory_report [--count 10000]
+"""
+import os
+import sys
+import gc
+import argparse
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from src.constants import *
+
+def entity_factories():
+    """(name, factory, registry kind) for every entity type; kind None = not kept in the registry"""
+    from src.sprites import Player, Enemy, DynamoDBEnemy, LambdaEnemy, Asteroid, PowerUp, SideShip, Laser, LaserBeam, CloudFormationBoss
+    from src.menu import Star
+    lambda_enemy = LambdaEnemy(0, 0)
+    return [
+        ("Laser", lambda: Laser(100, 100, 5), 'enemy_laser'),
+        ("Asteroid", lambda: Asteroid(100, 100), 'asteroid'),
+        ("LaserBeam", lambda: LaserBeam(lambda_enemy), 'laser_beam'),
+        ("PowerUp", lambda: PowerUp(100, 100, 's3'), 'power_up'),
+        ("Enemy", lambda: Enemy(100, 100, level=1), 'ec2'),
+        ("DynamoDBEnemy", lambda: DynamoDBEnemy(100, 100), 'dynamodb'),
+        ("LambdaEnemy", lambda: LambdaEnemy(100, 100), 'lambda'),
+        ("SideShip", lambda: SideShip(100, 100), 'side_ship'),
+        ("CloudFormationBoss", lambda: CloudFormationBoss(100, 100), 'boss'),
+        ("Player", Player, 'player'),
+        ("Star", Star, None)
+    ]
+
+def measure(factory, kind, count):
+    """Return traced bytes per instance for count instances (kept in an EntityRegistry list if kind is set)"""
+    from src.entities import EntityRegistry
+    registry = EntityRegistry()
+    factory()  # Build the shared surfaces outside the measurement
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    if kind is None:
+        instances = [factory() for i in range(count)]
+    else:
+        entities = registry[kind]
+        for i in range(count):
+            entities.add(factory())
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=10000, help="instances created per type")
+    args = parser.parse_args(argv)
+
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    print(f"{'type':<20} {'bytes/entity':>12} {'total for ' + str(args.count):>16}")
+    for name, factory, kind in entity_factories():
+        per_entity = measure(factory, kind, args.count)
+        print(f"{name:<20} {per_entity:>12.0f} {per_entity * args.count / 1024:>13.0f} KiB")
+
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""Pack the game's sprites into sprite sheets with a JSON index.
+
+Every sprite image is packed at the size the game loads it at, so the runtime
+only cuts rectangles out of a sheet. Full-screen backgrounds stay separate files.
+The index records a CRC32 of each source file; the game decodes images whose
+file changed since packing from the file instead. Re-run after changing
+sprite art, from the repository root:
+
+    python -m tools.pack_atlas
+"""
+import os
+import sys
+import json
+import argparse
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from src.constants import *
+from src import assets
+from tools.blit_benchmark import load_game_images
+
+def sprite_images():
+    """(path, size) of every sprite the game loads, found by constructing each sprite type"""
+    assets.atlas_index = {}  # Load from the source files, not a previous atlas
+    load_game_images()
+    images = []
+    for path, size in assets.loaded_images:
+        if size is None or tuple(size) == (SCREEN_WIDTH, SCREEN_HEIGHT):
+            continue
+        images.append((path, size))
+    return images
+
+def pack_shelves(sizes, sheet_size, padding):
+    """Shelf-pack (width, height) boxes, tallest first; returns [(sheet, x, y)] in input order"""
+    order = sorted(range(len(sizes)), key=lambda i: (sizes[i][1], sizes[i][0]), reverse=True)
+    placements = [None] * len(sizes)
+    sheet = 0
+    x = y = shelf_height = 0
+    for i in order:
+        width, height = sizes[i]
+        if width > sheet_size or height > sheet_size:
+            raise ValueError(f"{width}x{height} image does not fit a {sheet_size}px sheet")
+        if x + width > sheet_size:  # Start a new shelf
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        if y + height > sheet_size:  # Start a new sheet
+            sheet += 1
+            x = y = shelf_height = 0
+        placements[i] = (sheet, x, y)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+    return placements
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sheet-size', type=int, default=ATLAS_SHEET_SIZE, help="maximum sheet width and height")
+    parser.add_argument('--padding', type=int, default=ATLAS_PADDING, help="transparent pixels between images")
+    args = parser.parse_args(argv)
+
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    images = sorted(sprite_images())
+    names = [assets.image_name(path) for path, size in images]
+    if len(set(names)) != len(names):
+        print("Every image must be loaded at exactly one size to be packed", file=sys.stderr)
+        return 1
+
+    placements = pack_shelves([size for path, size in images], args.sheet_size, args.padding)
+    sheet_count = max(sheet for sheet, x, y in placements) + 1
+
+    # Crop each sheet to the area actually used
+    extents = [[0, 0] for i in range(sheet_count)]
+    for (path, size), (sheet, x, y) in zip(images, placements):
+        extents[sheet][0] = max(extents[sheet][0], x + size[0])
+        extents[sheet][1] = max(extents[sheet][1], y + size[1])
+    sheets = [pygame.Surface(extent, pygame.SRCALPHA) for extent in extents]
+
+    index = {}
+    for (path, size), name, (sheet, x, y) in zip(images, names, placements):
+        image = pygame.image.load(path)
+        if image.get_size() != tuple(size):
+            image = pygame.transform.scale(image, size)
+        sheets[sheet].blit(image, (x, y))
+        index[name] = {'sheet': f"sheet_{sheet}.png", 'rect': [x, y, size[0], size[1]], 'source': path,
+                       'crc32': assets.source_digest(path)}  # Lets the game spot art edited since packing
+
+    atlas_dir = os.path.dirname(ATLAS_INDEX_PATH)
+    os.makedirs(atlas_dir, exist_ok=True)
+    for sheet, surface in enumerate(sheets):
+        pygame.image.save(surface, os.path.join(atlas_dir, f"sheet_{sheet}.png"))
+        print(f"sheet_{sheet}.png {surface.get_width()}x{surface.get_height()}")
+    with open(ATLAS_INDEX_PATH, 'w') as index_file:
+        json.dump({'images': index}, index_file, indent=2, sort_keys=True)
+    print(f"Packed {len(images)} images into {sheet_count} sheet(s), index at {ATLAS_INDEX_PATH}")
+
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
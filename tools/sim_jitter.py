@@ -0,0 +1,79 @@
+"""Simulation tick jitter with the serial loop versus the simulation thread (SIM_THREAD).
+
+Plays the same level headless in both modes while display.flip is made to stall
+now and then (as a slow present or a busy compositor would), and prints how
+evenly spaced the simulation ticks stayed. Run from the repository root:
+
+    python -m tools.sim_jitter [--level 1] [--seconds 5] [--stall-ms 30] [--stall-every 10]
+"""
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from src.constants import *
+
+def measure(threaded, level, seconds, stall_ms, stall_every):
+    """Play level for seconds in one mode and return tick_jitter.summary()"""
+    from src.game import Game
+    from src.simulation import tick_jitter
+    from src.scheduler import run_frames
+
+    game = Game()
+    game.load_game_assets()
+    game.current_level = level
+    game.initialize_game()
+    game.player.credits = 10 ** 9  # Keep the player alive for the whole run
+    game.threaded_simulation = threaded
+
+    flip = pygame.display.flip
+    frames = [0]
+    deadline = time.perf_counter() + seconds
+
+    def stalling_flip():
+        frames[0] += 1
+        if stall_every and frames[0] % stall_every == 0:
+            time.sleep(stall_ms / 1000)
+        flip()
+        if time.perf_counter() >= deadline:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    pygame.display.flip = stalling_flip
+    try:
+        tick_jitter.intervals.clear()
+        tick_jitter.reset()
+        if threaded:
+            run_frames(game.threaded_loop(), game.clock)
+        else:
+            run_frames(game.serial_loop(), game.clock)
+    finally:
+        pygame.display.flip = flip
+    return tick_jitter.summary()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--level', type=int, default=1, help="level to play")
+    parser.add_argument('--seconds', type=float, default=5.0, help="play time per mode")
+    parser.add_argument('--stall-ms', type=float, default=30.0, help="length of each flip stall")
+    parser.add_argument('--stall-every', type=int, default=10, help="stall every Nth frame (0 = never)")
+    args = parser.parse_args(argv)
+
+    print(f"{'mode':<10} {'ticks':>6} {'mean ms':>8} {'stdev ms':>9} {'p99 ms':>7} {'max ms':>7} {'late':>5}")
+    for threaded in (False, True):
+        summary = measure(threaded, args.level, args.seconds, args.stall_ms, args.stall_every)
+        mode = "threaded" if threaded else "serial"
+        if summary is None:
+            print(f"{mode:<10} (no ticks)")
+            continue
+        print(f"{mode:<10} {summary['ticks']:>6} {summary['mean_ms']:>8.2f} {summary['stdev_ms']:>9.2f} "
+              f"{summary['p99_ms']:>7.2f} {summary['max_ms']:>7.2f} {summary['late_ticks']:>5}")
+
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""Soak test: the autopilot plays every level over and over, unattended.
+
+Runs whole sessions (menu, four levels, game over or victory screen, menu, ...)
+with src/autopilot.py at the controls and logs frame time percentiles, resident
+memory and live entity objects whenever a level ends, plus their growth since
+the first time that level ended. Headless by default (dummy SDL drivers); pass
+--windowed to watch. Run from the repository root:
+
+    python -m tools.soak [--hours 4] [--windowed] [--threaded] [--diagnostics]
+"""
+import os
+import sys
+import argparse
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--hours', type=float, default=1.0, help="soak time")
+    parser.add_argument('--windowed', action='store_true', help="open a real window (default: dummy video and audio drivers)")
+    parser.add_argument('--threaded', action='store_true', help="run the simulation on its own thread (SIM_THREAD)")
+    parser.add_argument('--diagnostics', action='store_true', help="log an entity and surface memory sample every second")
+    args = parser.parse_args(argv)
+
+    if not args.windowed:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    from src.game import Game
+    from src.autopilot import Autopilot
+    from src.diagnostics import diagnostics
+
+    game = Game()
+    game.autopilot = Autopilot(args.hours * 3600)
+    game.threaded_simulation = args.threaded
+    diagnostics.enabled = args.diagnostics
+    game.run()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
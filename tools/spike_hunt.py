@@ -0,0 +1,153 @@
+"""Frame-spike hunter: short seeded sessions with random input, worst frames kept with their seed.
+
+Each session seeds the game's random module, starts a random level with random
+power-ups active and plays up to --frames frames of random key presses, one
+simulation tick and one render per frame, so a frame number is also a tick
+number. The worst frame of each session is ranked across all sessions; the top
+ones are printed with the seed and frame that produced them, and a reproduction
+(seed, level, power-ups and the input up to the spike frame) is written to
+spikes/ for each.
+
+--replay plays a reproduction again (--repeat times; the first run of a process
+starts with cold sprite caches, like the session that found the spike) and
+reports the time of the spike frame. --trace records the replay as a frame
+timeline (see src/trace.py). Run from the repository root:
+
+    python -m tools.spike_hunt [--sessions 50] [--frames 600] [--seed 1] [--top 5]
+    python -m tools.spike_hunt --replay spikes/spike_<seed>_<frame>.json [--repeat 3] [--trace]
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from src.constants import *
+
+KEYS = {'left': pygame.K_LEFT, 'right': pygame.K_RIGHT, 'space': pygame.K_SPACE}
+POWER_UPS = ['s3', 'load_balancer', 'auto_scaling']
+
+def random_session(seed, frames):
+    """The random start and input of a session: {seed, level, power_ups, input: [[frames, [key names]], ...]}"""
+    rng = random.Random(seed)  # Own generator: the game's random module is seeded separately
+    session = {
+        'seed': seed,
+        'level': rng.randint(1, MAX_LEVELS),
+        'power_ups': rng.sample(POWER_UPS, rng.randint(0, len(POWER_UPS))),
+        'input': []
+    }
+    remaining = frames
+    while remaining > 0:
+        length = min(remaining, rng.randint(1, 45))
+        session['input'].append([length, sorted(name for name in KEYS if rng.random() < 0.5)])
+        remaining -= length
+    return session
+
+def truncated(session, frames):
+    """Copy of session whose input stops after frames frames"""
+    result = dict(session, input=[])
+    remaining = frames
+    for length, names in session['input']:
+        if remaining <= 0:
+            break
+        result['input'].append([min(length, remaining), names])
+        remaining -= length
+    return result
+
+def play(game, session):
+    """Play a session; return its frame times in milliseconds (stops early at game over or level complete)"""
+    from src.autopilot import PilotKeys
+    from src.gc_policy import gc_policy
+
+    random.seed(session['seed'])
+    game.game_over = False
+    game.win = False
+    game.current_level = session['level']
+    game.initialize_game()
+    for power_up in session['power_ups']:
+        game.collect_power_up(power_up)
+    gc_policy.enter_gameplay()
+
+    frame_times = []
+    for length, names in session['input']:
+        keys = PilotKeys({KEYS[name] for name in names})
+        for i in range(length):
+            start = time.perf_counter()
+            game.input_keys = keys
+            game.simulation_tick()
+            game.draw()
+            frame_times.append((time.perf_counter() - start) * 1000)
+            if game.game_over or game.level_complete:
+                return frame_times
+    return frame_times
+
+def new_game():
+    from src.game import Game
+    game = Game()
+    game.load_game_assets()
+    return game
+
+def hunt(args):
+    game = new_game()
+    os.makedirs(args.output, exist_ok=True)
+    worst = []  # (ms, frame, session), one per session
+    for seed in range(args.seed, args.seed + args.sessions):
+        session = random_session(seed, args.frames)
+        frame_times = play(game, session)
+        frame = max(range(len(frame_times)), key=frame_times.__getitem__)
+        worst.append((frame_times[frame], frame, session))
+
+    worst.sort(key=lambda entry: -entry[0])
+    print(f"{'ms':>8} {'seed':>6} {'frame':>6} {'level':>6}  power-ups / reproduction")
+    for milliseconds, frame, session in worst[:args.top]:
+        path = os.path.join(args.output, f"spike_{session['seed']}_{frame}.json")
+        with open(path, 'w') as f:
+            json.dump(dict(truncated(session, frame + 1), spike_frame=frame, spike_ms=round(milliseconds, 3)), f, indent=1)
+        print(f"{milliseconds:>8.2f} {session['seed']:>6} {frame:>6} {session['level']:>6}  "
+              f"{','.join(session['power_ups']) or '-'} / {path}")
+
+def replay(args):
+    from src.trace import tracer
+    with open(args.replay) as f:
+        session = json.load(f)
+    game = new_game()
+    frame = session['spike_frame']
+    print(f"Seed {session['seed']}, level {session['level']}, spike of {session['spike_ms']:.2f} ms at frame {frame}")
+    for run in range(args.repeat):
+        if args.trace and run == 0:
+            tracer.start()
+        frame_times = play(game, session)
+        if args.trace and run == 0:
+            tracer.stop()
+        if len(frame_times) <= frame:
+            print(f"run {run + 1}: ended after {len(frame_times)} frames, before the spike frame (not deterministic?)")
+            continue
+        slowest = max(range(len(frame_times)), key=frame_times.__getitem__)
+        print(f"run {run + 1}: spike frame {frame_times[frame]:.2f} ms, slowest frame {slowest} at {frame_times[slowest]:.2f} ms")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=50, help="sessions to play")
+    parser.add_argument('--frames', type=int, default=600, help="longest session, in frames (ticks)")
+    parser.add_argument('--seed', type=int, default=1, help="seed of the first session (the others follow on)")
+    parser.add_argument('--top', type=int, default=5, help="spikes reported and written as reproductions")
+    parser.add_argument('--output', default='spikes', help="where reproductions are written")
+    parser.add_argument('--replay', help="reproduction file to play again")
+    parser.add_argument('--repeat', type=int, default=3, help="replays of the reproduction")
+    parser.add_argument('--trace', action='store_true', help="record the first replay as a frame timeline")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        replay(args)
+    else:
+        hunt(args)
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
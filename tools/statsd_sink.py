@@ -0,0 +1,60 @@
+"""Local stand-in for a statsd server: receives the game's telemetry and prints it.
+
+Listens on the same address format as TELEMETRY_ADDRESS and prints each metric
+line as it arrives (or only a per-metric summary at exit with --summary).
+--delay makes the sink slow on purpose, to check that the game drops packets
+instead of waiting. Run from the repository root, then start the game with
+TELEMETRY = True:
+
+    python -m tools.statsd_sink [--address udp://127.0.0.1:8125] [--delay 0.5] [--summary]
+"""
+import os
+import sys
+import time
+import socket
+import argparse
+from src.constants import *
+from src.telemetry import parse_address
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--address', default=TELEMETRY_ADDRESS, help="udp://host:port or unix:///path")
+    parser.add_argument('--delay', type=float, default=0.0, help="seconds to stall after each packet")
+    parser.add_argument('--summary', action='store_true', help="print the last value of each metric at exit only")
+    args = parser.parse_args(argv)
+
+    family, address = parse_address(args.address)
+    sock = socket.socket(family, socket.SOCK_DGRAM)
+    if family == socket.AF_UNIX and os.path.exists(address):
+        os.unlink(address)
+    sock.bind(address)
+    print(f"Listening on {args.address}", flush=True)
+
+    packets = 0
+    latest = {}
+    try:
+        while True:
+            data = sock.recv(65536)
+            packets += 1
+            for line in data.decode(errors='replace').splitlines():
+                name, _, value = line.partition(':')
+                latest[name] = value
+                if not args.summary:
+                    print(line, flush=True)
+            if args.delay:
+                time.sleep(args.delay)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sock.close()
+        if family == socket.AF_UNIX:
+            os.unlink(address)
+
+    print(f"{packets} packets, {len(latest)} metrics")
+    if args.summary:
+        for name in sorted(latest):
+            print(f"{name}:{latest[name]}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())